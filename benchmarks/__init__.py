@@ -0,0 +1,7 @@
+# benchmarks/__init__.py
+
+# Scripts de medição de desempenho do núcleo de cálculo.
+# Execute a partir da raiz do repositório, por exemplo:
+#   python -m benchmarks.bench_ipc
+#   python -m benchmarks.bench_grafico
+#   python -m benchmarks.bench_nucleo --comparar benchmarks/resultados/<anterior>.json
@@ -0,0 +1,83 @@
+# benchmarks/bench_grafico.py
+"""
+Mede o tamanho do HTML e o tempo de geração do gráfico hidrostático
+(`gerar_grafico_hidrostatico`) nos modos completo (um traço por baliza e
+bordo, listas Python) e compacto (traços únicos, arrays tipados e nível de
+detalhe), para cascos sintéticos de densidade crescente. Uso:
+
+    python -m benchmarks.bench_grafico [--balizas 21 81 201] [--linhas 15 101]
+        [--calados 40] [--repeticoes 3] [--saida resultados/grafico.json]
+"""
+
+import argparse
+import datetime
+import json
+import numpy as np
+
+from src.core.interpolacao import Casco
+from src.core.calculos_hidrostaticos import CalculadoraHidrostatica
+from src.core.visualizacao import gerar_grafico_hidrostatico
+from .cascos_sinteticos import CASCOS_SINTETICOS
+from .utilitarios import cronometrar, commit_atual
+
+MODOS = {'completo': False, 'compacto': True}
+
+
+def medir_grafico(tabela_de_cotas_df, n_calados: int, repeticoes: int) -> dict:
+    """
+    Mede os dois modos do gráfico para uma tabela de cotas.
+
+    Returns:
+        dict: Por modo, o tempo (s) e o tamanho do HTML (bytes).
+    """
+    _, casco = cronometrar(lambda: Casco(tabela_de_cotas_df, metodo='pchip'), 1)
+    z = tabela_de_cotas_df['Z']
+    calados = np.linspace(z.min() + 0.02 * (z.max() - z.min()), z.max(), n_calados).tolist()
+    calculadora = CalculadoraHidrostatica(casco, 1.025, 'pchip', motor='vetorizado', executor='local')
+    _, resultados = cronometrar(lambda: calculadora.calcular_curvas(calados), 1)
+
+    medidas = {}
+    for modo, compacto in MODOS.items():
+        tempo, html = cronometrar(lambda: gerar_grafico_hidrostatico(resultados, casco, compacto=compacto), repeticoes)
+        medidas[modo] = {'tempo_s': tempo, 'bytes': len(html.encode('utf-8'))}
+    return medidas
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Tamanho e tempo de geração do gráfico hidrostático.')
+    parser.add_argument('--balizas', type=int, nargs='+', default=[21, 81, 201])
+    parser.add_argument('--linhas', type=int, nargs='+', default=[15, 101])
+    parser.add_argument('--calados', type=int, default=40)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--saida', default=None, help='Arquivo JSON opcional com as medidas.')
+    args = parser.parse_args()
+
+    entradas = []
+    print(f"{'casco':>14}{'balizas':>9}{'pontos':>9}{'completo (kB)':>16}{'compacto (kB)':>16}"
+          f"{'completo (ms)':>16}{'compacto (ms)':>16}")
+    for nome, gerador in CASCOS_SINTETICOS.items():
+        for n_balizas in args.balizas:
+            for n_linhas in args.linhas:
+                tabela = gerador(n_balizas, n_linhas)
+                medidas = medir_grafico(tabela, args.calados, args.repeticoes)
+                entradas.append({'casco': nome, 'n_balizas': n_balizas, 'n_linhas': n_linhas,
+                                 'n_pontos': len(tabela), 'medidas': medidas})
+                completo, compacto = medidas['completo'], medidas['compacto']
+                print(f"{nome:>14}{n_balizas:>9}{len(tabela):>9}"
+                      f"{completo['bytes'] / 1024:>16.1f}{compacto['bytes'] / 1024:>16.1f}"
+                      f"{completo['tempo_s'] * 1000:>16.1f}{compacto['tempo_s'] * 1000:>16.1f}", flush=True)
+
+    if args.saida:
+        relatorio = {
+            'data': datetime.datetime.now().isoformat(timespec='seconds'),
+            'commit': commit_atual(),
+            'parametros': {'calados': args.calados, 'repeticoes': args.repeticoes},
+            'resultados': entradas,
+        }
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+        print(f"\nResultados gravados em {args.saida}")
+
+
+if __name__ == '__main__':
+    main()
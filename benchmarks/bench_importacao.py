@@ -0,0 +1,185 @@
+# benchmarks/bench_importacao.py
+"""
+Mede o custo de inicialização com `python -X importtime`, em processos
+novos: a partida a frio da aplicação (`create_app`), a importação do núcleo
+de cálculo feita pelos workers e a latência de um worker do pool criado com
+'spawn' até o primeiro lote calculado. Compara cada medida com um orçamento
+e verifica que as bibliotecas pesadas não são carregadas onde não são
+usadas; termina com código 1 se algum limite for excedido. Uso:
+
+    python -m benchmarks.bench_importacao [--repeticoes 5] [--saida resultados/importacao.json]
+        [--orcamento-app 0.4] [--orcamento-worker 0.15] [--orcamento-spawn 0.4]
+"""
+
+# Só a biblioteca padrão no topo: o worker criado com 'spawn' reimporta este
+# módulo, e qualquer importação aqui entraria na latência medida
+import argparse
+import datetime
+import json
+import os
+import subprocess
+import sys
+import time
+
+RAIZ_REPOSITORIO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Bibliotecas que não devem ser carregadas em cada cenário
+MODULOS_PESADOS = ('pandas', 'scipy', 'plotly', 'pyarrow', 'flask', 'sqlalchemy')
+CENARIOS = {
+    'app': {
+        'descricao': 'create_app (partida a frio)',
+        'codigo': 'from src import create_app\ncreate_app()',
+        'proibidos': ('pandas', 'scipy', 'plotly', 'pyarrow'),
+    },
+    'worker': {
+        'descricao': 'núcleo de cálculo dos workers',
+        'codigo': 'import src.core.pool_calculo\nfrom src.core.calculos_hidrostaticos import calcular_lote_de_calados',
+        'proibidos': ('pandas', 'scipy', 'plotly', 'pyarrow', 'flask', 'sqlalchemy'),
+    },
+}
+# Orçamentos padrão (s), com folga sobre as medidas numa máquina de 1 CPU
+ORCAMENTOS_PADRAO = {'app': 0.40, 'worker': 0.15, 'spawn': 0.40}
+
+_CODIGO_FILHO = """
+import json, sys, time
+inicio = time.perf_counter()
+{codigo}
+duracao = time.perf_counter() - inicio
+print(json.dumps({{'tempo_s': duracao, 'modulos': sorted(m for m in {modulos!r} if m in sys.modules)}}))
+"""
+
+
+def _ler_importtime(saida_erro: str) -> tuple[float, list]:
+    """
+    Soma os tempos próprios das linhas do `-X importtime` e lista os pacotes
+    de primeiro nível com o maior tempo acumulado.
+
+    Returns:
+        tuple: Tempo total de importação (s) e [(pacote, tempo acumulado em s), ...].
+    """
+    total_us = 0
+    primeiro_nivel = []
+    for linha in saida_erro.splitlines():
+        if not linha.startswith('import time:') or 'self [us]' in linha:
+            continue
+        proprio, acumulado, nome = linha[len('import time:'):].split('|', 2)
+        total_us += int(proprio)
+        # O nome vem recuado conforme a profundidade da importação
+        if len(nome) - len(nome.lstrip()) == 1:
+            primeiro_nivel.append((nome.strip(), int(acumulado) / 1e6))
+    primeiro_nivel.sort(key=lambda item: -item[1])
+    return total_us / 1e6, primeiro_nivel
+
+
+def medir_cenario(nome: str, repeticoes: int) -> dict:
+    """
+    Executa o cenário em `repeticoes` processos novos e guarda a melhor medida.
+
+    Returns:
+        dict: Tempo de parede (s), tempo de importação somado pelo importtime (s),
+              maiores pacotes e bibliotecas pesadas carregadas.
+    """
+    cenario = CENARIOS[nome]
+    codigo = _CODIGO_FILHO.format(codigo=cenario['codigo'], modulos=MODULOS_PESADOS)
+    ambiente = {**os.environ, 'PYTHONPATH': RAIZ_REPOSITORIO}
+    melhor = None
+    for _ in range(repeticoes):
+        processo = subprocess.run([sys.executable, '-X', 'importtime', '-c', codigo], cwd=RAIZ_REPOSITORIO,
+                                  env=ambiente, capture_output=True, text=True, check=True)
+        resultado = json.loads(processo.stdout.strip().splitlines()[-1])
+        importacao_s, pacotes = _ler_importtime(processo.stderr)
+        if melhor is None or resultado['tempo_s'] < melhor['tempo_s']:
+            melhor = {
+                'tempo_s': resultado['tempo_s'],
+                'importacao_s': importacao_s,
+                'maiores_pacotes': pacotes[:5],
+                'modulos_pesados': resultado['modulos'],
+            }
+    return melhor
+
+
+def _silenciar_worker():
+    """Descarta as mensagens do núcleo impressas pelo worker."""
+    sys.stdout = open(os.devnull, 'w')
+
+
+def medir_spawn(repeticoes: int) -> dict:
+    """
+    Latência de um worker novo do pool ('spawn', como no macOS e no Windows):
+    da criação do pool até o primeiro lote de calados calculado.
+
+    Returns:
+        dict: Melhor tempo (s) entre as repetições.
+    """
+    import concurrent.futures
+    import contextlib
+    import io
+    import multiprocessing
+    from src.core.ingestao import carregar_cotas, caminho_cotas_binarias
+    from src.core.interpolacao import Casco
+    from src.core.pool_calculo import publicar_casco, calcular_lote
+
+    caminho = os.path.join(RAIZ_REPOSITORIO, 'uploads', 'TABELA_DE_COTAS.csv')
+    with contextlib.redirect_stdout(io.StringIO()):
+        casco = Casco(carregar_cotas(caminho), 'pchip', arquivo_cotas=caminho_cotas_binarias(caminho))
+    descritor = publicar_casco(casco)
+
+    tempos = []
+    contexto = multiprocessing.get_context('spawn')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=contexto,
+                                                    initializer=_silenciar_worker) as executor:
+            executor.submit(calcular_lote, (descritor, [1.0, 2.0], 1.025, 'pchip', 'vetorizado')).result()
+            tempos.append(time.perf_counter() - inicio)
+    return {'tempo_s': min(tempos)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Tempo de importação e de partida da aplicação e dos workers.')
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--saida', default=None, help='Arquivo JSON opcional com as medidas.')
+    for nome, orcamento in ORCAMENTOS_PADRAO.items():
+        parser.add_argument(f'--orcamento-{nome}', type=float, default=orcamento, help=f'Limite (s) de "{nome}".')
+    args = parser.parse_args()
+
+    medidas = {nome: medir_cenario(nome, args.repeticoes) for nome in CENARIOS}
+    medidas['spawn'] = medir_spawn(args.repeticoes)
+
+    falhas = []
+    print(f"{'cenário':>8}{'tempo (ms)':>12}{'importação (ms)':>17}{'orçamento (ms)':>16}  maiores pacotes")
+    for nome, medida in medidas.items():
+        orcamento = getattr(args, f'orcamento_{nome}')
+        medida['orcamento_s'] = orcamento
+        importacao = f"{medida['importacao_s'] * 1000:>17.1f}" if 'importacao_s' in medida else f"{'-':>17}"
+        pacotes = ', '.join(f"{pacote} {tempo * 1000:.0f}" for pacote, tempo in medida.get('maiores_pacotes', [])[:3])
+        print(f"{nome:>8}{medida['tempo_s'] * 1000:>12.1f}{importacao}{orcamento * 1000:>16.0f}  {pacotes}")
+
+        if medida['tempo_s'] > orcamento:
+            falhas.append(f"{nome}: {medida['tempo_s'] * 1000:.0f} ms acima do orçamento de {orcamento * 1000:.0f} ms")
+        proibidos = [m for m in medida.get('modulos_pesados', []) if m in CENARIOS.get(nome, {}).get('proibidos', ())]
+        if proibidos:
+            falhas.append(f"{nome}: carregou {', '.join(proibidos)} ({CENARIOS[nome]['descricao']})")
+
+    if args.saida:
+        from .utilitarios import commit_atual
+
+        relatorio = {
+            'data': datetime.datetime.now().isoformat(timespec='seconds'),
+            'commit': commit_atual(),
+            'python': sys.version.split()[0],
+            'parametros': {'repeticoes': args.repeticoes},
+            'resultados': medidas,
+        }
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+        print(f"\nResultados gravados em {args.saida}")
+
+    if falhas:
+        print('\nOrçamento excedido:\n  ' + '\n  '.join(falhas))
+        sys.exit(1)
+    print('\nTodos os cenários dentro do orçamento.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+# benchmarks/bench_ipc.py
+"""
+Mede o custo de comunicação entre processos (IPC) do cálculo paralelo.
+
+- Antes: um ProcessPoolExecutor por requisição e uma tarefa por calado,
+  cada uma levando o `Casco` inteiro (DataFrame + interpoladores) em pickle.
+- Depois: pool persistente, cotas publicadas uma vez em memória compartilhada
+  e tarefas com apenas o descritor do casco e um lote de calados.
+
+As tarefas de medição não calculam nada (apenas recebem o casco), isolando o
+custo de serialização e despacho. Uso:
+
+    python -m benchmarks.bench_ipc [n_balizas] [n_calados]
+"""
+
+import concurrent.futures
+import contextlib
+import io
+import os
+import pickle
+import sys
+import time
+import numpy as np
+
+from src.core.interpolacao import Casco
+from src.core.calculos_hidrostaticos import calcular_tamanho_lote
+from src.core.pool_calculo import publicar_casco, obter_executor, obter_casco_worker
+from .utilitarios import carregar_tabela_exemplo, densificar_tabela
+
+
+def _tarefa_antiga(args):
+    """Recebe (casco, calado, densidade, metodo) como no caminho original e não calcula nada."""
+    casco, calado, densidade, metodo_interp = args
+    return calado
+
+
+def _tarefa_nova(args):
+    """Recebe (descritor, lote, densidade, metodo, motor) e obtém o casco do worker (reconstruído uma vez)."""
+    descritor, calados, densidade, metodo_interp, motor = args
+    obter_casco_worker(descritor)
+    return list(calados)
+
+
+def medir_antes(casco: Casco, calados: list) -> dict:
+    tarefas = [(casco, calado, 1.025, casco.metodo) for calado in calados]
+    inicio = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        list(executor.map(_tarefa_antiga, tarefas))
+    return {
+        'tempo_s': time.perf_counter() - inicio,
+        'bytes_por_tarefa': len(pickle.dumps(tarefas[0])),
+        'bytes_total': sum(len(pickle.dumps(t)) for t in tarefas),
+        'n_tarefas': len(tarefas),
+    }
+
+
+def medir_depois(casco: Casco, calados: list, repeticoes: int = 3) -> dict:
+    tamanho_lote = calcular_tamanho_lote('quad', len(calados), os.cpu_count() or 1)
+    executor = obter_executor()
+
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        descritor = publicar_casco(casco)
+        tarefas = [(descritor, calados[i:i + tamanho_lote], 1.025, casco.metodo, 'quad')
+                   for i in range(0, len(calados), tamanho_lote)]
+        list(executor.map(_tarefa_nova, tarefas))
+        tempos.append(time.perf_counter() - inicio)
+
+    return {
+        'tempo_primeira_s': tempos[0],
+        'tempo_repeticao_s': min(tempos[1:]) if len(tempos) > 1 else tempos[0],
+        'bytes_por_tarefa': len(pickle.dumps(tarefas[0])),
+        'bytes_total': sum(len(pickle.dumps(t)) for t in tarefas),
+        'n_tarefas': len(tarefas),
+    }
+
+
+def main(n_balizas: int = 200, n_calados: int = 400):
+    with contextlib.redirect_stdout(io.StringIO()):
+        casco = Casco(densificar_tabela(carregar_tabela_exemplo(), n_balizas), metodo='pchip')
+    calados = np.linspace(0.1, 4.0, n_calados).tolist()
+
+    print(f"Casco com {n_balizas} balizas, {n_calados} calados, {os.cpu_count()} CPUs")
+    antes = medir_antes(casco, calados)
+    with contextlib.redirect_stdout(io.StringIO()):
+        depois = medir_depois(casco, calados)
+
+    print(f"{'':28}{'antes':>14}{'depois':>14}")
+    print(f"{'tarefas':28}{antes['n_tarefas']:>14}{depois['n_tarefas']:>14}")
+    print(f"{'bytes por tarefa':28}{antes['bytes_por_tarefa']:>14,}{depois['bytes_por_tarefa']:>14,}")
+    print(f"{'bytes serializados':28}{antes['bytes_total']:>14,}{depois['bytes_total']:>14,}")
+    print(f"{'tempo (1ª requisição) [s]':28}{antes['tempo_s']:>14.3f}{depois['tempo_primeira_s']:>14.3f}")
+    print(f"{'tempo (repetição) [s]':28}{antes['tempo_s']:>14.3f}{depois['tempo_repeticao_s']:>14.3f}")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,166 @@
+# benchmarks/bench_nucleo.py
+"""
+Mede o desempenho do núcleo de cálculo hidrostático em cascos sintéticos
+(Wigley, semelhante à Série 60 e balsa com espelho) e na tabela de cotas
+distribuída com o repositório.
+
+Para cada casco e densidade (balizas × pontos por baliza) são medidos:
+
+- construção do `Casco`;
+- `PropriedadesHidrostaticas` em um único calado;
+- `CalculadoraHidrostatica.calcular_curvas` para cada motor ('quad' e
+  'vetorizado') e executor ('local' = sequencial, 'threads', 'processos');
+- geração do gráfico (`gerar_grafico_hidrostatico`).
+
+Cada medida é o menor tempo entre as repetições. O resultado é gravado em
+JSON (com o commit atual) em `benchmarks/resultados/`, e um arquivo anterior
+pode ser informado para comparar medida a medida. Uso:
+
+    python -m benchmarks.bench_nucleo [--balizas 21 81] [--linhas 15 41]
+        [--calados 40] [--repeticoes 3] [--comparar resultados/anterior.json]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import numpy as np
+import pandas as pd
+
+from src.core.interpolacao import Casco
+from src.core.calculos_hidrostaticos import PropriedadesHidrostaticas, CalculadoraHidrostatica
+from src.core.visualizacao import gerar_grafico_hidrostatico
+from .cascos_sinteticos import CASCOS_SINTETICOS
+from .utilitarios import RAIZ_REPOSITORIO, carregar_tabela_exemplo, cronometrar, commit_atual
+
+PASTA_RESULTADOS = os.path.join(RAIZ_REPOSITORIO, 'benchmarks', 'resultados')
+MOTORES = ('quad', 'vetorizado')
+EXECUTORES = ('local', 'threads', 'processos')
+# Razão (tempo atual / tempo anterior) a partir da qual uma medida é marcada como regressão
+LIMITE_REGRESSAO = 1.2
+
+
+def medir_casco(tabela_de_cotas_df: pd.DataFrame, n_calados: int, repeticoes: int,
+                metodo: str = 'pchip', densidade: float = 1.025) -> dict:
+    """
+    Mede todas as etapas para uma tabela de cotas.
+
+    Returns:
+        dict: Tempos em segundos, por etapa.
+    """
+    medidas = {}
+    medidas['construcao_casco'], casco = cronometrar(lambda: Casco(tabela_de_cotas_df, metodo=metodo), repeticoes)
+
+    z = tabela_de_cotas_df['Z']
+    calados = np.linspace(z.min() + 0.02 * (z.max() - z.min()), z.max(), n_calados).tolist()
+    calado_medio = calados[len(calados) // 2]
+    medidas['propriedades_um_calado'], _ = cronometrar(
+        lambda: PropriedadesHidrostaticas(casco, calado_medio, densidade, metodo), repeticoes)
+
+    resultados = None
+    for motor in MOTORES:
+        for executor in EXECUTORES:
+            calculadora = CalculadoraHidrostatica(casco, densidade, metodo, motor=motor, executor=executor)
+            # Uma chamada fora da medição para subir os pools e publicar o casco
+            cronometrar(lambda: calculadora.calcular_curvas(calados[:2]), 1)
+            medidas[f'curvas_{motor}_{executor}'], resultados = cronometrar(
+                lambda: calculadora.calcular_curvas(calados), repeticoes)
+
+    medidas['grafico'], _ = cronometrar(lambda: gerar_grafico_hidrostatico(resultados, casco), repeticoes)
+    return medidas
+
+
+def executar(balizas: list, linhas: list, n_calados: int, repeticoes: int) -> dict:
+    """
+    Mede os cascos sintéticos em todas as densidades e a tabela de exemplo.
+
+    Returns:
+        dict: Ambiente, parâmetros e uma entrada por casco medido.
+    """
+    casos = [('exemplo', None, None, carregar_tabela_exemplo())]
+    for nome, gerador in CASCOS_SINTETICOS.items():
+        for n_balizas in balizas:
+            for n_linhas in linhas:
+                casos.append((nome, n_balizas, n_linhas, gerador(n_balizas, n_linhas)))
+
+    entradas = []
+    for nome, n_balizas, n_linhas, tabela in casos:
+        print(f"Medindo {nome} ({tabela['X'].nunique()} balizas, {len(tabela)} pontos)...", flush=True)
+        entradas.append({
+            'casco': nome,
+            'n_balizas': int(tabela['X'].nunique()),
+            'n_linhas': n_linhas,
+            'n_pontos': len(tabela),
+            'medidas': medir_casco(tabela, n_calados, repeticoes),
+        })
+
+    return {
+        'data': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': commit_atual(),
+        'ambiente': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'cpus': os.cpu_count(),
+            'plataforma': platform.platform(),
+        },
+        'parametros': {'calados': n_calados, 'repeticoes': repeticoes},
+        'resultados': entradas,
+    }
+
+
+def _chave(entrada: dict) -> tuple:
+    return entrada['casco'], entrada['n_balizas'], entrada['n_linhas']
+
+
+def imprimir_resultados(relatorio: dict, anterior: dict | None = None):
+    """Imprime uma tabela com as medidas e, se houver, a razão em relação ao relatório anterior."""
+    anteriores = {_chave(e): e['medidas'] for e in (anterior or {}).get('resultados', [])}
+    regressoes = 0
+    for entrada in relatorio['resultados']:
+        print(f"\n{entrada['casco']} — {entrada['n_balizas']} balizas, {entrada['n_pontos']} pontos")
+        referencia = anteriores.get(_chave(entrada), {})
+        for medida, tempo in entrada['medidas'].items():
+            linha = f"  {medida:28}{tempo * 1000:>12.2f} ms"
+            if medida in referencia and referencia[medida] > 0:
+                razao = tempo / referencia[medida]
+                marca = '  <-- regressão' if razao > LIMITE_REGRESSAO else ''
+                regressoes += razao > LIMITE_REGRESSAO
+                linha += f"{razao:>10.2f}x{marca}"
+            print(linha)
+    if anterior is not None:
+        print(f"\nComparado com {anterior.get('commit')} ({anterior.get('data')}): {regressoes} regressão(ões) "
+              f"acima de {LIMITE_REGRESSAO:.1f}x.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Medições de desempenho do núcleo hidrostático.')
+    parser.add_argument('--balizas', type=int, nargs='+', default=[21, 81], help='Números de balizas dos cascos sintéticos.')
+    parser.add_argument('--linhas', type=int, nargs='+', default=[15, 41], help='Pontos por baliza dos cascos sintéticos.')
+    parser.add_argument('--calados', type=int, default=40, help='Calados da curva completa.')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--saida', default=None, help='Arquivo JSON de saída (padrão: benchmarks/resultados/<commit>-<data>.json).')
+    parser.add_argument('--comparar', default=None, help='Relatório JSON anterior para comparação.')
+    args = parser.parse_args()
+
+    relatorio = executar(args.balizas, args.linhas, args.calados, args.repeticoes)
+
+    saida = args.saida
+    if saida is None:
+        os.makedirs(PASTA_RESULTADOS, exist_ok=True)
+        carimbo = relatorio['data'].replace(':', '').replace('-', '')
+        saida = os.path.join(PASTA_RESULTADOS, f"bench_nucleo-{relatorio['commit'] or 'sem-commit'}-{carimbo}.json")
+    with open(saida, 'w', encoding='utf-8') as arquivo:
+        json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+
+    anterior = None
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as arquivo:
+            anterior = json.load(arquivo)
+    imprimir_resultados(relatorio, anterior)
+    print(f"\nResultados gravados em {saida}")
+
+
+if __name__ == '__main__':
+    main()
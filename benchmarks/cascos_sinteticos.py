@@ -0,0 +1,104 @@
+# benchmarks/cascos_sinteticos.py
+"""
+Geradores paramétricos de tabelas de cotas para as medições de desempenho.
+
+Todos retornam um DataFrame com colunas 'X', 'Y', 'Z' no mesmo formato do
+arquivo enviado pelo usuário (meia-boca Y por baliza X e altura Z, com a
+quilha em z=0), com `n_balizas` balizas igualmente espaçadas e `n_linhas`
+pontos por baliza.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _montar_tabela(posicoes: np.ndarray, alturas_por_baliza: list, meias_bocas_por_baliza: list) -> pd.DataFrame:
+    """Concatena as balizas (X, Y, Z) numa tabela de cotas."""
+    linhas = [
+        np.column_stack([np.full(len(z), x), y, z])
+        for x, y, z in zip(posicoes, meias_bocas_por_baliza, alturas_por_baliza)
+    ]
+    return pd.DataFrame(np.vstack(linhas), columns=['X', 'Y', 'Z'])
+
+
+def gerar_wigley(n_balizas: int = 21, n_linhas: int = 15, comprimento: float = 20.0, boca: float = 2.0,
+                 calado: float = 1.25, pontal: float = 2.0) -> pd.DataFrame:
+    """
+    Casco de Wigley: y = B/2 · (1 - (2ξ)²) · (1 - ζ²), com ξ = x/L - 1/2 e
+    ζ = (T - z)/T abaixo da linha d'água de projeto; acima dela o costado é vertical.
+    """
+    posicoes = np.linspace(0.0, comprimento, n_balizas)
+    z = np.linspace(0.0, pontal, n_linhas)
+    zeta = np.clip((calado - z) / calado, 0.0, 1.0)
+    meias_bocas = []
+    for x in posicoes:
+        xi = x / comprimento - 0.5
+        meias_bocas.append(boca / 2 * (1 - (2 * xi) ** 2) * (1 - zeta ** 2))
+    return _montar_tabela(posicoes, [z] * n_balizas, meias_bocas)
+
+
+def gerar_serie_60(n_balizas: int = 21, n_linhas: int = 15, comprimento: float = 60.0, boca: float = 8.6,
+                   calado: float = 3.4, pontal: float = 5.5, corpo_paralelo: float = 0.2) -> pd.DataFrame:
+    """
+    Casco semelhante aos da Série 60 (CB ≈ 0,6): corpo paralelo a meia-nau,
+    proa mais fina que a popa e seções em superelipse que vão de cheias a
+    meia-nau (bojo pequeno) a em "V" nas extremidades.
+
+    Não reproduz as cotas oficiais da série; serve para gerar formas
+    realistas com qualquer densidade de balizas e linhas d'água.
+    """
+    posicoes = np.linspace(0.0, comprimento, n_balizas)
+    z = np.linspace(0.0, pontal, n_linhas)
+    meias_bocas = []
+    for x in posicoes:
+        xi = 2 * x / comprimento - 1  # -1 na popa, +1 na proa
+        fora_do_corpo = np.clip((abs(xi) - corpo_paralelo) / (1 - corpo_paralelo), 0.0, 1.0)
+        expoente_longitudinal = 1.6 if xi > 0 else 2.2  # proa mais fina que a popa
+        fator = 1 - fora_do_corpo ** expoente_longitudinal
+        # Expoente da superelipse: seção cheia (n≈6) a meia-nau, triangular (n≈1.2) nas pontas
+        n = 1.2 + 4.8 * (1 - fora_do_corpo) ** 2
+        altura_relativa = np.clip(z / calado, 0.0, 1.0)
+        forma = (1 - (1 - altura_relativa) ** n) ** (1 / n)
+        # Acima da linha d'água de projeto o costado abre levemente (alargamento)
+        alargamento = 1 + 0.05 * np.clip((z - calado) / (pontal - calado), 0.0, 1.0)
+        meias_bocas.append(np.minimum(boca / 2 * fator * forma * alargamento, boca / 2 * 1.05))
+    return _montar_tabela(posicoes, [z] * n_balizas, meias_bocas)
+
+
+def gerar_balsa_espelho(n_balizas: int = 21, n_linhas: int = 15, comprimento: float = 30.0, boca: float = 9.0,
+                        pontal: float = 2.5, altura_espelho: float = 0.6, rampa_re: float = 0.15,
+                        rampa_vante: float = 0.2) -> pd.DataFrame:
+    """
+    Balsa de fundo chato com popa de espelho e rampas de fundo a ré e a vante.
+
+    O fundo sobe linearmente nas rampas (até `altura_espelho` na popa e até
+    o meio do pontal na proa); cada baliza começa no fundo local com a
+    meia-boca cheia, de modo que a baliza de ré tem área não nula quando o
+    espelho está imerso.
+    """
+    posicoes = np.linspace(0.0, comprimento, n_balizas)
+    alturas, meias_bocas = [], []
+    for x in posicoes:
+        fracao = x / comprimento
+        if fracao < rampa_re:
+            fundo = altura_espelho * (1 - fracao / rampa_re)
+        elif fracao > 1 - rampa_vante:
+            fundo = 0.5 * pontal * (fracao - (1 - rampa_vante)) / rampa_vante
+        else:
+            fundo = 0.0
+        z = np.linspace(fundo, pontal, n_linhas)
+        # Quina arredondada entre o fundo e o costado (raio de 5% da boca)
+        raio = 0.05 * boca
+        altura_quina = np.clip((z - fundo) / raio, 0.0, 1.0)
+        y = boca / 2 - raio * (1 - np.sqrt(1 - (1 - altura_quina) ** 2))
+        alturas.append(z)
+        meias_bocas.append(y)
+    return _montar_tabela(posicoes, alturas, meias_bocas)
+
+
+# Geradores disponíveis para as medições (nome -> função)
+CASCOS_SINTETICOS = {
+    'wigley': gerar_wigley,
+    'serie60': gerar_serie_60,
+    'balsa_espelho': gerar_balsa_espelho,
+}
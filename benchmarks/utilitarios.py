@@ -0,0 +1,70 @@
+# benchmarks/utilitarios.py
+
+import contextlib
+import io
+import os
+import subprocess
+import time
+import warnings
+import numpy as np
+import pandas as pd
+
+RAIZ_REPOSITORIO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CAMINHO_TABELA_EXEMPLO = os.path.join(RAIZ_REPOSITORIO, 'uploads', 'TABELA_DE_COTAS.csv')
+
+
+def cronometrar(funcao, repeticoes: int) -> tuple[float, object]:
+    """Executa `funcao` `repeticoes` vezes (sem as mensagens do núcleo) e retorna o menor tempo e o último resultado."""
+    tempos = []
+    resultado = None
+    for _ in range(repeticoes):
+        with contextlib.redirect_stdout(io.StringIO()), warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            inicio = time.perf_counter()
+            resultado = funcao()
+            tempos.append(time.perf_counter() - inicio)
+    return min(tempos), resultado
+
+
+def commit_atual() -> str | None:
+    """Hash curto do commit atual (None fora de um repositório git)."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ_REPOSITORIO,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def carregar_tabela_exemplo() -> pd.DataFrame:
+    """Carrega a tabela de cotas distribuída com o repositório."""
+    return pd.read_csv(CAMINHO_TABELA_EXEMPLO, header=None, names=['X', 'Y', 'Z'])
+
+
+def densificar_tabela(tabela_de_cotas_df: pd.DataFrame, n_balizas: int) -> pd.DataFrame:
+    """
+    Gera uma tabela com `n_balizas` balizas igualmente espaçadas, interpolando
+    ponto a ponto entre as balizas originais vizinhas (quando têm o mesmo
+    número de pontos) ou copiando a baliza mais próxima.
+
+    Args:
+        tabela_de_cotas_df (pd.DataFrame): Tabela com colunas 'X', 'Y', 'Z'.
+        n_balizas (int): Número de balizas da tabela densificada.
+
+    Returns:
+        pd.DataFrame: Nova tabela de cotas.
+    """
+    posicoes = sorted(tabela_de_cotas_df['X'].unique())
+    balizas = {x: tabela_de_cotas_df[tabela_de_cotas_df['X'] == x].sort_values('Z')[['Y', 'Z']].to_numpy()
+               for x in posicoes}
+
+    linhas = []
+    for x in np.linspace(posicoes[0], posicoes[-1], n_balizas):
+        i = min(np.searchsorted(posicoes, x, side='right') - 1, len(posicoes) - 2)
+        re, vante = balizas[posicoes[i]], balizas[posicoes[i + 1]]
+        peso = (x - posicoes[i]) / (posicoes[i + 1] - posicoes[i])
+        if len(re) == len(vante):
+            pontos = (1 - peso) * re + peso * vante
+        else:
+            pontos = re if peso < 0.5 else vante
+        linhas.extend((x, y, z) for y, z in pontos)
+    return pd.DataFrame(linhas, columns=['X', 'Y', 'Z'])
@@ -1,18 +1,35 @@
 # src/__init__.py
 
-from flask import Flask
-from flask_sqlalchemy import SQLAlchemy
-from flask_login import LoginManager
-from .extensions import db, login_manager
-from .models import User
+import os
 
 
 def create_app():
     """Constrói o core da aplicação."""
+    # Importados aqui, e não no topo do pacote: os workers do pool de cálculo
+    # importam `src.core` (e portanto `src`) e não precisam do Flask nem do SQLAlchemy
+    from flask import Flask
+    from .extensions import db, login_manager
+    from .models import User
+    from .comandos import registrar_comandos
+
     app = Flask(__name__)
 
     app.config['SECRET_KEY'] = 'uma-chave-secreta-muito-segura'
     app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///db.sqlite'
+    app.config['CACHE_CASCOS_LIMITE_BYTES'] = 256 * 1024 * 1024 # Memória máxima do cache de cascos
+    app.config['RESULTADOS_DB_PATH'] = os.path.join(app.instance_path, 'resultados.sqlite') # Armazém de resultados
+    app.config['RESULTADOS_MAX_LINHAS'] = 200_000
+    # Execução do cálculo hidrostático: 'auto', 'local', 'threads' ou 'processos';
+    # None em max_workers/tamanho_lote deixa a escolha para a calculadora.
+    app.config['HIDROSTATICA_EXECUTOR'] = 'auto'
+    app.config['HIDROSTATICA_MAX_WORKERS'] = None
+    app.config['HIDROSTATICA_TAMANHO_LOTE'] = None
+    app.config['HIDROSTATICA_MAX_CALADOS_ADAPTATIVO'] = 200 # Limite de calados do refinamento adaptativo
+    app.config['CRUZADAS_EXECUTOR'] = 'auto' # Distribuição dos ângulos de banda: 'auto', 'local', 'threads' ou 'processos'
+    # Tarefas de cálculo em segundo plano (fila em processo)
+    app.config['TAREFAS_MAX_SIMULTANEAS'] = 2
+    app.config['TAREFAS_MAX_POR_USUARIO'] = 2
+    app.config['TAREFAS_RETENCAO_S'] = 3600
 
     # Associa as instâncias importadas com a aplicação Flask
     db.init_app(app)
@@ -50,6 +67,9 @@ def create_app():
         app.register_blueprint(user_routes.user_bp)
         app.register_blueprint(vessel_routes.vessel_bp)
 
+        # Comandos de linha de comando (ex.: flask --app run calcular-frota)
+        registrar_comandos(app)
+
         # Cria as tabelas do banco de dados se não existirem
         db.create_all()
 
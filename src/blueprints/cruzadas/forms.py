@@ -0,0 +1,38 @@
+from flask_wtf import FlaskForm
+from wtforms import FloatField, SelectField, SubmitField, IntegerField
+from wtforms.validators import DataRequired, NumberRange, InputRequired
+
+class CrossCurvesCalculationForm(FlaskForm):
+    """Formulário para calcular as curvas cruzadas de estabilidade (KN)."""
+
+    # Este campo será populado dinamicamente na rota
+    vessel = SelectField('Selecione a Embarcação', coerce=int, validators=[DataRequired()])
+
+    desloc_min = FloatField('Deslocamento Mínimo (t)', validators=[InputRequired("Campo obrigatório."), NumberRange(min=0, message="O valor deve ser maior ou igual a 0.")])
+    desloc_max = FloatField('Deslocamento Máximo (t)', validators=[InputRequired("Campo obrigatório."), NumberRange(min=0, message="O valor deve ser maior ou igual a 0.")])
+    num_deslocamentos = IntegerField('Número de Deslocamentos', default=10, validators=[DataRequired(), NumberRange(min=2, max=500)])
+
+    angulo_max = FloatField('Ângulo Máximo de Banda (°)', default=90, validators=[InputRequired("Campo obrigatório."), NumberRange(min=0, max=90, message="O ângulo deve estar entre 0° e 90°.")])
+    inc_angulo = FloatField('Incremento de Ângulo (°)', default=10, validators=[DataRequired(), NumberRange(min=1, max=90)])
+
+    metodo_interp = SelectField(
+        'Método de Interpolação',
+        choices=[('linear', 'Linear'), ('pchip', 'PCHIP')],
+        default='linear',
+        validators=[DataRequired()]
+    )
+    densidade = FloatField('Densidade (t/m³)', default=1.025, validators=[DataRequired()])
+
+    submit = SubmitField('Calcular Curvas Cruzadas')
+
+    def validate(self, extra_validators=None):
+        # Primeiro, roda as validações padrão
+        if not super(CrossCurvesCalculationForm, self).validate(extra_validators):
+            return False
+
+        # --- Garante que desloc_max > desloc_min ---
+        if self.desloc_max.data <= self.desloc_min.data:
+            self.desloc_max.errors.append('O deslocamento máximo deve ser maior que o mínimo.')
+            return False
+
+        return True
@@ -1,7 +1,14 @@
 # src/blueprints/cruzadas/routes.py
 
-from flask import Blueprint, render_template
-from flask_login import login_required # Garante que o usuário deve estar logado
+import os
+import numpy as np
+from flask import Blueprint, render_template, flash, current_app, request
+from flask_login import login_required, current_user # Garante que o usuário deve estar logado
+from .forms import CrossCurvesCalculationForm
+from src.models import Vessel
+from src.core.cache_casco import cache_cascos
+from src.core.curvas_cruzadas import CalculadoraCurvasCruzadas
+from src.core.visualizacao import gerar_grafico_curvas_cruzadas
 
 # 1. Cria o Blueprint
 cruzadas_bp = Blueprint(
@@ -11,13 +18,60 @@ cruzadas_bp = Blueprint(
 )
 
 # 2. Define a rota principal deste blueprint
-@cruzadas_bp.route('/')
+@cruzadas_bp.route('/', methods=['GET', 'POST'])
 @login_required # Protege a rota
 def index():
     """
-    Exibe a página de cálculo de curvas cruzadas.
+    Exibe a página de cálculo de curvas cruzadas e calcula KN(banda, deslocamento)
+    para a embarcação escolhida.
     """
-    # Como você mencionou que os templates serão os mesmos, podemos reutilizá-los!
-    # Apenas passamos dados diferentes para o mesmo template.
     page_title = "Cálculo de Curvas Cruzadas"
-    return render_template('calculos.html', title=page_title)
\ No newline at end of file
+    form = CrossCurvesCalculationForm()
+
+    user_vessels = Vessel.query.filter_by(user_id=current_user.id).order_by(Vessel.name).all()
+    form.vessel.choices = [(v.id, v.name) for v in user_vessels]
+
+    plot_html = None
+    resultados_html = None
+
+    if form.validate_on_submit():
+        try:
+            selected_vessel = Vessel.query.get(form.vessel.data)
+            filepath = os.path.join(current_app.root_path, '..', 'uploads', selected_vessel.tabela_cotas_filename)
+            casco = cache_cascos.obter(filepath, form.metodo_interp.data)
+
+            deslocamentos = np.linspace(form.desloc_min.data, form.desloc_max.data, form.num_deslocamentos.data).tolist()
+            angulos = np.arange(0.0, form.angulo_max.data + 1e-9, form.inc_angulo.data).tolist()
+
+            calculadora = CalculadoraCurvasCruzadas(
+                casco, form.densidade.data,
+                executor=current_app.config['CRUZADAS_EXECUTOR'],
+                max_workers=current_app.config['HIDROSTATICA_MAX_WORKERS'],
+            )
+            resultados_df = calculadora.calcular(deslocamentos, angulos)
+            print(resultados_df.to_string())
+
+            resultados_html = resultados_df.to_html(
+                classes=['table', 'table-striped', 'table-hover'],
+                index=False,
+                float_format='{:.4f}'.format,
+                na_rep='—',
+                table_id='tabela-resultados'
+            )
+            plot_html = gerar_grafico_curvas_cruzadas(resultados_df)
+
+            if resultados_df.filter(like='KN ').isna().any().any():
+                flash("Alguns deslocamentos excedem o volume total do casco e ficaram sem KN.", 'warning')
+            else:
+                flash(f"Curvas cruzadas de '{selected_vessel.name}' calculadas!", 'success')
+
+        except Exception as e:
+            flash(f"Ocorreu um erro ao processar os dados: {e}", 'error')
+
+    elif request.method == 'POST':
+        for field, errors in form.errors.items():
+            for error in errors:
+                flash(error, category='error')
+
+    return render_template('calculos.html', title=page_title, form=form,
+                           plot_html=plot_html, resultados_html=resultados_html)
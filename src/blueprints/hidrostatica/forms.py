@@ -1,5 +1,5 @@
 from flask_wtf import FlaskForm
-from wtforms import StringField, FloatField, SelectField, SubmitField, IntegerField, RadioField
+from wtforms import StringField, FloatField, SelectField, SubmitField, IntegerField, RadioField, BooleanField
 from wtforms.validators import DataRequired, Optional, ValidationError, NumberRange, InputRequired
 
 class HydrostaticsCalculationForm(FlaskForm):
@@ -14,7 +14,8 @@ class HydrostaticsCalculationForm(FlaskForm):
         choices=[
             ('numero', 'Por número de calados'),
             ('incremento', 'Por incremento de calados em metros'),
-            ('manual', 'Lista manual de calados em metros')
+            ('manual', 'Lista manual de calados em metros'),
+            ('adaptativo', 'Refinamento adaptativo (tolerância em % da amplitude das curvas)')
         ],
         default='numero',
         validators=[DataRequired()]
@@ -27,6 +28,10 @@ class HydrostaticsCalculationForm(FlaskForm):
     num_calados = IntegerField("Número de Calados", validators=[Optional()])
     inc_calados = FloatField("Incremento (m)", validators=[Optional()])
     lista_calados = StringField("Lista (separada por ;)", validators=[Optional()])
+    tolerancia_adaptativa = FloatField(
+        "Tolerância (%)", default=0.1,
+        validators=[Optional(), NumberRange(min=0.001, max=10, message="A tolerância deve estar entre 0,001% e 10%.")]
+    )
 
     # Campos de parâmetros
     metodo_interp = SelectField(
@@ -36,8 +41,30 @@ class HydrostaticsCalculationForm(FlaskForm):
         validators=[DataRequired()]
     )
     densidade = FloatField('Densidade (t/m³)', default=1.025, validators=[DataRequired()])
+    motor = SelectField(
+        'Motor de Cálculo',
+        choices=[('vetorizado', 'Vetorizado (NumPy)'), ('quad', 'Integração exata por trechos')],
+        default='vetorizado',
+        validators=[DataRequired()]
+    )
+
+    # Executa como tarefa em segundo plano, acompanhando o progresso
+    segundo_plano = BooleanField('Executar em segundo plano (acompanhar progresso)', default=False)
+
+    # Registra o tempo e as chamadas do integrando de cada fase do cálculo
+    perfilar = BooleanField('Mostrar o tempo de cada fase do cálculo', default=False)
+
+    # Formato do arquivo exportado (Parquet e Arrow precisam do pacote opcional 'pyarrow')
+    formato_exportacao = SelectField(
+        'Formato de Exportação',
+        choices=[('csv', 'CSV'), ('parquet', 'Parquet'), ('arrow', 'Arrow IPC')],
+        default='csv',
+        validators=[DataRequired()]
+    )
 
     submit = SubmitField('Executar Cálculo')
+    exportar = SubmitField('Exportar')
+    exportar_lote = SubmitField('Exportar Todas as Embarcações')
 
     # Validação personalizada para os campos de calado
     def validate(self, extra_validators=None):
@@ -66,5 +93,13 @@ class HydrostaticsCalculationForm(FlaskForm):
             if not self.lista_calados.data:
                 self.lista_calados.errors.append('Este campo é obrigatório para o método selecionado.')
                 return False
+        elif method == 'adaptativo':
+            if not self.tolerancia_adaptativa.data:
+                self.tolerancia_adaptativa.errors.append('Este campo é obrigatório para o método selecionado.')
+                return False
+            # O número de calados, se informado, define a malha inicial
+            if self.num_calados.data is not None and self.num_calados.data < 2:
+                self.num_calados.errors.append('A malha inicial precisa de pelo menos 2 calados.')
+                return False
         
         return True
\ No newline at end of file
@@ -1,16 +1,160 @@
+import base64
+import hashlib
+import json
 import os
-import pandas as pd
+import zlib
+from typing import TYPE_CHECKING
 import numpy as np
-from flask import Blueprint, render_template, flash, current_app, request
+from flask import Blueprint, render_template, flash, current_app, request, jsonify, url_for, abort, Response, stream_with_context
 from flask_login import login_required, current_user
 from .forms import HydrostaticsCalculationForm
 from src.models import Vessel
-from src.core.interpolacao import Casco
-from src.core.calculos_hidrostaticos import CalculadoraHidrostatica
-from src.core.visualizacao import gerar_grafico_hidrostatico
+from src.core.cache_casco import cache_cascos
+from src.core.armazem_resultados import armazem_resultados
+from src.core.calculos_hidrostaticos import CalculadoraHidrostatica, COLUNAS_RESULTADOS, COLUNA_REFINAMENTO
+from src.core.tarefas_calculo import gerenciador_tarefas, LimiteDeTarefasExcedido
+from src.core.perfil_calculo import resumir_perfil
+from src.core.visualizacao import geometria_casco_json
+from src.core.exportacao import gerar_exportacao, verificar_formato, FormatoIndisponivel, FORMATOS_EXPORTACAO
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 hidrostatica_bp = Blueprint('hidrostatica', __name__, template_folder='templates', url_prefix='/hidrostatica')
 
+
+@hidrostatica_bp.record_once
+def configurar_cache(state):
+    """Aplica a configuração da aplicação ao cache de cascos e ao armazém de resultados."""
+    cache_cascos.limite_bytes = state.app.config.get('CACHE_CASCOS_LIMITE_BYTES', cache_cascos.limite_bytes)
+
+    caminho_resultados = state.app.config.get('RESULTADOS_DB_PATH')
+    if caminho_resultados:
+        os.makedirs(os.path.dirname(caminho_resultados), exist_ok=True)
+        armazem_resultados.configurar(caminho_resultados, state.app.config.get('RESULTADOS_MAX_LINHAS'))
+
+    gerenciador_tarefas.configurar(
+        max_simultaneas=state.app.config.get('TAREFAS_MAX_SIMULTANEAS'),
+        max_por_usuario=state.app.config.get('TAREFAS_MAX_POR_USUARIO'),
+        retencao_s=state.app.config.get('TAREFAS_RETENCAO_S'),
+    )
+
+
+def _gerar_lista_de_calados(form: HydrostaticsCalculationForm) -> list:
+    """Monta a lista de calados a calcular conforme o método escolhido no formulário."""
+    calc_method = form.calc_method.data
+    calado_min_form = form.calado_min.data
+    calado_max_form = form.calado_max.data
+    lista_de_calados_a_calcular = []
+
+    print(f'Calado Mínimo: {calado_min_form}, Calado Máximo: {calado_max_form}')
+
+    if calc_method == 'numero':
+        num_calados = form.num_calados.data
+        # Usa os valores do formulário em vez de 0.1 e calado_maximo_casco
+        lista_de_calados_a_calcular = np.linspace(calado_min_form, calado_max_form, num_calados).tolist()
+        print(f'Lista de Calados (Número): {lista_de_calados_a_calcular}')
+
+    elif calc_method == 'incremento':
+        inc_calados = form.inc_calados.data
+        # Usa os valores do formulário em vez de 0.1 e calado_maximo_casco
+        lista_de_calados_a_calcular = np.arange(calado_min_form, calado_max_form + inc_calados, inc_calados).tolist()
+        print(f'Lista de Calados (Número): {lista_de_calados_a_calcular}')
+
+    elif calc_method == 'manual':
+        lista_calados_str = form.lista_calados.data
+        lista_de_calados_a_calcular = [float(c.strip()) for c in lista_calados_str.split(';') if c.strip()]
+        print(f'Lista de Calados (Número): {lista_de_calados_a_calcular}')
+
+    return lista_de_calados_a_calcular
+
+
+# Calados da malha inicial do refinamento adaptativo quando o número não é informado
+CALADOS_INICIAIS_ADAPTATIVO = 9
+
+
+def _parametros_adaptativos(form: HydrostaticsCalculationForm) -> dict:
+    """Argumentos de `calcular_curvas_adaptativas` conforme o formulário e a configuração."""
+    return {
+        'calado_min': form.calado_min.data,
+        'calado_max': form.calado_max.data,
+        'n_inicial': form.num_calados.data or CALADOS_INICIAIS_ADAPTATIVO,
+        'tolerancia': form.tolerancia_adaptativa.data / 100,
+        'max_calados': current_app.config['HIDROSTATICA_MAX_CALADOS_ADAPTATIVO'],
+    }
+
+
+def _montar_calculadora(vessel: Vessel, metodo_interp: str, densidade: float, motor: str) -> tuple:
+    """
+    Carrega o casco da embarcação (via cache) e monta a calculadora.
+
+    Returns:
+        tuple: (casco, calculadora).
+    """
+    filepath = os.path.join(current_app.root_path, '..', 'uploads', vessel.tabela_cotas_filename)
+    # O casco é reaproveitado do cache se o mesmo arquivo já foi preparado
+    casco = cache_cascos.obter(filepath, metodo_interp)
+
+    calculadora = CalculadoraHidrostatica(
+        casco, densidade, metodo_interp, motor=motor,
+        armazem=armazem_resultados, vessel_id=vessel.id,
+        executor=current_app.config['HIDROSTATICA_EXECUTOR'],
+        max_workers=current_app.config['HIDROSTATICA_MAX_WORKERS'],
+        tamanho_lote=current_app.config['HIDROSTATICA_TAMANHO_LOTE'],
+    )
+    return casco, calculadora
+
+
+def _preparar_calculo(form: HydrostaticsCalculationForm) -> tuple:
+    """
+    Carrega o casco da embarcação escolhida (via cache) e monta a calculadora.
+
+    Returns:
+        tuple: (embarcação, casco, calculadora).
+    """
+    selected_vessel = Vessel.query.get(form.vessel.data)
+    casco, calculadora = _montar_calculadora(selected_vessel, form.metodo_interp.data, form.densidade.data,
+                                             form.motor.data)
+    return selected_vessel, casco, calculadora
+
+
+def _gerar_chave_resultados(vessel_id: int, metodo_interp: str, densidade: float, motor: str,
+                            resultados_df: 'pd.DataFrame') -> str:
+    """
+    Chave compacta (JSON comprimido, em base64 para URL) que identifica uma
+    tabela calculada: embarcação, parâmetros e calados. Com ela, o endpoint de
+    resultados remonta a tabela a partir do armazém, sem depender da sessão.
+    """
+    dados = {
+        'v': vessel_id,
+        'm': metodo_interp,
+        'd': densidade,
+        'e': motor,
+        'c': resultados_df['Calado (m)'].tolist(),
+    }
+    if COLUNA_REFINAMENTO in resultados_df:
+        dados['r'] = resultados_df[COLUNA_REFINAMENTO].astype(int).tolist()
+    compactado = zlib.compress(json.dumps(dados, separators=(',', ':')).encode(), 9)
+    return base64.urlsafe_b64encode(compactado).decode().rstrip('=')
+
+
+def _ler_chave_resultados(chave: str) -> dict:
+    """Decodifica uma chave de `_gerar_chave_resultados` (400 se for inválida)."""
+    try:
+        dados = json.loads(zlib.decompress(base64.urlsafe_b64decode(chave + '=' * (-len(chave) % 4))))
+        dados['c'] = [float(calado) for calado in dados['c']]
+        dados['d'] = float(dados['d'])
+        if dados['m'] not in ('linear', 'pchip') or dados['e'] not in ('vetorizado', 'quad'):
+            raise ValueError(dados['m'])
+        return dados
+    except (ValueError, KeyError, TypeError, zlib.error):
+        abort(400)
+
+
+# Tempo de cache da geometria no navegador: a URL muda junto com a assinatura do casco
+CACHE_GEOMETRIA_S = 365 * 24 * 3600
+
+
 @hidrostatica_bp.route('/', methods=['GET', 'POST'])
 @login_required
 def index():
@@ -21,54 +165,45 @@ def index():
     # Cria a lista de tuplas (id, nome) para as choices do formulário
     form.vessel.choices = [(v.id, v.name) for v in user_vessels]
     
-    plot_html = None
     resultados_df = None
-    resultados_html = None
+    resultados_url = None
+    chave_resultados = None
+    geometria_url = None
+    perfil_html = None
     
     if form.validate_on_submit():
         try:
-            # --- 1. Captura de dados e carregamento do casco ---
-            # Captura dos dados do formulário
-            vessel_id = form.vessel.data
-            calc_method = form.calc_method.data
-            metodo_interp = form.metodo_interp.data
-            densidade = form.densidade.data
-            calado_min_form = form.calado_min.data
-            calado_max_form = form.calado_max.data
-
-            # Carregamento do casco
-            selected_vessel = Vessel.query.get(vessel_id)
-            filepath = os.path.join(current_app.root_path, '..', 'uploads', selected_vessel.tabela_cotas_filename)
-            tabela_de_cotas_df = pd.read_csv(filepath, header=None, names=['X', 'Y', 'Z'])
-            casco = Casco(tabela_de_cotas_df, metodo=metodo_interp)
+            # --- 1. Carregamento do casco e preparação da calculadora ---
+            selected_vessel, casco, calculadora = _preparar_calculo(form)
             # plot_html = casco.plotar_casco_3d()
 
             # --- 2. GERAÇÃO DA LISTA DE CALADOS A CALCULAR ---
-            lista_de_calados_a_calcular = []
-
-            print(f'Calado Mínimo: {calado_min_form}, Calado Máximo: {calado_max_form}')
-
-            if calc_method == 'numero':
-                num_calados = form.num_calados.data
-                # Usa os valores do formulário em vez de 0.1 e calado_maximo_casco
-                lista_de_calados_a_calcular = np.linspace(calado_min_form, calado_max_form, num_calados).tolist()
-                print(f'Lista de Calados (Número): {lista_de_calados_a_calcular}')
-            
-            elif calc_method == 'incremento':
-                inc_calados = form.inc_calados.data
-                # Usa os valores do formulário em vez de 0.1 e calado_maximo_casco
-                lista_de_calados_a_calcular = np.arange(calado_min_form, calado_max_form + inc_calados, inc_calados).tolist()
-                print(f'Lista de Calados (Número): {lista_de_calados_a_calcular}')
-            
-            elif calc_method == 'manual':
-                lista_calados_str = form.lista_calados.data
-                lista_de_calados_a_calcular = [float(c.strip()) for c in lista_calados_str.split(';') if c.strip()]
-                print(f'Lista de Calados (Número): {lista_de_calados_a_calcular}')
+            lista_de_calados_a_calcular = _gerar_lista_de_calados(form)
+            adaptativo = form.calc_method.data == 'adaptativo'
 
             # --- 3. EXECUÇÃO DOS CÁLCULOS ---
-            if lista_de_calados_a_calcular:
-                calculadora = CalculadoraHidrostatica(casco, densidade, metodo_interp)
-                resultados_df = calculadora.calcular_curvas(lista_de_calados_a_calcular)
+            if lista_de_calados_a_calcular or adaptativo:
+                if adaptativo:
+                    # Os calados são escolhidos durante o cálculo, onde as curvas mudam mais rápido
+                    calculadora.perfilar = form.perfilar.data
+                    resultados_df = calculadora.calcular_curvas_adaptativas(**_parametros_adaptativos(form))
+                    if form.perfilar.data:
+                        perfil_html = resumir_perfil(calculadora.registros_perfil).to_html(
+                            classes=['table', 'table-striped', 'table-hover'],
+                            index=False,
+                            float_format='{:.2f}'.format,
+                            table_id='tabela-perfil'
+                        )
+                elif form.perfilar.data:
+                    resultados_df, perfil_df = calculadora.calcular_curvas_perfiladas(lista_de_calados_a_calcular)
+                    perfil_html = perfil_df.to_html(
+                        classes=['table', 'table-striped', 'table-hover'],
+                        index=False,
+                        float_format='{:.2f}'.format,
+                        table_id='tabela-perfil'
+                    )
+                else:
+                    resultados_df = calculadora.calcular_curvas(lista_de_calados_a_calcular)
 
                 print("\n=======================================================")
                 print("======= T A B E L A   H I D R O S T Á T I C A =======")
@@ -78,14 +213,12 @@ def index():
                 print("\n")
 
                 if not resultados_df.empty:
-                    resultados_html = resultados_df.to_html(
-                        classes=['table', 'table-striped', 'table-hover'], # Classes CSS para estilo
-                        index=False, # Não mostra o índice do DataFrame na tabela
-                        float_format='{:.4f}'.format, # Formata os números decimais
-                        table_id='tabela-resultados'
-                    )
-
-                    plot_html = gerar_grafico_hidrostatico(resultados_df, casco)
+                    # Tabela e gráfico são montados no navegador a partir dos endpoints JSON
+                    chave_resultados = _gerar_chave_resultados(selected_vessel.id, form.metodo_interp.data,
+                                                               form.densidade.data, form.motor.data, resultados_df)
+                    resultados_url = url_for('hidrostatica.resultados_json', chave=chave_resultados)
+                    geometria_url = url_for('hidrostatica.geometria', vessel_id=selected_vessel.id,
+                                            metodo=form.metodo_interp.data, v=casco.assinatura[:16])
 
                 flash(f"Cálculos para '{selected_vessel.name}' concluídos!", 'success')
             else:
@@ -101,5 +234,334 @@ def index():
             for error in errors:
                 # E cria um pop-up de erro para cada um
                 flash(error, category='error')
+
+    # Tarefa em segundo plano concluída: a tabela e o gráfico vêm do resultado dela, sem recalcular
+    elif request.args.get('tarefa'):
+        tarefa = gerenciador_tarefas.obter(request.args['tarefa'], current_user.id)
+        resultado = tarefa.obter_resultado() if tarefa is not None else None
+        if resultado is None:
+            flash("Resultado da tarefa não encontrado (ela pode ter expirado); calcule novamente.", 'error')
+        else:
+            chave_resultados = resultado['chave']
+            resultados_url = url_for('hidrostatica.resultados_json', chave=chave_resultados)
+            geometria_url = resultado['geometria_url']
+            if resultado['adaptativo']:
+                form.calc_method.data = 'adaptativo'
+            flash(f"Cálculo em segundo plano concluído ({tarefa.descricao}).", 'success')
             
-    return render_template('index.html', form=form, plot_html=plot_html, resultados_html=resultados_html)
\ No newline at end of file
+    return render_template('index.html', form=form, resultados_url=resultados_url, chave_resultados=chave_resultados,
+                           geometria_url=geometria_url, perfil_html=perfil_html)
+
+def _linhas_para_exportar(form: HydrostaticsCalculationForm, calculadora: CalculadoraHidrostatica) -> tuple:
+    """
+    Linhas de resultado (iterável de dicionários) e colunas a exportar conforme o formulário.
+
+    Returns:
+        tuple: (linhas, colunas).
+    """
+    if form.calc_method.data == 'adaptativo':
+        # Os calados só são conhecidos ao fim do refinamento: a tabela é montada antes do envio
+        linhas = calculadora.calcular_curvas_adaptativas(**_parametros_adaptativos(form)).to_dict('records')
+        return linhas, COLUNAS_RESULTADOS + [COLUNA_REFINAMENTO]
+    # As linhas já presentes no armazém de resultados são reaproveitadas; só as que faltam são calculadas
+    return calculadora.calcular_curvas_stream(_gerar_lista_de_calados(form)), COLUNAS_RESULTADOS
+
+
+def _resposta_exportacao(linhas, colunas: list, formato: str, nome_base: str) -> Response:
+    """
+    Resposta que envia o arquivo em partes, à medida que as linhas ficam prontas.
+
+    Raises:
+        FormatoIndisponivel: Formato colunar sem o pyarrow instalado (antes de qualquer cálculo).
+    """
+    conteudo = gerar_exportacao(linhas, colunas, formato)
+    mimetype, extensao = FORMATOS_EXPORTACAO[formato]
+    return Response(
+        stream_with_context(conteudo),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename="{nome_base}.{extensao}"'},
+    )
+
+
+def _validar_formulario_exportacao() -> tuple:
+    """
+    Valida o formulário enviado pelos botões de exportação.
+
+    Returns:
+        tuple: (formulário, resposta de erro ou None).
+    """
+    form = HydrostaticsCalculationForm()
+    user_vessels = Vessel.query.filter_by(user_id=current_user.id).order_by(Vessel.name).all()
+    form.vessel.choices = [(v.id, v.name) for v in user_vessels]
+
+    if not form.validate_on_submit():
+        for field, errors in form.errors.items():
+            for error in errors:
+                flash(error, category='error')
+        return form, (render_template('index.html', form=form), 400)
+    try:
+        verificar_formato(form.formato_exportacao.data)
+    except FormatoIndisponivel as e:
+        flash(str(e), 'error')
+        return form, (render_template('index.html', form=form), 501)
+    return form, None
+
+
+@hidrostatica_bp.route('/exportar', methods=['POST'])
+@login_required
+def exportar():
+    """
+    Exporta a tabela hidrostática (CSV, Parquet ou Arrow IPC), enviada em
+    partes à medida que os calados são calculados (em ordem), sem montar a
+    tabela inteira na memória.
+    """
+    form, erro = _validar_formulario_exportacao()
+    if erro:
+        return erro
+
+    selected_vessel, casco, calculadora = _preparar_calculo(form)
+    linhas, colunas = _linhas_para_exportar(form, calculadora)
+    return _resposta_exportacao(linhas, colunas, form.formato_exportacao.data,
+                                f"hidrostatica_{selected_vessel.id}_{form.metodo_interp.data}")
+
+
+@hidrostatica_bp.route('/exportar/lote', methods=['POST'])
+@login_required
+def exportar_lote():
+    """
+    Exporta numa única tabela as curvas de todas as embarcações do usuário,
+    com os parâmetros do formulário (a embarcação selecionada é ignorada).
+    As embarcações são calculadas e enviadas uma de cada vez; as colunas
+    'vessel_id' e 'Embarcação' identificam as linhas de cada uma.
+    """
+    form, erro = _validar_formulario_exportacao()
+    if erro:
+        return erro
+
+    user_vessels = Vessel.query.filter_by(user_id=current_user.id).order_by(Vessel.name).all()
+    # Arquivos ausentes interromperiam o envio no meio: são verificados antes de começar
+    sem_arquivo = [v.name for v in user_vessels if not os.path.exists(
+        os.path.join(current_app.root_path, '..', 'uploads', v.tabela_cotas_filename))]
+    if sem_arquivo:
+        flash(f"Tabela de cotas não encontrada para: {', '.join(sem_arquivo)}.", 'error')
+        return render_template('index.html', form=form), 409
+
+    colunas = ['vessel_id', 'Embarcação'] + COLUNAS_RESULTADOS
+    if form.calc_method.data == 'adaptativo':
+        colunas.append(COLUNA_REFINAMENTO)
+
+    def _linhas_lote():
+        for vessel in user_vessels:
+            casco, calculadora = _montar_calculadora(vessel, form.metodo_interp.data, form.densidade.data,
+                                                     form.motor.data)
+            linhas, _ = _linhas_para_exportar(form, calculadora)
+            for linha in linhas:
+                yield {'vessel_id': vessel.id, 'Embarcação': vessel.name, **linha}
+
+    return _resposta_exportacao(_linhas_lote(), colunas, form.formato_exportacao.data,
+                                f"hidrostatica_lote_{form.metodo_interp.data}")
+
+
+@hidrostatica_bp.route('/geometria/<int:vessel_id>')
+@login_required
+def geometria(vessel_id):
+    """
+    Geometria 3D do casco (traços compactos em JSON com arrays tipados).
+
+    A ETag é a assinatura do casco, que só muda quando a tabela de cotas é
+    substituída; como a URL gerada pela página inclui a assinatura (`?v=`),
+    a resposta pode ficar em cache no navegador por muito tempo.
+    """
+    vessel = Vessel.query.filter_by(id=vessel_id, user_id=current_user.id).first_or_404()
+    metodo = request.args.get('metodo', 'linear')
+    if metodo not in ('linear', 'pchip'):
+        abort(400)
+    filepath = os.path.join(current_app.root_path, '..', 'uploads', vessel.tabela_cotas_filename)
+    casco = cache_cascos.obter(filepath, metodo)
+
+    if casco.assinatura in request.if_none_match:
+        resposta = Response(status=304)
+    else:
+        resposta = Response(geometria_casco_json(casco), mimetype='application/json')
+    resposta.set_etag(casco.assinatura)
+    resposta.cache_control.private = True
+    if request.args.get('v') == casco.assinatura[:16]:
+        resposta.cache_control.max_age = CACHE_GEOMETRIA_S
+        resposta.cache_control.immutable = True
+    else:
+        resposta.cache_control.no_cache = True
+    return resposta
+
+
+@hidrostatica_bp.route('/resultados')
+@login_required
+def resultados_json():
+    """
+    Tabela hidrostática identificada por `?chave=` (gerada pelo cálculo), em
+    JSON: nomes das colunas e uma lista de valores por calado.
+
+    As linhas vêm do armazém de resultados (as que faltarem são recalculadas).
+    A ETag combina a chave com a assinatura do casco, então o navegador
+    revalida a cada visita e só baixa a tabela de novo se ela mudar.
+    """
+    dados = _ler_chave_resultados(request.args.get('chave', ''))
+    vessel = Vessel.query.filter_by(id=dados['v'], user_id=current_user.id).first_or_404()
+    casco, calculadora = _montar_calculadora(vessel, dados['m'], dados['d'], dados['e'])
+
+    etag = hashlib.sha256(f"{casco.assinatura}:{request.args['chave']}".encode()).hexdigest()[:32]
+    if etag in request.if_none_match:
+        resposta = Response(status=304)
+    else:
+        tabela = calculadora.calcular_curvas(dados['c'])
+        if 'r' in dados and len(dados['r']) == len(tabela):
+            tabela[COLUNA_REFINAMENTO] = dados['r']
+        resposta = jsonify({
+            'colunas': list(tabela.columns),
+            # NaN não é JSON válido: vai como null
+            'linhas': tabela.astype(object).where(tabela.notna(), None).to_numpy().tolist(),
+        })
+    resposta.set_etag(etag)
+    resposta.cache_control.private = True
+    resposta.cache_control.no_cache = True
+    return resposta
+
+
+@hidrostatica_bp.route('/resultados/exportar/<formato>')
+@login_required
+def exportar_resultados(formato):
+    """
+    Exporta a tabela identificada por `?chave=` (a que está na página) no
+    formato pedido. As linhas vêm do armazém de resultados, sem recalcular
+    os calados já armazenados.
+    """
+    if formato not in FORMATOS_EXPORTACAO:
+        abort(404)
+    try:
+        verificar_formato(formato)
+    except FormatoIndisponivel as e:
+        return jsonify({'erro': str(e)}), 501
+
+    dados = _ler_chave_resultados(request.args.get('chave', ''))
+    vessel = Vessel.query.filter_by(id=dados['v'], user_id=current_user.id).first_or_404()
+    casco, calculadora = _montar_calculadora(vessel, dados['m'], dados['d'], dados['e'])
+
+    linhas = calculadora.calcular_curvas_stream(dados['c'])
+    colunas = COLUNAS_RESULTADOS
+    if 'r' in dados and len(dados['r']) == len(dados['c']):
+        linhas = ({**linha, COLUNA_REFINAMENTO: nivel} for linha, nivel in zip(linhas, dados['r']))
+        colunas = COLUNAS_RESULTADOS + [COLUNA_REFINAMENTO]
+    return _resposta_exportacao(linhas, colunas, formato, f"hidrostatica_{vessel.id}_{dados['m']}")
+
+
+@hidrostatica_bp.route('/cache')
+@login_required
+def estatisticas_cache():
+    """Retorna os contadores do cache de cascos (acertos, falhas, memória)."""
+    return jsonify(cache_cascos.estatisticas())
+
+
+@hidrostatica_bp.route('/cache/resultados/<int:vessel_id>/invalidar', methods=['POST'])
+@login_required
+def invalidar_resultados(vessel_id):
+    """Descarta os resultados armazenados de uma embarcação do usuário logado."""
+    vessel = Vessel.query.filter_by(id=vessel_id, user_id=current_user.id).first_or_404()
+    removidas = armazem_resultados.invalidar_embarcacao(vessel.id)
+    return jsonify({'vessel_id': vessel.id, 'linhas_removidas': removidas})
+
+
+@hidrostatica_bp.route('/tarefas', methods=['POST'])
+@login_required
+def criar_tarefa():
+    """
+    Enfileira o cálculo descrito pelo formulário para execução em segundo plano.
+    Responde 202 com o ID da tarefa e as URLs de acompanhamento.
+    """
+    form = HydrostaticsCalculationForm()
+    user_vessels = Vessel.query.filter_by(user_id=current_user.id).order_by(Vessel.name).all()
+    form.vessel.choices = [(v.id, v.name) for v in user_vessels]
+
+    if not form.validate_on_submit():
+        return jsonify({'erros': form.errors}), 400
+
+    adaptativo = form.calc_method.data == 'adaptativo'
+    if adaptativo:
+        selected_vessel, casco, calculadora = _preparar_calculo(form)
+        parametros = _parametros_adaptativos(form)
+        calcular = lambda progresso: calculadora.calcular_curvas_adaptativas(**parametros, progresso=progresso)
+        descricao = f"{selected_vessel.name}: refinamento adaptativo (até {parametros['max_calados']} calados)"
+    else:
+        lista_de_calados_a_calcular = _gerar_lista_de_calados(form)
+        if not lista_de_calados_a_calcular:
+            return jsonify({'erros': {'calados': ['Nenhum calado válido foi definido para o cálculo.']}}), 400
+
+        selected_vessel, casco, calculadora = _preparar_calculo(form)
+        calcular = lambda progresso: calculadora.calcular_curvas(lista_de_calados_a_calcular, progresso=progresso)
+        descricao = f"{selected_vessel.name}: {len(lista_de_calados_a_calcular)} calados"
+
+    # Dados da chave montados aqui: a tarefa roda fora da requisição
+    vessel_id = selected_vessel.id
+    metodo_interp, densidade, motor = form.metodo_interp.data, form.densidade.data, form.motor.data
+    geometria_url = url_for('hidrostatica.geometria', vessel_id=vessel_id, metodo=metodo_interp,
+                            v=casco.assinatura[:16])
+
+    def funcao(progresso):
+        # A tabela terminada fica na tarefa como a chave de resultados: a página a carrega sem recalcular
+        resultados_df = calcular(progresso)
+        if resultados_df.empty:
+            return None
+        return {
+            'chave': _gerar_chave_resultados(vessel_id, metodo_interp, densidade, motor, resultados_df),
+            'geometria_url': geometria_url,
+            'adaptativo': adaptativo,
+        }
+
+    try:
+        tarefa = gerenciador_tarefas.submeter(current_user.id, funcao, descricao=descricao)
+    except LimiteDeTarefasExcedido as e:
+        return jsonify({'erro': str(e)}), 429
+
+    return jsonify({
+        'id': tarefa.id,
+        'estado_url': url_for('hidrostatica.estado_tarefa', tarefa_id=tarefa.id),
+        'resultados_url': url_for('hidrostatica.resultados_tarefa', tarefa_id=tarefa.id),
+    }), 202
+
+
+def _dict_tarefa(tarefa) -> dict:
+    """Estado da tarefa e, se ela terminou com resultados, a URL da página que os exibe."""
+    dados = tarefa.para_dict()
+    if tarefa.obter_resultado() is not None:
+        dados['pagina_url'] = url_for('hidrostatica.index', tarefa=tarefa.id)
+    return dados
+
+
+@hidrostatica_bp.route('/tarefas')
+@login_required
+def listar_tarefas():
+    """Lista as tarefas de cálculo do usuário logado."""
+    return jsonify([_dict_tarefa(tarefa) for tarefa in gerenciador_tarefas.listar(current_user.id)])
+
+
+@hidrostatica_bp.route('/tarefas/<tarefa_id>')
+@login_required
+def estado_tarefa(tarefa_id):
+    """Estado e progresso (calados concluídos / total) de uma tarefa."""
+    tarefa = gerenciador_tarefas.obter(tarefa_id, current_user.id)
+    if tarefa is None:
+        abort(404)
+    return jsonify(_dict_tarefa(tarefa))
+
+
+@hidrostatica_bp.route('/tarefas/<tarefa_id>/resultados')
+@login_required
+def resultados_tarefa(tarefa_id):
+    """
+    Linhas de resultado já calculadas, a partir da posição `?desde=N`,
+    para que o cliente busque apenas as linhas novas a cada consulta.
+    """
+    tarefa = gerenciador_tarefas.obter(tarefa_id, current_user.id)
+    if tarefa is None:
+        abort(404)
+    desde = request.args.get('desde', 0, type=int)
+    linhas = tarefa.linhas_desde(desde)
+    return jsonify({**_dict_tarefa(tarefa), 'desde': desde, 'linhas': linhas})
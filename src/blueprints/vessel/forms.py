@@ -2,6 +2,7 @@ from flask_wtf import FlaskForm
 from flask_wtf.file import FileField, FileAllowed, FileRequired
 from wtforms import StringField, FloatField, SelectField, SubmitField, IntegerField, SelectMultipleField
 from wtforms.validators import DataRequired, Optional, NumberRange
+from src.core.ingestao import EXTENSOES_TABELA_COTAS
 
 VESSEL_TYPES = [
     ('', '-- Selecione o Tipo --'),
@@ -104,10 +105,10 @@ class VesselForm(FlaskForm):
 
     # --- Tabela de Cotas ---
     tabela_cotas = FileField(
-        'Arquivo da Tabela de Cotas (.csv)',
+        'Arquivo da Tabela de Cotas (.csv ou .npy)',
         validators=[
             FileRequired("Por favor, selecione o arquivo de cotas."),
-            FileAllowed(['csv'], 'Apenas arquivos .csv são permitidos!')
+            FileAllowed(list(EXTENSOES_TABELA_COTAS), 'Apenas arquivos .csv, .txt ou .npy são permitidos!')
         ]
     )
     
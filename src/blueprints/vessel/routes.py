@@ -1,10 +1,15 @@
 import os
+import uuid
 from werkzeug.utils import secure_filename
 from flask import Blueprint, render_template, redirect, request, url_for, flash, current_app
 from flask_login import login_required, current_user
 from .forms import VesselForm
 from src.models import Vessel
 from src.extensions import db
+from src.core.cache_casco import cache_cascos
+from src.core.bonjean import remover_tabelas_bonjean
+from src.core.ingestao import (ingerir_tabela_cotas, caminho_cotas_binarias, remover_cotas_binarias,
+                               ErroIngestao)
 
 vessel_bp = Blueprint(
     'vessel', 
@@ -13,6 +18,15 @@ vessel_bp = Blueprint(
     url_prefix='/vessels' # Todas as rotas aqui começarão com /vessels
 )
 
+def _descartar_envio(temporario: str):
+    """Apaga o arquivo temporário de um envio recusado e as cotas binárias gravadas para ele."""
+    remover_cotas_binarias(temporario)
+    try:
+        os.remove(temporario)
+    except OSError:
+        pass
+
+
 @vessel_bp.route('/add', methods=['GET', 'POST'])
 @login_required
 def add():
@@ -29,8 +43,34 @@ def add():
             arquivo_cotas = form.tabela_cotas.data
             filename = secure_filename(arquivo_cotas.filename)
             upload_path = os.path.join(current_app.root_path, '..', 'uploads', filename)
-            print(f"Salvando arquivo em: {upload_path}")
-            arquivo_cotas.save(upload_path)
+            # O envio é gravado e validado num arquivo temporário (com a mesma extensão):
+            # o arquivo de mesmo nome de outra embarcação só é substituído se as cotas forem válidas
+            temporario = os.path.join(os.path.dirname(upload_path), f".envio-{uuid.uuid4().hex}-{filename}")
+            print(f"Salvando arquivo em: {temporario}")
+            arquivo_cotas.save(temporario)
+
+            # Valida as cotas e grava a versão binária lida nos cálculos
+            try:
+                resumo_ingestao = ingerir_tabela_cotas(temporario)
+            except ErroIngestao as e:
+                _descartar_envio(temporario)
+                print(f"!!! TABELA DE COTAS REJEITADA: {e} !!!")
+                flash(f"Tabela de cotas inválida: {e}", 'error')
+                return render_template('add_vessel.html', form=form)
+            except Exception:
+                _descartar_envio(temporario)
+                raise
+
+            # Só agora o arquivo vai para o lugar definitivo, com as cotas binárias
+            # e sem as tabelas derivadas do arquivo que ele substitui
+            print(f"Movendo arquivo para: {upload_path}")
+            remover_tabelas_bonjean(upload_path)
+            remover_cotas_binarias(upload_path)
+            os.replace(temporario, upload_path)
+            os.replace(caminho_cotas_binarias(temporario), caminho_cotas_binarias(upload_path))
+            # Um arquivo com o mesmo nome pode ter sido sobrescrito
+            cache_cascos.invalidar_arquivo(upload_path)
+            print(f"Resumo da ingestão: {resumo_ingestao}")
 
             # Cria uma nova instância do modelo Vessel com os dados do formulário
             print("Criando objeto new_vessel...")
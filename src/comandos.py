@@ -0,0 +1,108 @@
+# src/comandos.py
+
+import os
+import click
+from flask import current_app
+
+
+def registrar_comandos(app):
+    """Registra os comandos de linha de comando (`flask --app run <comando>`) na aplicação."""
+
+    @app.cli.command('calcular-frota')
+    @click.option('--metodo', 'metodo_interp', type=click.Choice(['linear', 'pchip']), default='linear',
+                  show_default=True, help='Método de interpolação do casco.')
+    @click.option('--densidade', type=float, default=1.025, show_default=True, help='Densidade da água (t/m³).')
+    @click.option('--motor', type=click.Choice(['vetorizado', 'quad']), default='vetorizado', show_default=True,
+                  help="Motor de cálculo: 'vetorizado' (NumPy) ou 'quad' (integração exata por trechos, calado a calado).")
+    @click.option('--calado-min', type=float, default=0.1, show_default=True, help='Calado mínimo (m).')
+    @click.option('--calado-max', type=float, default=None,
+                  help='Calado máximo (m); por padrão, o pontal de cada embarcação.')
+    @click.option('--num-calados', type=click.IntRange(min=2), default=50, show_default=True,
+                  help='Número de calados por embarcação.')
+    @click.option('--usuario', 'user_id', type=int, default=None, help='Apenas as embarcações deste usuário (ID).')
+    @click.option('--saida', 'diretorio_saida', type=click.Path(file_okay=False), default=None,
+                  help='Pasta onde gravar um arquivo por embarcação (além do armazém de resultados).')
+    @click.option('--formato', type=click.Choice(['csv', 'parquet', 'arrow']), default='csv', show_default=True,
+                  help='Formato dos arquivos gravados em --saida.')
+    @click.option('--workers', 'max_workers', type=click.IntRange(min=1), default=None,
+                  help='Processos do pool (padrão: número de CPUs; 1 calcula no próprio processo).')
+    @click.option('--reiniciar', is_flag=True, help='Ignora o progresso salvo e recalcula todas as embarcações.')
+    def calcular_frota_comando(metodo_interp, densidade, motor, calado_min, calado_max, num_calados, user_id,
+                               diretorio_saida, formato, max_workers, reiniciar):
+        """
+        Calcula a tabela hidrostática de todas as embarcações cadastradas.
+
+        Cada embarcação é uma tarefa do pool de processos. Os resultados vão
+        para o armazém de resultados (e para --saida, se informado) assim que
+        cada embarcação termina. Interrompido, o comando retoma de onde parou
+        quando executado de novo com os mesmos parâmetros.
+        """
+        import numpy as np
+        from src.models import Vessel
+        from src.core.armazem_resultados import armazem_resultados
+        from src.core.exportacao import verificar_formato, FormatoIndisponivel
+        from src.core.frota import calcular_frota
+
+        if diretorio_saida:
+            try:
+                verificar_formato(formato)
+            except FormatoIndisponivel as e:
+                raise click.UsageError(str(e))
+
+        consulta = Vessel.query.order_by(Vessel.id)
+        if user_id is not None:
+            consulta = consulta.filter_by(user_id=user_id)
+
+        embarcacoes = []
+        for vessel in consulta.all():
+            caminho_cotas = os.path.realpath(
+                os.path.join(current_app.root_path, '..', 'uploads', vessel.tabela_cotas_filename))
+            if not os.path.exists(caminho_cotas):
+                click.echo(f"Aviso: tabela de cotas de '{vessel.name}' (id {vessel.id}) não encontrada; ignorada.",
+                           err=True)
+                continue
+            calado_final = calado_max if calado_max is not None else vessel.pontal
+            if calado_final <= calado_min:
+                click.echo(f"Aviso: calado máximo de '{vessel.name}' (id {vessel.id}) não é maior que o mínimo; "
+                           f"ignorada.", err=True)
+                continue
+            embarcacoes.append({
+                'vessel_id': vessel.id,
+                'nome': vessel.name,
+                'caminho_cotas': caminho_cotas,
+                'calados': np.linspace(calado_min, calado_final, num_calados).tolist(),
+            })
+
+        if not embarcacoes:
+            click.echo("Nenhuma embarcação para calcular.")
+            return
+
+        if diretorio_saida:
+            caminho_progresso = os.path.join(diretorio_saida, 'progresso_frota.json')
+        else:
+            caminho_progresso = os.path.join(current_app.instance_path, 'progresso_frota.json')
+        os.makedirs(os.path.dirname(caminho_progresso), exist_ok=True)
+        if reiniciar and os.path.exists(caminho_progresso):
+            os.remove(caminho_progresso)
+
+        click.echo(f"Calculando {len(embarcacoes)} embarcações ({num_calados} calados cada, motor '{motor}', "
+                   f"método '{metodo_interp}')...")
+        try:
+            resumo = calcular_frota(
+                embarcacoes, densidade, metodo_interp, motor, caminho_progresso,
+                armazem=armazem_resultados, diretorio_saida=diretorio_saida, formato=formato,
+                max_workers=max_workers,
+                parametros_calados={'min': calado_min, 'max': calado_max, 'n': num_calados},
+                ao_falhar=lambda embarcacao, mensagem: click.echo(f"Erro: {mensagem}", err=True),
+            )
+        except KeyboardInterrupt:
+            click.echo("\nInterrompido. Execute o mesmo comando para continuar de onde parou.", err=True)
+            raise SystemExit(130)
+
+        click.echo(f"\nConcluído: {resumo['calculadas']} embarcações calculadas, {resumo['puladas']} puladas, "
+                   f"{resumo['falhas']} com falha, {resumo['calados']} calados em {resumo['tempo_s']:.2f} s "
+                   f"({resumo['cascos_por_s']:.2f} cascos/s, {resumo['calados_por_s']:.1f} calados/s).")
+        if resumo['falhas']:
+            click.echo(f"{resumo['falhas']} embarcações falharam; execute o mesmo comando para tentar de novo.",
+                       err=True)
+            raise SystemExit(1)
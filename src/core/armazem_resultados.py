@@ -0,0 +1,160 @@
+# src/core/armazem_resultados.py
+
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+# Incrementar quando uma mudança nos cálculos tornar os resultados gravados obsoletos
+VERSAO_RESULTADOS = 2
+
+_CASAS_DECIMAIS_CALADO = 6
+
+
+def normalizar_calado(calado: float) -> float:
+    """Arredonda o calado para que 0.30000000000000004 e 0.3 sejam a mesma chave."""
+    return round(float(calado), _CASAS_DECIMAIS_CALADO)
+
+
+class ArmazemResultados:
+    """
+    Armazém persistente (SQLite) de resultados hidrostáticos por calado.
+
+    Cada linha é indexada por (assinatura do casco, densidade, método de
+    interpolação, calado), de modo que tabelas com calados sobrepostos
+    reaproveitam as linhas já calculadas. O número de linhas é limitado e as
+    menos recentemente acessadas são descartadas primeiro.
+    """
+    def __init__(self, caminho: str | None = None, max_linhas: int = 200_000):
+        self.caminho = None
+        self.max_linhas = max_linhas
+        self._trava = threading.Lock()
+        if caminho:
+            self.configurar(caminho, max_linhas)
+
+    def configurar(self, caminho: str, max_linhas: int | None = None):
+        """
+        Define o arquivo do banco e cria a tabela, se necessário.
+
+        Args:
+            caminho (str): Caminho do arquivo SQLite.
+            max_linhas (int, optional): Limite de linhas armazenadas.
+        """
+        self.caminho = caminho
+        if max_linhas is not None:
+            self.max_linhas = max_linhas
+        with self._conectar() as conexao:
+            conexao.execute("""
+                CREATE TABLE IF NOT EXISTS resultados (
+                    casco_hash TEXT NOT NULL,
+                    densidade REAL NOT NULL,
+                    metodo_interp TEXT NOT NULL,
+                    calado REAL NOT NULL,
+                    versao INTEGER NOT NULL,
+                    vessel_id INTEGER,
+                    dados TEXT NOT NULL,
+                    acessado_em REAL NOT NULL,
+                    PRIMARY KEY (casco_hash, densidade, metodo_interp, calado, versao)
+                )
+            """)
+            conexao.execute("CREATE INDEX IF NOT EXISTS idx_resultados_vessel ON resultados (vessel_id)")
+            conexao.execute("CREATE INDEX IF NOT EXISTS idx_resultados_acesso ON resultados (acessado_em)")
+
+    @property
+    def ativo(self) -> bool:
+        return self.caminho is not None
+
+    @contextmanager
+    def _conectar(self):
+        """Abre uma conexão, confirma a transação ao final e a fecha."""
+        conexao = sqlite3.connect(self.caminho, timeout=30)
+        try:
+            with conexao:
+                yield conexao
+        finally:
+            conexao.close()
+
+    def buscar(self, casco_hash: str, densidade: float, metodo_interp: str, calados: list) -> dict:
+        """
+        Busca as linhas já calculadas para os calados pedidos.
+
+        Returns:
+            dict: Calado normalizado -> dicionário de resultados daquela linha.
+        """
+        if not self.ativo or not calados:
+            return {}
+
+        chaves = sorted({normalizar_calado(c) for c in calados})
+        encontrados = {}
+        with self._trava, self._conectar() as conexao:
+            # Consulta em blocos para respeitar o limite de parâmetros do SQLite
+            for inicio in range(0, len(chaves), 500):
+                bloco = chaves[inicio:inicio + 500]
+                marcadores = ','.join('?' * len(bloco))
+                parametros = [casco_hash, densidade, metodo_interp, VERSAO_RESULTADOS, *bloco]
+                linhas = conexao.execute(
+                    f"SELECT calado, dados FROM resultados WHERE casco_hash = ? AND densidade = ? "
+                    f"AND metodo_interp = ? AND versao = ? AND calado IN ({marcadores})",
+                    parametros,
+                ).fetchall()
+                for calado, dados in linhas:
+                    encontrados[calado] = json.loads(dados)
+
+                if linhas:
+                    conexao.execute(
+                        f"UPDATE resultados SET acessado_em = ? WHERE casco_hash = ? AND densidade = ? "
+                        f"AND metodo_interp = ? AND versao = ? AND calado IN ({marcadores})",
+                        [time.time(), *parametros],
+                    )
+        return encontrados
+
+    def gravar(self, casco_hash: str, densidade: float, metodo_interp: str, linhas: list, vessel_id: int | None = None):
+        """
+        Grava as linhas calculadas (uma por calado) e aplica o limite de tamanho.
+
+        Args:
+            linhas (list): Dicionários de resultados, com a chave 'Calado (m)'.
+            vessel_id (int, optional): Embarcação dona do casco, para invalidação.
+        """
+        if not self.ativo or not linhas:
+            return
+
+        agora = time.time()
+        registros = [
+            (casco_hash, densidade, metodo_interp, normalizar_calado(linha['Calado (m)']),
+             VERSAO_RESULTADOS, vessel_id, json.dumps(linha), agora)
+            for linha in linhas
+        ]
+        with self._trava, self._conectar() as conexao:
+            conexao.executemany("INSERT OR REPLACE INTO resultados VALUES (?, ?, ?, ?, ?, ?, ?, ?)", registros)
+            excedente = conexao.execute("SELECT COUNT(*) FROM resultados").fetchone()[0] - self.max_linhas
+            if excedente > 0:
+                conexao.execute(
+                    "DELETE FROM resultados WHERE rowid IN "
+                    "(SELECT rowid FROM resultados ORDER BY acessado_em LIMIT ?)",
+                    (excedente,),
+                )
+
+    def invalidar_embarcacao(self, vessel_id: int) -> int:
+        """
+        Remove todos os resultados associados a uma embarcação.
+
+        Returns:
+            int: Número de linhas removidas.
+        """
+        if not self.ativo:
+            return 0
+        with self._trava, self._conectar() as conexao:
+            return conexao.execute("DELETE FROM resultados WHERE vessel_id = ?", (vessel_id,)).rowcount
+
+    def invalidar_casco(self, casco_hash: str) -> int:
+        """Remove todos os resultados de um casco, independentemente da embarcação."""
+        if not self.ativo:
+            return 0
+        with self._trava, self._conectar() as conexao:
+            return conexao.execute("DELETE FROM resultados WHERE casco_hash = ?", (casco_hash,)).rowcount
+
+
+# Instância única usada por toda a aplicação (configurada no registro do blueprint)
+armazem_resultados = ArmazemResultados()
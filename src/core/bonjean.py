@@ -0,0 +1,260 @@
+# src/core/bonjean.py
+
+import glob
+import os
+import numpy as np
+
+# Grau dos polinômios de cada célula: com meias-bocas lineares por trecho a área
+# é quadrática e o momento cúbico no calado; com PCHIP, quártica e quíntica
+GRAU_BONJEAN = {'linear': 3, 'pchip': 5}
+# Versão do formato do arquivo .npz (arquivos de outra versão são regenerados)
+VERSAO_ARQUIVO_BONJEAN = 2
+
+
+def caminho_tabela_bonjean(caminho_cotas: str, metodo: str) -> str:
+    """Arquivo da tabela de Bonjean gravado ao lado do arquivo de cotas enviado."""
+    return f"{caminho_cotas}.bonjean-{metodo}.npz"
+
+
+def remover_tabelas_bonjean(caminho_cotas: str):
+    """Apaga as tabelas de Bonjean (de todos os métodos) gravadas para um arquivo de cotas."""
+    for caminho in glob.glob(glob.escape(caminho_cotas) + '.bonjean-*.npz'):
+        try:
+            os.remove(caminho)
+        except OSError:
+            pass
+
+
+class TabelaBonjean:
+    """
+    Curvas de Bonjean do casco: área submersa e momento vertical (em relação
+    a z=0) de cada baliza em função do calado.
+
+    A malha de calados reúne as alturas dos pontos de todas as balizas, de
+    modo que, dentro de cada célula, a meia-boca de cada baliza é um único
+    trecho do interpolador e a área e o momento são polinômios no calado
+    (grau 2 e 3 no método linear, 4 e 5 no PCHIP). A tabela guarda os
+    coeficientes desses polinômios em arrays contíguos
+    (n_balizas × n_células × grau+1), calculados uma vez por casco a partir
+    das curvas cumulativas exatas da representação compacta; uma consulta
+    localiza a célula por busca binária e avalia o polinômio, sem nenhuma
+    nova integração e sem erro de interpolação no calado. Entre as balizas,
+    `consultar` interpola linearmente em X (busca binária também na posição).
+    """
+    def __init__(self, posicoes: np.ndarray, calados: np.ndarray, coef_areas: np.ndarray,
+                 coef_momentos: np.ndarray, metodo: str = 'linear', assinatura: str = ''):
+        """
+        Args:
+            posicoes (np.ndarray): Posições X das balizas, em ordem crescente.
+            calados (np.ndarray): Calados da malha, em ordem crescente.
+            coef_areas (np.ndarray): Coeficientes das áreas submersas (m²), com forma
+                (n_balizas × n_células × grau+1), em potências crescentes da
+                posição normalizada u ∈ [0, 1] dentro da célula.
+            coef_momentos (np.ndarray): Coeficientes dos momentos verticais (m³), idem.
+            metodo (str, optional): Interpolação ao longo do comprimento ('linear' ou 'pchip').
+            assinatura (str, optional): Assinatura do casco que gerou a tabela.
+        """
+        self.posicoes = np.ascontiguousarray(posicoes, dtype=float)
+        self.calados = np.ascontiguousarray(calados, dtype=float)
+        self.coef_areas = np.ascontiguousarray(coef_areas, dtype=float)
+        self.coef_momentos = np.ascontiguousarray(coef_momentos, dtype=float)
+        self.metodo = metodo
+        self.assinatura = assinatura
+
+    @classmethod
+    def de_casco(cls, casco) -> 'TabelaBonjean':
+        """
+        Monta a tabela a partir das curvas cumulativas do casco: em cada célula,
+        o polinômio é o que passa por grau+1 valores exatos igualmente espaçados.
+
+        Args:
+            casco (Casco): O casco.
+        """
+        grau = GRAU_BONJEAN.get(casco.metodo, GRAU_BONJEAN['pchip'])
+        calados = np.unique(casco.compacto.z)
+        n_balizas = casco.compacto.n_balizas
+        if len(calados) < 2:
+            vazio = np.zeros((n_balizas, 0, grau + 1))
+            return cls(casco.compacto.posicoes, calados, vazio, vazio.copy(), casco.metodo, casco.assinatura)
+
+        u = np.linspace(0.0, 1.0, grau + 1)
+        amostras = (calados[:-1, None] + np.diff(calados)[:, None] * u[None, :]).ravel()
+        areas, momentos = casco.obter_areas_e_momentos(amostras)
+
+        # Valores (n_balizas × n_células × grau+1) -> coeficientes pela matriz de Vandermonde
+        inversa = np.linalg.inv(np.vander(u, grau + 1, increasing=True))
+        forma = (n_balizas, len(calados) - 1, grau + 1)
+        coef_areas = areas.reshape(forma) @ inversa.T
+        coef_momentos = momentos.reshape(forma) @ inversa.T
+        return cls(casco.compacto.posicoes, calados, coef_areas, coef_momentos, casco.metodo, casco.assinatura)
+
+    @classmethod
+    def carregar_ou_gerar(cls, casco, caminho: str) -> 'TabelaBonjean':
+        """
+        Lê a tabela gravada em `caminho` se ela pertencer a este casco; caso
+        contrário, gera a tabela e a grava para as próximas vezes.
+
+        Args:
+            casco (Casco): O casco.
+            caminho (str): Arquivo .npz da tabela.
+
+        Returns:
+            TabelaBonjean: A tabela do casco.
+        """
+        if os.path.exists(caminho):
+            try:
+                with np.load(caminho) as dados:
+                    if (int(dados['versao']) == VERSAO_ARQUIVO_BONJEAN
+                            and str(dados['assinatura']) == casco.assinatura):
+                        return cls(dados['posicoes'], dados['calados'], dados['coef_areas'],
+                                   dados['coef_momentos'], casco.metodo, casco.assinatura)
+            except (OSError, KeyError, ValueError) as e:
+                print(f"-> Tabela de Bonjean ilegível em '{caminho}' ({e}); será regenerada.")
+
+        tabela = cls.de_casco(casco)
+        try:
+            tabela.salvar(caminho)
+        except OSError as e:
+            print(f"-> Não foi possível gravar a tabela de Bonjean em '{caminho}': {e}")
+        return tabela
+
+    def salvar(self, caminho: str):
+        """Grava a tabela em um arquivo .npz (escrita atômica)."""
+        temporario = f"{caminho}.{os.getpid()}.tmp"
+        with open(temporario, 'wb') as arquivo:
+            np.savez(arquivo, versao=VERSAO_ARQUIVO_BONJEAN, assinatura=self.assinatura, posicoes=self.posicoes,
+                     calados=self.calados, coef_areas=self.coef_areas, coef_momentos=self.coef_momentos)
+        os.replace(temporario, caminho)
+
+    def _avaliar(self, coeficientes: np.ndarray, linhas: np.ndarray, calados: np.ndarray) -> np.ndarray:
+        """
+        Valores do polinômio da célula de cada calado nas balizas `linhas`
+        (Horner). Fora da malha, o calado é limitado a ela: abaixo não há
+        seção e acima a seção está completa.
+        """
+        if coeficientes.shape[1] == 0:
+            return np.zeros(np.broadcast(linhas, calados).shape)
+        calados = np.clip(calados, self.calados[0], self.calados[-1])
+        celula = np.clip(np.searchsorted(self.calados, calados, side='right') - 1, 0, len(self.calados) - 2)
+        u = (calados - self.calados[celula]) / (self.calados[celula + 1] - self.calados[celula])
+        valores = coeficientes[linhas, celula, -1]
+        for grau in range(coeficientes.shape[2] - 2, -1, -1):
+            valores = valores * u + coeficientes[linhas, celula, grau]
+        return valores
+
+    def consultar(self, x, calados) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Área e momento vertical da seção em posições e calados arbitrários
+        (combinados por broadcasting): polinômio exato no calado em cada uma
+        das duas balizas vizinhas e interpolação linear entre elas.
+
+        Fora do comprimento das balizas a seção é nula; acima do último calado
+        da malha a seção está completa.
+
+        Returns:
+            tuple: Áreas (m²) e momentos verticais (m³).
+        """
+        x, calados = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(calados, dtype=float))
+        if len(self.posicoes) < 2:
+            return np.zeros(x.shape), np.zeros(x.shape)
+
+        linha = np.clip(np.searchsorted(self.posicoes, x, side='right') - 1, 0, len(self.posicoes) - 2)
+        peso_x = (x - self.posicoes[linha]) / (self.posicoes[linha + 1] - self.posicoes[linha])
+        dentro = (x >= self.posicoes[0]) & (x <= self.posicoes[-1])
+
+        resultados = []
+        for coeficientes in (self.coef_areas, self.coef_momentos):
+            re = self._avaliar(coeficientes, linha, calados)
+            vante = self._avaliar(coeficientes, linha + 1, calados)
+            resultados.append(np.where(dentro, (1 - peso_x) * re + peso_x * vante, 0.0))
+        return resultados[0], resultados[1]
+
+    def areas_nas_balizas(self, calados) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Áreas e momentos verticais de todas as balizas para cada calado.
+
+        Args:
+            calados (float | array): Um calado por condição, ou uma matriz
+                (n_balizas × n_condições) com o calado local de cada baliza.
+
+        Returns:
+            tuple: Matrizes (n_balizas × n_condições) de áreas e de momentos.
+        """
+        calados = np.asarray(calados, dtype=float)
+        if calados.ndim < 2:
+            calados = np.broadcast_to(np.atleast_1d(calados)[None, :], (len(self.posicoes), np.size(calados)))
+        linhas = np.arange(len(self.posicoes))[:, None]
+        return self._avaliar(self.coef_areas, linhas, calados), self._avaliar(self.coef_momentos, linhas, calados)
+
+    def _calados_locais(self, calado_re, calado_vante, posicoes=None) -> np.ndarray:
+        """Calado em cada posição (por padrão, as balizas) para a linha d'água reta entre as balizas extremas."""
+        calado_re = np.atleast_1d(np.asarray(calado_re, dtype=float))
+        calado_vante = np.atleast_1d(np.asarray(calado_vante, dtype=float))
+        posicoes = self.posicoes if posicoes is None else np.asarray(posicoes, dtype=float)
+        comprimento = self.posicoes[-1] - self.posicoes[0] if len(self.posicoes) > 1 else 1.0
+        fracao = ((posicoes - self.posicoes[0]) / comprimento)[:, None]
+        return calado_re[None, :] + fracao * (calado_vante - calado_re)[None, :]
+
+    def _integrar_ao_longo(self, valores: np.ndarray) -> np.ndarray:
+        """Integra grandezas por baliza ao longo do comprimento, com a interpolação do casco."""
+        if len(self.posicoes) < 2:
+            return np.zeros(valores.shape[1:])
+        if self.metodo == 'pchip':
+            from scipy.interpolate import PchipInterpolator
+
+            return PchipInterpolator(self.posicoes, valores, axis=0).integrate(self.posicoes[0], self.posicoes[-1])
+        return np.trapezoid(valores, self.posicoes, axis=0)
+
+    def volume_e_centros(self, calado_re, calado_vante=None) -> dict:
+        """
+        Volume, LCB e VCB para linhas d'água com trim, dadas pelos calados nas
+        balizas extremas (vetorizado sobre as condições).
+
+        Args:
+            calado_re (float | array): Calado na baliza de ré.
+            calado_vante (float | array, optional): Calado na baliza de vante
+                (igual ao de ré, se omitido: flutuação direita).
+
+        Returns:
+            dict: Arrays 'volume' (m³), 'lcb' (m) e 'vcb' (m), um valor por condição.
+        """
+        calado_vante = calado_re if calado_vante is None else calado_vante
+        areas, momentos = self.areas_nas_balizas(self._calados_locais(calado_re, calado_vante))
+        volume = self._integrar_ao_longo(areas)
+        momento_x = self._integrar_ao_longo(areas * self.posicoes[:, None])
+        momento_z = self._integrar_ao_longo(momentos)
+        volume_seguro = np.where(volume > 1e-12, volume, 1.0)
+        return {
+            'volume': volume,
+            'lcb': np.where(volume > 1e-12, momento_x / volume_seguro, 0.0),
+            'vcb': np.where(volume > 1e-12, momento_z / volume_seguro, 0.0),
+        }
+
+    def distribuicao_empuxo(self, calado_re, calado_vante, densidade: float, posicoes=None) -> np.ndarray:
+        """
+        Empuxo por unidade de comprimento (t/m) para o cálculo de esforços
+        longitudinais, nas balizas ou em posições X quaisquer (por exemplo,
+        uma malha mais fina que a das balizas).
+
+        Args:
+            calado_re (float | array): Calado na baliza de ré.
+            calado_vante (float | array): Calado na baliza de vante.
+            densidade (float): Densidade da água (t/m³).
+            posicoes (array, optional): Posições X; por padrão, as das balizas.
+
+        Returns:
+            np.ndarray: Matriz (n_posições × n_condições).
+        """
+        calados = self._calados_locais(calado_re, calado_vante, posicoes)
+        if posicoes is None:
+            areas, _ = self.areas_nas_balizas(calados)
+        else:
+            areas, _ = self.consultar(np.asarray(posicoes, dtype=float)[:, None], calados)
+        return areas * densidade
+
+    def tamanho_em_bytes(self) -> int:
+        """
+        Returns:
+            int: Memória ocupada pelos arrays da tabela.
+        """
+        return sum(v.nbytes for v in vars(self).values() if isinstance(v, np.ndarray))
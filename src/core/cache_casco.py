@@ -0,0 +1,145 @@
+# src/core/cache_casco.py
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from .interpolacao import Casco
+from .bonjean import caminho_tabela_bonjean
+from .ingestao import carregar_cotas, caminho_cotas_binarias
+
+
+def calcular_hash_arquivo(caminho: str) -> str:
+    """
+    Calcula o hash SHA-256 do conteúdo de um arquivo.
+
+    Args:
+        caminho (str): Caminho do arquivo.
+
+    Returns:
+        str: O hash em hexadecimal.
+    """
+    sha = hashlib.sha256()
+    with open(caminho, 'rb') as arquivo:
+        for bloco in iter(lambda: arquivo.read(1024 * 1024), b''):
+            sha.update(bloco)
+    return sha.hexdigest()
+
+
+class CacheCascos:
+    """
+    Cache LRU, compartilhado pelo processo, de objetos `Casco` já preparados.
+
+    As entradas são indexadas por (hash do conteúdo do arquivo de cotas, método
+    de interpolação) e descartadas, da menos recentemente usada para a mais
+    recente, quando a memória estimada ultrapassa o limite configurado.
+    """
+    def __init__(self, limite_bytes: int = 256 * 1024 * 1024):
+        self.limite_bytes = limite_bytes
+        self.acertos = 0
+        self.falhas = 0
+
+        self._entradas = OrderedDict()   # (hash, metodo) -> (casco, tamanho)
+        self._chaves_por_arquivo = {}    # caminho -> {(hash, metodo), ...}
+        self._hashes = {}                # caminho -> (mtime_ns, tamanho, hash)
+        self._bytes_em_uso = 0
+        self._trava = threading.RLock()
+
+    def _hash_do_arquivo(self, caminho: str) -> str:
+        """Reaproveita o hash enquanto o arquivo não for modificado (mtime e tamanho)."""
+        estado = os.stat(caminho)
+        conhecido = self._hashes.get(caminho)
+        if conhecido and conhecido[:2] == (estado.st_mtime_ns, estado.st_size):
+            return conhecido[2]
+
+        hash_conteudo = calcular_hash_arquivo(caminho)
+        self._hashes[caminho] = (estado.st_mtime_ns, estado.st_size, hash_conteudo)
+        return hash_conteudo
+
+    def obter(self, caminho: str, metodo: str) -> Casco:
+        """
+        Retorna o casco da tabela de cotas em `caminho`, construindo-o apenas
+        se ainda não estiver no cache.
+
+        Args:
+            caminho (str): Caminho do arquivo de cotas enviado (as cotas validadas
+                são lidas do .npy gerado na ingestão).
+            metodo (str): Método de interpolação ('linear' ou 'pchip').
+
+        Returns:
+            Casco: O casco pronto para os cálculos.
+        """
+        caminho = os.path.realpath(caminho)
+        with self._trava:
+            chave = (self._hash_do_arquivo(caminho), metodo)
+            entrada = self._entradas.get(chave)
+            if entrada is not None:
+                self.acertos += 1
+                self._entradas.move_to_end(chave)
+                self._chaves_por_arquivo.setdefault(caminho, set()).add(chave)
+                return entrada[0]
+            self.falhas += 1
+
+        # A construção acontece fora da trava para não bloquear outros cascos
+        # As cotas são mapeadas do .npy da ingestão, compartilhado com os outros processos
+        casco = Casco(carregar_cotas(caminho), metodo=metodo, arquivo_cotas=caminho_cotas_binarias(caminho))
+        # A tabela de Bonjean é lida do arquivo ao lado das cotas (ou gerada e gravada nele)
+        # antes de o tamanho da entrada ser medido
+        casco.arquivo_bonjean = caminho_tabela_bonjean(caminho, metodo)
+        casco.bonjean
+
+        with self._trava:
+            if chave not in self._entradas:
+                tamanho = casco.tamanho_em_bytes()
+                self._entradas[chave] = (casco, tamanho)
+                self._bytes_em_uso += tamanho
+            self._chaves_por_arquivo.setdefault(caminho, set()).add(chave)
+            self._descartar_excedente()
+            return casco
+
+    def _descartar_excedente(self):
+        """Remove as entradas menos recentes até respeitar o limite (mantém ao menos uma)."""
+        while self._bytes_em_uso > self.limite_bytes and len(self._entradas) > 1:
+            chave, (casco, tamanho) = self._entradas.popitem(last=False)
+            self._bytes_em_uso -= tamanho
+
+    def invalidar_arquivo(self, caminho: str):
+        """
+        Descarta todos os cascos construídos a partir de `caminho`
+        (por exemplo, quando a tabela de cotas de uma embarcação é substituída).
+        """
+        caminho = os.path.realpath(caminho)
+        with self._trava:
+            for chave in self._chaves_por_arquivo.pop(caminho, set()):
+                entrada = self._entradas.pop(chave, None)
+                if entrada is not None:
+                    self._bytes_em_uso -= entrada[1]
+            self._hashes.pop(caminho, None)
+
+    def limpar(self):
+        """Esvazia o cache e zera os contadores."""
+        with self._trava:
+            self._entradas.clear()
+            self._chaves_por_arquivo.clear()
+            self._hashes.clear()
+            self._bytes_em_uso = 0
+            self.acertos = 0
+            self.falhas = 0
+
+    def estatisticas(self) -> dict:
+        """
+        Returns:
+            dict: Acertos, falhas, número de entradas e memória em uso/limite.
+        """
+        with self._trava:
+            return {
+                'acertos': self.acertos,
+                'falhas': self.falhas,
+                'entradas': len(self._entradas),
+                'bytes_em_uso': self._bytes_em_uso,
+                'limite_bytes': self.limite_bytes,
+            }
+
+
+# Instância única usada por toda a aplicação
+cache_cascos = CacheCascos()
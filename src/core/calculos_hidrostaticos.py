@@ -1,27 +1,63 @@
 # src/core/calculos_hidrostaticos.py
 
-import pandas as pd
+from typing import TYPE_CHECKING
 import numpy as np
-from scipy.integrate import quad
-from scipy.optimize import fsolve
-from scipy.interpolate import interp1d, PchipInterpolator
 from .interpolacao import Casco
+from .calculos_vetorizados import calcular_linhas_vetorizado
+from .armazem_resultados import ArmazemResultados, normalizar_calado
+from .pool_calculo import publicar_casco, obter_executor, calcular_lote
+from .perfil_calculo import PerfilCalculo, resumir_perfil
+from ..utils.integrador import polinomio_por_partes, integrar_por_partes, n_trechos_integrados
 import concurrent.futures
+import contextlib
+import math
+import os
 import time
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _criar_interpolador(x, y, metodo_interp: str):
+    """
+    Interpolador scipy (PCHIP ou linear, nulo fora dos pontos) do motor por
+    calado ('quad'), integrado exatamente por trechos. O scipy só é importado
+    quando esse motor é usado.
+    """
+    from scipy.interpolate import PchipInterpolator, interp1d
+
+    if metodo_interp == 'pchip':
+        return PchipInterpolator(x, y, extrapolate=False)
+    return interp1d(x, y, kind='linear', bounds_error=False, fill_value=0.0)
+
 
 class PropriedadesHidrostaticas:
     """
     Calcula e armazena todas as propriedades hidrostáticas para um único calado.
+
+    As integrais ao longo do comprimento são feitas analiticamente sobre os
+    polinômios por partes dos interpoladores (linear ou PCHIP), sem quadratura.
+
+    Com `perfilar=True`, o tempo e os trechos integrados de cada fase
+    (`_calcular_*`) ficam registrados em `self.perfil`.
+
+    `secoes` pode trazer as áreas e os momentos verticais de todas as balizas
+    neste calado já calculados (por exemplo, para um lote inteiro de calados
+    de uma vez); caso contrário, são consultados nas curvas do casco.
     """
-    def __init__(self, casco: Casco, calado: float, densidade: float, metodo_interp: str):
+    def __init__(self, casco: Casco, calado: float, densidade: float, metodo_interp: str, perfilar: bool = False,
+                 secoes: tuple | None = None):
         self.casco = casco
         self.calado = calado
         self.densidade = densidade
         self.metodo_interp = metodo_interp
         
-        # Dicionário para armazenar as áreas de cada seção
+        # Dicionários para armazenar as áreas e os momentos verticais de cada seção
         self.areas_secoes = {}
+        self.momentos_secoes = {}
+
+        # Meia-boca de cada baliza (X -> Y) no calado atual
+        self.meias_bocas = {}
         
         # Propriedades da linha d'água a serem calculadas
         self.x_re = None
@@ -58,72 +94,45 @@ class PropriedadesHidrostaticas:
         self.cwp = None # Coeficiente do Plano de Flutuação
         self.cm = None  # Coeficiente de Seção Mestra
 
-        
+        # Instrumentação opcional das fases
+        self.perfil = PerfilCalculo(calado) if perfilar else None
+        self._secoes = secoes
 
         self._calcular_todas_propriedades()
 
+    def _fase(self, nome: str):
+        """Contexto que mede a fase `nome` quando a instrumentação está ativa."""
+        return self.perfil.fase(nome) if self.perfil is not None else contextlib.nullcontext()
+
+    def _integrar(self, interpolador, a: float, b: float, potencia: int = 0, centro: float = 0.0) -> float:
+        """
+        Integral exata de (x - centro)^potencia · f(x) em [a, b], com f o
+        polinômio por partes do interpolador.
+        """
+        x, coeficientes = polinomio_por_partes(interpolador)
+        if self.perfil is not None:
+            self.perfil.somar_chamadas(n_trechos_integrados(x, a, b))
+        return integrar_por_partes(x, coeficientes, a, b, potencia, centro)
+
     def _calcular_dimensoes_linha_dagua(self):
         """
         Calcula as dimensões Lwl e Bwl para o calado atual.
         Adaptação do código procedural fornecido para a estrutura da classe.
         """
         # --- Cálculo da Boca na Linha d'Água (Bwl) ---
-        meia_boca_max = 0.0
-        for funcao_baliza in self.casco.funcoes_baliza.values():
-            meia_boca_atual = np.nan_to_num(float(funcao_baliza(self.calado)))
-            if meia_boca_atual > meia_boca_max:
-                meia_boca_max = meia_boca_atual
+        # Meia-boca de todas as balizas neste calado, avaliada uma única vez
+        self.meias_bocas = dict(zip(self.casco.posicoes_balizas, self.casco.compacto.meia_boca_malha(self.calado).tolist()))
+        meia_boca_max = max(self.meias_bocas.values(), default=0.0)
         self.bwl = meia_boca_max * 2
 
         # --- Cálculo do Comprimento na Linha d'Água (Lwl) ---
-        if self.casco.funcao_perfil:
-            funcao_raiz = lambda x: self.casco.funcao_perfil(x) - self.calado
-            
-            x_lim_re = self.casco.funcao_perfil.x.min()
-            x_lim_vante = self.casco.funcao_perfil.x.max()
-
-            # Tenta encontrar as interseções com fsolve
-            try:
-                # Tenta encontrar a raiz iniciando a busca perto do limite de ré.
-                # Um pequeno offset (1e-6) é usado para evitar problemas nos limites exatos.
-                x_re_calc = fsolve(funcao_raiz, x0=x_lim_re + 1e-6)[0]
-                if not (x_lim_re <= x_re_calc <= x_lim_vante): x_re_calc = x_lim_re
-            except:
-                x_re_calc = x_lim_re
-
-            try:
-                x_vante_calc = fsolve(funcao_raiz, x0=x_lim_vante - 1e-6)[0]
-                if not (x_lim_re <= x_vante_calc <= x_lim_vante): x_vante_calc = x_lim_vante
-            except:
-                x_vante_calc = x_lim_vante
-
-            self.x_re = min(x_re_calc, x_vante_calc)
-            self.x_vante = max(x_re_calc, x_vante_calc)
-            self.lwl = self.x_vante - self.x_re
-        else:
-            self.lwl = 0.0
-            self.x_re = 0.0
-            self.x_vante = 0.0
+        # As interseções do perfil da quilha com o calado são obtidas pelo casco,
+        # por troca de sinal nos pontos do perfil e raiz analítica no trecho.
+        x_re, x_vante = self.casco.intersecoes_perfil(self.calado)
+        self.x_re = float(x_re)
+        self.x_vante = float(x_vante)
+        self.lwl = self.x_vante - self.x_re
 
-    def _calcular_area_secao(self, x_baliza: float) -> float:
-        """
-        Calcula a área submersa de uma única seção transversal (baliza)
-        usando integração numérica.
-
-        Args:
-            x_baliza (float): A posição longitudinal (X) da baliza.
-
-        Returns:
-            float: A área da seção transversal submersa em metros quadrados.
-        """
-        # A função a ser integrada é 2 * meia_boca(z)
-        # O 'quad' integra a função 'self.casco.obter_meia_boca'
-        # desde z=0 (quilha aproximada) até z=self.calado.
-        area, erro = quad(lambda z: self.casco.obter_meia_boca(x_baliza, z), 0, self.calado)
-        
-        # Multiplicamos por 2 para obter a área total (bombordo + estibordo)
-        return area * 2
-    
     def _calcular_area_plano_flutuacao(self):
         """
         Calcula a área do plano de flutuação (AWP), considerando casos
@@ -134,7 +143,7 @@ class PropriedadesHidrostaticas:
             x for x in self.casco.posicoes_balizas 
             if x > self.x_re and x < self.x_vante
         ]
-        balizas_internas_y = [self.casco.obter_meia_boca(x, self.calado) for x in balizas_internas_x]
+        balizas_internas_y = [self.meias_bocas[x] for x in balizas_internas_x]
 
         # 2. Lógica condicional para as extremidades (x_re e x_vante)
         baliza_popa_x = min(self.casco.posicoes_balizas)
@@ -143,13 +152,13 @@ class PropriedadesHidrostaticas:
 
         # Verifica a extremidade de ré
         if abs(self.x_re - baliza_popa_x) < tolerancia:
-            y_re = self.casco.obter_meia_boca(baliza_popa_x, self.calado)
+            y_re = self.meias_bocas[baliza_popa_x]
         else:
             y_re = 0.0
 
         # Verifica a extremidade de vante
         if abs(self.x_vante - baliza_proa_x) < tolerancia:
-            y_vante = self.casco.obter_meia_boca(baliza_proa_x, self.calado)
+            y_vante = self.meias_bocas[baliza_proa_x]
         else:
             y_vante = 0.0
 
@@ -167,12 +176,9 @@ class PropriedadesHidrostaticas:
         x_pontos_unicos = [p[0] for p in pontos_unicos]
         y_pontos_unicos = [p[1] for p in pontos_unicos]
 
-        if self.metodo_interp == 'pchip':
-            self.interpolador_wl = PchipInterpolator(x_pontos_unicos, y_pontos_unicos, extrapolate=False)
-        else:
-            self.interpolador_wl = interp1d(x_pontos_unicos, y_pontos_unicos, kind='linear', bounds_error=False, fill_value=0.0)
+        self.interpolador_wl = _criar_interpolador(x_pontos_unicos, y_pontos_unicos, self.metodo_interp)
 
-        meia_area, erro = quad(self.interpolador_wl, self.x_re, self.x_vante)
+        meia_area = self._integrar(self.interpolador_wl, self.x_re, self.x_vante)
         self.area_plano_flutuacao = meia_area * 2
 
     def _calcular_volume_deslocamento(self):
@@ -230,13 +236,10 @@ class PropriedadesHidrostaticas:
         areas_pontos_unicos = [p[1] for p in pontos_unicos]
 
         # Cria o interpolador e o ARMAZENA no atributo da classe
-        if self.metodo_interp == 'pchip':
-            self.interpolador_areas = PchipInterpolator(x_pontos_unicos, areas_pontos_unicos, extrapolate=False)
-        else:
-            self.interpolador_areas = interp1d(x_pontos_unicos, areas_pontos_unicos, kind='linear', bounds_error=False, fill_value=0.0)
+        self.interpolador_areas = _criar_interpolador(x_pontos_unicos, areas_pontos_unicos, self.metodo_interp)
         
         # Integração Numérica usando o interpolador recém-criado
-        volume_calculado, erro = quad(self.interpolador_areas, self.x_re, self.x_vante)
+        volume_calculado = self._integrar(self.interpolador_areas, self.x_re, self.x_vante)
 
         self.volume = volume_calculado
         self.deslocamento = self.volume * self.densidade
@@ -250,11 +253,8 @@ class PropriedadesHidrostaticas:
             self.lcf = 0.0
             return
             
-        # 1. Define a função a ser integrada: x * y(x)
-        funcao_momento_longitudinal = lambda x: x * self.interpolador_wl(x)
-        
-        # 2. Integra para obter o momento longitudinal da meia-área
-        momento_long_meia_area, erro = quad(funcao_momento_longitudinal, self.x_re, self.x_vante)
+        # 1 e 2. Integra x * y(x) para obter o momento longitudinal da meia-área
+        momento_long_meia_area = self._integrar(self.interpolador_wl, self.x_re, self.x_vante, potencia=1)
         
         # 3. Calcula a meia-área
         meia_area = self.area_plano_flutuacao / 2
@@ -275,11 +275,8 @@ class PropriedadesHidrostaticas:
             self.lcb = 0.0
             return
             
-        # 1. Define a função a ser integrada: x * A(x)
-        funcao_momento_longitudinal = lambda x: x * self.interpolador_areas(x)
-        
-        # 2. Integra para obter o momento longitudinal do volume
-        momento_long_volume, erro = quad(funcao_momento_longitudinal, self.x_re, self.x_vante)
+        # 1 e 2. Integra x * A(x) para obter o momento longitudinal do volume
+        momento_long_volume = self._integrar(self.interpolador_areas, self.x_re, self.x_vante, potencia=1)
         
         # 3. LCB é o momento dividido pelo volume
         if abs(self.volume) > 1e-6:
@@ -287,121 +284,55 @@ class PropriedadesHidrostaticas:
         else:
             self.lcb = 0.0
 
-    def _calcular_momento_vertical_secao(self, x_baliza: float) -> float:
-        """
-        Calcula o momento de área vertical de uma única seção transversal.
-        Integral de z * 2y(z) dz
-        """
-        # A função a ser integrada é: z * (2 * meia_boca(z))
-        funcao_momento = lambda z: z * 2 * self.casco.obter_meia_boca(x_baliza, z)
-        
-        # Integra de 0 até o calado atual
-        momento_vertical, erro = quad(funcao_momento, 0, self.calado)
-        return momento_vertical
-
     def _calcular_vcb(self):
         """
-        Calcula a posição vertical do centro de carena (VCB) pela
-        integração dos momentos verticais das seções.
+        Calcula a posição vertical do centro de carena (VCB) pela integração
+        longitudinal dos momentos verticais das seções, sobre as mesmas
+        balizas (dentro da linha d'água) usadas no volume.
         """
         if self.volume == 0.0:
             self.vcb = 0.0
             return
 
-        # 1. Calcula o momento vertical para cada baliza
-        momentos_verticais = {}
-        for x_pos in self.casco.posicoes_balizas:
-            momentos_verticais[x_pos] = self._calcular_momento_vertical_secao(x_pos)
-            
-        # 2. Cria um interpolador para a curva de momentos verticais (Momento = f(x))
-        x_pontos = list(momentos_verticais.keys())
-        momentos_pontos = list(momentos_verticais.values())
-        
-        pontos_ordenados = sorted(zip(x_pontos, momentos_pontos))
-        x_pontos_sorted = [p[0] for p in pontos_ordenados]
-        momentos_pontos_sorted = [p[1] for p in pontos_ordenados]
-        
-        if self.metodo_interp == 'pchip':
-            interpolador_momentos = PchipInterpolator(x_pontos_sorted, momentos_pontos_sorted, extrapolate=False)
-        else:
-            interpolador_momentos = interp1d(x_pontos_sorted, momentos_pontos_sorted, kind='linear', bounds_error=False, fill_value=0.0)
+        # 1. Momento vertical de cada baliza (já obtido junto com as áreas,
+        #    a partir das curvas cumulativas do casco)
+        momentos_verticais_secoes = self.momentos_secoes
+
+        # 2. Filtra as balizas que estão estritamente DENTRO da linha d'água
+        x_internos = [x for x in self.casco.posicoes_balizas if x > self.x_re and x < self.x_vante]
+        momentos_internos = [momentos_verticais_secoes[x] for x in x_internos]
+
+        # 3. Lógica condicional para os momentos nas extremidades
+        baliza_popa_x = min(self.casco.posicoes_balizas)
+        baliza_proa_x = max(self.casco.posicoes_balizas)
+        tolerancia = 1e-3
+
+        momento_re = momentos_verticais_secoes.get(baliza_popa_x, 0.0) if abs(self.x_re - baliza_popa_x) < tolerancia else 0.0
+        momento_vante = momentos_verticais_secoes.get(baliza_proa_x, 0.0) if abs(self.x_vante - baliza_proa_x) < tolerancia else 0.0
+
+        # 4. Constrói a lista final de pontos para a interpolação da curva de momentos
+        x_pontos = [self.x_re] + x_internos + [self.x_vante]
+        momentos_pontos = [momento_re] + momentos_internos + [momento_vante]
+
+        # 5. Criação do Interpolador (MomentoVertical = f(x)) e Integração
+        if len(x_pontos) < 2:
+            self.vcb = 0.0
+            return
 
-        # 3. Integra a curva de momentos ao longo do comprimento para obter o momento total do volume
-        momento_total_vertical, erro = quad(interpolador_momentos, self.x_re, self.x_vante)
+        pontos_unicos = sorted(list(set(zip(x_pontos, momentos_pontos))))
+        x_pontos_unicos = [p[0] for p in pontos_unicos]
+        momentos_pontos_unicos = [p[1] for p in pontos_unicos]
+
+        interpolador_momentos = _criar_interpolador(x_pontos_unicos, momentos_pontos_unicos, self.metodo_interp)
 
-        # 4. VCB é o momento vertical total dividido pelo volume
+        momento_total_vertical = self._integrar(interpolador_momentos, self.x_re, self.x_vante)
+
+        # 6. VCB é o momento vertical total dividido pelo volume
         if abs(self.volume) > 1e-6:
             self.vcb = momento_total_vertical / self.volume
         else:
             self.vcb = 0.0
 
-    # # --- NOVO MÉTODO AUXILIAR ---
-    # def _calcular_momento_vertical_secao(self, x_baliza: float) -> float:
-    #     """
-    #     Calcula o momento de área vertical de uma única seção transversal em
-    #     relação à quilha (z=0). Integral de z * 2y(z) dz.
-    #     """
-    #     # A função a ser integrada é: z * largura_da_secao(z)
-    #     funcao_momento = lambda z: z * 2 * self.casco.obter_meia_boca(x_baliza, z)
-        
-    #     # Integra de 0 (quilha) até o calado atual
-    #     momento_vertical, erro = quad(funcao_momento, 0, self.calado)
-    #     return momento_vertical
-
-    # # --- MÉTODO _CALCULAR_VCB REESCRITO ---
-    # def _calcular_vcb(self):
-    #     """
-    #     Calcula a posição vertical do centro de carena (VCB) pela
-    #     integração longitudinal dos momentos verticais das seções.
-    #     """
-    #     if self.volume == 0.0:
-    #         self.vcb = 0.0
-    #         return
-
-    #     # 1. Calcula o momento vertical para cada baliza do casco
-    #     momentos_verticais_secoes = {
-    #         x: self._calcular_momento_vertical_secao(x) 
-    #         for x in self.casco.posicoes_balizas
-    #     }
-
-    #     # 2. Filtra as balizas que estão estritamente DENTRO da linha d'água
-    #     x_internos = [x for x in self.casco.posicoes_balizas if x > self.x_re and x < self.x_vante]
-    #     momentos_internos = [momentos_verticais_secoes[x] for x in x_internos]
-
-    #     # 3. Lógica condicional para os momentos nas extremidades
-    #     baliza_popa_x = min(self.casco.posicoes_balizas)
-    #     baliza_proa_x = max(self.casco.posicoes_balizas)
-    #     tolerancia = 1e-3
-
-    #     momento_re = momentos_verticais_secoes.get(baliza_popa_x, 0.0) if abs(self.x_re - baliza_popa_x) < tolerancia else 0.0
-    #     momento_vante = momentos_verticais_secoes.get(baliza_proa_x, 0.0) if abs(self.x_vante - baliza_proa_x) < tolerancia else 0.0
-
-    #     # 4. Constrói a lista final de pontos para a interpolação da curva de momentos
-    #     x_pontos = [self.x_re] + x_internos + [self.x_vante]
-    #     momentos_pontos = [momento_re] + momentos_internos + [momento_vante]
-
-    #     # 5. Criação do Interpolador (MomentoVertical = f(x)) e Integração
-    #     if len(x_pontos) < 2:
-    #         self.vcb = 0.0
-    #         return
-            
-    #     pontos_unicos = sorted(list(set(zip(x_pontos, momentos_pontos))))
-    #     x_pontos_unicos = [p[0] for p in pontos_unicos]
-    #     momentos_pontos_unicos = [p[1] for p in pontos_unicos]
-
-    #     if self.metodo_interp == 'pchip':
-    #         interpolador_momentos = PchipInterpolator(x_pontos_unicos, momentos_pontos_unicos, extrapolate=False)
-    #     else:
-    #         interpolador_momentos = interp1d(x_pontos_unicos, momentos_pontos_unicos, kind='linear', bounds_error=False, fill_value=0.0)
-        
-    #     momento_total_vertical, erro = quad(interpolador_momentos, self.x_re, self.x_vante)
-
-    #     # 6. VCB é o momento vertical total do volume, dividido pelo volume
-    #     if abs(self.volume) > 1e-6:
-    #         self.vcb = momento_total_vertical / self.volume
-    #     else:
-    #         self.vcb = 0.0
-
     def _calcular_momento_inercia_transversal(self):
         """
         Calcula o momento de inércia transversal (I_T) da área do plano de flutuação.
@@ -409,7 +340,7 @@ class PropriedadesHidrostaticas:
         # 1. Filtra as balizas que estão estritamente DENTRO da linha d'água
         x_internos = [x for x in self.casco.posicoes_balizas if x > self.x_re and x < self.x_vante]
         # Calcula a meia-boca ao cubo para estas balizas
-        y_cubed_internas = [self.casco.obter_meia_boca(x, self.calado)**3 for x in x_internos]
+        y_cubed_internas = [self.meias_bocas[x]**3 for x in x_internos]
 
         # 2. Lógica condicional para as extremidades
         baliza_popa_x = min(self.casco.posicoes_balizas)
@@ -419,14 +350,14 @@ class PropriedadesHidrostaticas:
         # Verifica a extremidade de ré
         if abs(self.x_re - baliza_popa_x) < tolerancia:
             # Se x_re coincide com a baliza de popa, usa a meia boca daquela baliza
-            y_cubed_re = self.casco.obter_meia_boca(baliza_popa_x, self.calado)**3
+            y_cubed_re = self.meias_bocas[baliza_popa_x]**3
         else:
             # Caso contrário, a meia boca na interseção é zero
             y_cubed_re = 0.0
 
         if abs(self.x_vante - baliza_proa_x) < tolerancia:
             # Se x_vante coincide com a baliza de proa, usa a meia boca daquela baliza
-            y_cubed_vante = self.casco.obter_meia_boca(baliza_proa_x, self.calado)**3
+            y_cubed_vante = self.meias_bocas[baliza_proa_x]**3
         else:
             # Caso contrário, a meia boca na interseção é zero
             y_cubed_vante = 0.0
@@ -444,12 +375,9 @@ class PropriedadesHidrostaticas:
         x_pontos_unicos = [p[0] for p in pontos_unicos]
         y_cubed_pontos_unicos = [p[1] for p in pontos_unicos]
 
-        if self.metodo_interp == 'pchip':
-            interpolador_y3 = PchipInterpolator(x_pontos_unicos, y_cubed_pontos_unicos, extrapolate=False)
-        else:
-            interpolador_y3 = interp1d(x_pontos_unicos, y_cubed_pontos_unicos, kind='linear', bounds_error=False, fill_value=0.0)
+        interpolador_y3 = _criar_interpolador(x_pontos_unicos, y_cubed_pontos_unicos, self.metodo_interp)
         
-        integral_y3, erro = quad(interpolador_y3, self.x_re, self.x_vante)
+        integral_y3 = self._integrar(interpolador_y3, self.x_re, self.x_vante)
         
         # Fórmula: I_T = (2/3) * integral de y³ dx
         self.momento_inercia_transversal = (2/3) * integral_y3
@@ -464,11 +392,8 @@ class PropriedadesHidrostaticas:
             self.momento_inercia_longitudinal = 0.0
             return
             
-        # 1. Define a função a ser integrada: (x - LCF)² * y(x)
-        funcao_momento_inercia = lambda x: ((x - self.lcf)**2) * self.interpolador_wl(x)
-        
-        # 2. Integra para obter o momento de inércia da meia-área
-        momento_meia_area, erro = quad(funcao_momento_inercia, self.x_re, self.x_vante)
+        # 1 e 2. Integra (x - LCF)² * y(x) para obter o momento de inércia da meia-área
+        momento_meia_area = self._integrar(self.interpolador_wl, self.x_re, self.x_vante, potencia=2, centro=self.lcf)
         
         # 3. O momento de inércia total é o dobro do momento da meia-área
         self.momento_inercia_longitudinal = momento_meia_area * 2
@@ -532,38 +457,67 @@ class PropriedadesHidrostaticas:
         print(f"\n--- Calculando propriedades para o calado T = {self.calado:.3f} m ---")
         
         # 1. Cálculos de Geometria e Áreas
-        self._calcular_dimensoes_linha_dagua()
-        self._calcular_area_plano_flutuacao()
-        self._calcular_lcf()
-        for x_pos in self.casco.posicoes_balizas:
-            self.areas_secoes[x_pos] = self._calcular_area_secao(x_pos)
+        with self._fase('dimensoes_linha_dagua'):
+            self._calcular_dimensoes_linha_dagua()
+        with self._fase('area_plano_flutuacao'):
+            self._calcular_area_plano_flutuacao()
+        with self._fase('lcf'):
+            self._calcular_lcf()
+        with self._fase('areas_secoes'):
+            # Áreas e momentos verticais de todas as seções em uma única consulta
+            if self._secoes is not None:
+                areas, momentos = (np.asarray(v, dtype=float) for v in self._secoes)
+            else:
+                areas, momentos = (v[:, 0] for v in self.casco.bonjean.areas_nas_balizas(self.calado))
+            self.areas_secoes = dict(zip(self.casco.posicoes_balizas, areas.tolist()))
+            self.momentos_secoes = dict(zip(self.casco.posicoes_balizas, momentos.tolist()))
         
         # 2. Cálculos baseados em Volume
         # O cálculo de volume agora também cria o self.interpolador_areas
-        self._calcular_volume_deslocamento()
+        with self._fase('volume_deslocamento'):
+            self._calcular_volume_deslocamento()
         # Com o volume e o interpolador_areas prontos, podemos calcular o LCB
-        self._calcular_lcb()
+        with self._fase('lcb'):
+            self._calcular_lcb()
         # Com a Área de flutuação e o Volume, podemos calcular o VCB
-        self._calcular_vcb()
+        with self._fase('vcb'):
+            self._calcular_vcb()
         
         # O cálculo de I_T e I_L pode ser feito após a AWP e LCF serem conhecidos
-        self._calcular_momento_inercia_transversal()
-        self._calcular_momento_inercia_longitudinal()
-
-        self._calcular_propriedades_derivadas()
-
-def calcular_propriedades_para_um_calado(args):
+        with self._fase('momento_inercia_transversal'):
+            self._calcular_momento_inercia_transversal()
+        with self._fase('momento_inercia_longitudinal'):
+            self._calcular_momento_inercia_longitudinal()
+
+        with self._fase('propriedades_derivadas'):
+            self._calcular_propriedades_derivadas()
+
+# Colunas da tabela hidrostática, na ordem em que são exibidas
+COLUNAS_RESULTADOS = [
+    'Calado (m)', 'Volume (m³)', 'Desloc. (t)', 'AWP (m²)', 'LWL (m)', 'BWL (m)',
+    'LCB (m)', 'VCB (m)', 'LCF (m)', 'BMt (m)', 'KMt (m)', 'BMl (m)', 'KMl (m)',
+    'TPC (t/cm)', 'MTc (t·m/cm)', 'Cb', 'Cp', 'Cwp', 'Cm',
+]
+
+# Coluna acrescentada pelo refinamento adaptativo: nível de bisseção em que o
+# calado entrou (0 = malha inicial)
+COLUNA_REFINAMENTO = 'Refinamento'
+# Curvas verificadas pelo refinamento adaptativo
+COLUNAS_REFINAMENTO_ADAPTATIVO = ('Desloc. (t)', 'KMt (m)', 'LCF (m)')
+
+def calcular_propriedades_para_um_calado(args, secoes: tuple | None = None):
     """
     Função "worker" que será executada em um processo separado.
     Ela recebe todos os dados necessários e retorna um dicionário de resultados.
     """
-    casco, calado, densidade, metodo_interp = args
+    casco, calado, densidade, metodo_interp = args[:4]
+    perfilar = len(args) > 4 and args[4]
     
     # Cria o objeto de propriedades, que executa todos os cálculos para este calado
-    props = PropriedadesHidrostaticas(casco, calado, densidade, metodo_interp)
+    props = PropriedadesHidrostaticas(casco, calado, densidade, metodo_interp, perfilar=perfilar, secoes=secoes)
     
     # Retorna um dicionário com os resultados
-    return {
+    linha = {
         'Calado (m)': calado,
         'Volume (m³)': props.volume, 'Desloc. (t)': props.deslocamento,
         'AWP (m²)': props.area_plano_flutuacao, 'LWL (m)': props.lwl, 'BWL (m)': props.bwl,
@@ -573,6 +527,77 @@ def calcular_propriedades_para_um_calado(args):
         'TPC (t/cm)': props.tpc, 'MTc (t·m/cm)': props.mtc, 'Cb': props.cb, 'Cp': props.cp,
         'Cwp': props.cwp, 'Cm': props.cm,
     }
+    return (linha, props.perfil.registros) if perfilar else linha
+
+def calcular_lote_de_calados(casco: Casco, calados: list, densidade: float, metodo_interp: str, motor: str,
+                             perfilar: bool = False):
+    """
+    Calcula um lote de calados no processo atual com o motor escolhido.
+
+    Returns:
+        list: Um dicionário de resultados por calado, na ordem recebida. Com
+              `perfilar=True`, retorna a tupla (linhas, registros de perfil).
+    """
+    if motor == 'vetorizado':
+        inicio = time.perf_counter()
+        linhas = calcular_linhas_vetorizado(casco, calados, densidade, metodo_interp)
+        if not perfilar:
+            return linhas
+        # O lote inteiro é uma única fase; o tempo é repartido igualmente entre os calados
+        tempo_por_calado = (time.perf_counter() - inicio) / max(len(calados), 1)
+        return linhas, [{'calado': calado, 'fase': 'lote_vetorizado', 'tempo_s': tempo_por_calado, 'chamadas': 0}
+                        for calado in calados]
+
+    # Áreas e momentos de todas as seções para o lote inteiro, numa única
+    # consulta à tabela de Bonjean do casco
+    areas, momentos = casco.bonjean.areas_nas_balizas(calados)
+    if not perfilar:
+        return [calcular_propriedades_para_um_calado((casco, calado, densidade, metodo_interp), (areas[:, i], momentos[:, i]))
+                for i, calado in enumerate(calados)]
+    linhas, registros = [], []
+    for i, calado in enumerate(calados):
+        linha, registros_calado = calcular_propriedades_para_um_calado(
+            (casco, calado, densidade, metodo_interp, True), (areas[:, i], momentos[:, i]))
+        linhas.append(linha)
+        registros.extend(registros_calado)
+    return linhas, registros
+
+# --- Escolha automática do executor ---
+# O "trabalho" de um cálculo é medido em pares (baliza × calado).
+# Abaixo destes limites, o custo de despachar tarefas supera o ganho do paralelismo.
+LIMIAR_QUAD_LOCAL = 2_500           # ~40 µs por par no caminho por calado (~0,1 s)
+LIMIAR_VETORIZADO_LOCAL = 2_000_000 # ~0.1 µs por par no caminho vetorizado
+LIMIAR_VETORIZADO_THREADS = 50_000_000
+LOTES_POR_WORKER = 4
+MIN_CALADOS_POR_LOTE_VETORIZADO = 32
+
+def escolher_executor(motor: str, n_calados: int, n_balizas: int, n_workers: int) -> str:
+    """
+    Escolhe onde executar o cálculo a partir do tamanho do problema.
+
+    O motor vetorizado passa a maior parte do tempo dentro do NumPy (que libera
+    o GIL), então threads bastam até problemas muito grandes; o motor por calado
+    ('quad', integração exata por trechos) faz muitas operações pequenas com o
+    GIL preso e só escala com processos, que compensam a partir de ~0,1 s de cálculo.
+
+    Returns:
+        str: 'local' (no próprio processo), 'threads' ou 'processos'.
+    """
+    trabalho = n_calados * n_balizas
+    if n_workers <= 1 or n_calados <= 1:
+        return 'local'
+    if motor == 'vetorizado':
+        if trabalho < LIMIAR_VETORIZADO_LOCAL:
+            return 'local'
+        return 'threads' if trabalho < LIMIAR_VETORIZADO_THREADS else 'processos'
+    return 'local' if trabalho < LIMIAR_QUAD_LOCAL else 'processos'
+
+def calcular_tamanho_lote(motor: str, n_calados: int, n_workers: int) -> int:
+    """Divide os calados em alguns lotes por worker, para amortizar o despacho sem perder o balanceamento."""
+    tamanho = math.ceil(n_calados / (LOTES_POR_WORKER * n_workers))
+    if motor == 'vetorizado':
+        tamanho = max(tamanho, MIN_CALADOS_POR_LOTE_VETORIZADO)
+    return max(1, tamanho)
 
 # ==============================================================================
 # CALCULADORA HIDROSTÁTICA - ESCOLHA UMA DAS VERSÕES ABAIXO
@@ -610,26 +635,257 @@ def calcular_propriedades_para_um_calado(args):
 class CalculadoraHidrostatica:
     """
     Versão paralela (multiprocessing) para máxima performance.
+
+    O motor 'quad' calcula cada calado com `PropriedadesHidrostaticas`
+    (integração exata dos polinômios por trechos; o nome vem da antiga
+    quadratura adaptativa e é mantido nas chaves e URLs já gravadas);
+    o motor 'vetorizado' calcula lotes de calados de uma só vez com NumPy.
+    O executor ('local', 'threads' ou 'processos') é escolhido automaticamente
+    pelo tamanho do problema quando `executor='auto'`, e os calados são
+    despachados em lotes de `tamanho_lote` (automático se None).
+
+    Se um `ArmazemResultados` for informado, apenas os calados ainda não
+    armazenados para este casco, densidade e método são calculados.
+
+    Um callback `progresso(concluidos, total, novas_linhas)` pode ser passado a
+    `calcular_curvas` para acompanhar o cálculo lote a lote (usado pelas tarefas
+    em segundo plano).
+
+    Com `perfilar=True`, cada lote devolve também os registros de tempo por
+    fase de cada calado (inclusive dos workers), acumulados em
+    `self.registros_perfil` e resumidos por `calcular_curvas_perfiladas`.
     """
-    def __init__(self, casco: Casco, densidade: float, metodo_interp: str):
+    def __init__(self, casco: Casco, densidade: float, metodo_interp: str, motor: str = 'quad',
+                 armazem: ArmazemResultados | None = None, vessel_id: int | None = None,
+                 executor: str = 'auto', max_workers: int | None = None, tamanho_lote: int | None = None,
+                 perfilar: bool = False):
         self.casco = casco
         self.densidade = densidade
         self.metodo_interp = metodo_interp
-        
-    def calcular_curvas(self, lista_de_calados: list) -> pd.DataFrame:
+        self.motor = motor
+        self.armazem = armazem
+        self.vessel_id = vessel_id
+        self.executor = executor
+        self.max_workers = max_workers
+        self.tamanho_lote = tamanho_lote
+        self.perfilar = perfilar
+        self.registros_perfil = []
+        
+    def calcular_curvas(self, lista_de_calados: list, progresso=None) -> 'pd.DataFrame':
+        """Calcula a tabela hidrostática completa, ordenada por calado."""
+        import pandas as pd
+
+        linhas = self.calcular_curvas_stream(lista_de_calados, progresso, incremental=progresso is not None)
+        return pd.DataFrame(list(linhas), columns=COLUNAS_RESULTADOS)
+
+    def calcular_curvas_perfiladas(self, lista_de_calados: list, progresso=None) -> tuple['pd.DataFrame', 'pd.DataFrame']:
+        """
+        Calcula a tabela hidrostática com a instrumentação das fases ativada.
+
+        Returns:
+            tuple: A tabela hidrostática e o resumo do tempo por fase
+                   (`resumir_perfil`), somado sobre todos os calados calculados.
+        """
+        perfilar_antes, self.perfilar = self.perfilar, True
+        try:
+            resultados = self.calcular_curvas(lista_de_calados, progresso)
+        finally:
+            self.perfilar = perfilar_antes
+        return resultados, resumir_perfil(self.registros_perfil)
+
+    def calcular_curvas_adaptativas(self, calado_min: float, calado_max: float, n_inicial: int = 9,
+                                    tolerancia: float = 1e-3, max_calados: int = 200, intervalo_minimo: float = 1e-3,
+                                    colunas: tuple = COLUNAS_REFINAMENTO_ADAPTATIVO, progresso=None) -> 'pd.DataFrame':
+        """
+        Calcula a tabela hidrostática com espaçamento adaptativo dos calados.
+
+        Parte de uma malha grossa de `n_inicial` calados e, a cada nível,
+        calcula o ponto médio dos intervalos ainda ativos (todos num único
+        `calcular_curvas`, aproveitando o armazém e os executores). Um intervalo
+        só é dividido de novo se, no ponto médio, alguma das `colunas` se
+        afastar da interpolação linear entre as extremidades mais do que
+        `tolerancia` × a amplitude da coluna na malha inicial; onde as curvas
+        são quase retas, o refinamento para logo. Se `max_calados` não der
+        para todos os intervalos de um nível, os de maior desvio têm prioridade.
+
+        Args:
+            calado_min (float): Menor calado.
+            calado_max (float): Maior calado.
+            n_inicial (int, optional): Calados da malha inicial (mínimo 2).
+            tolerancia (float, optional): Desvio admissível, relativo à amplitude de cada coluna.
+            max_calados (int, optional): Limite do total de calados calculados.
+            intervalo_minimo (float, optional): Intervalos menores que isto (m) não são divididos.
+            colunas (tuple, optional): Curvas verificadas.
+            progresso (callable, optional): `progresso(calculados, estimativa_total, novas_linhas)`,
+                chamado a cada nível, com as linhas novas do nível.
+
+        Returns:
+            pd.DataFrame: Tabela ordenada por calado, com a coluna `COLUNA_REFINAMENTO`
+                          indicando o nível em que cada calado foi acrescentado.
+        """
+        import pandas as pd
+
+        calados = np.linspace(calado_min, calado_max, max(int(n_inicial), 2)).tolist()
+        tabela = self.calcular_curvas(calados).set_index('Calado (m)', drop=False)
+        tabela[COLUNA_REFINAMENTO] = 0
+        registros = list(self.registros_perfil)
+        if progresso is not None:
+            progresso(len(tabela), len(tabela), tabela.to_dict('records'))
+
+        valores = tabela[list(colunas)]
+        escala = (valores.max() - valores.min()).to_numpy()
+        escala = np.where(escala > 1e-12, escala, 1.0)
+
+        # Intervalos a dividir, com o desvio que os colocou na lista (infinito na malha inicial)
+        ativos = [(a, b, np.inf) for a, b in zip(tabela.index[:-1], tabela.index[1:])]
+        nivel = 0
+        while ativos:
+            ativos = [intervalo for intervalo in ativos if intervalo[1] - intervalo[0] > 2 * intervalo_minimo]
+            vagas = max(max_calados - len(tabela), 0)
+            if len(ativos) > vagas:
+                # Sem calados para todos: ficam os intervalos de maior desvio
+                ativos = sorted(sorted(ativos, key=lambda intervalo: -intervalo[2])[:vagas])
+            if not ativos:
+                break
+            nivel += 1
+            medios = [(a + b) / 2 for a, b, _ in ativos]
+            novas = self.calcular_curvas(medios).set_index('Calado (m)', drop=False)
+            novas[COLUNA_REFINAMENTO] = nivel
+            registros.extend(self.registros_perfil)
+
+            proximos = []
+            for (a, b, _), medio in zip(ativos, novas.index):
+                linear = (tabela.loc[a, list(colunas)].to_numpy(dtype=float)
+                          + tabela.loc[b, list(colunas)].to_numpy(dtype=float)) / 2
+                desvio = np.max(np.abs(novas.loc[medio, list(colunas)].to_numpy(dtype=float) - linear) / escala)
+                if desvio > tolerancia:
+                    proximos.extend([(a, medio, desvio), (medio, b, desvio)])
+
+            tabela = pd.concat([tabela, novas]).sort_index()
+            ativos = proximos
+            print(f"Refinamento nível {nivel}: {len(novas)} calados novos, {len(proximos) // 2} intervalos ainda acima da tolerância.")
+            if progresso is not None:
+                progresso(len(tabela), len(tabela) + len(proximos), novas.to_dict('records'))
+
+        if progresso is not None:
+            # Intervalos que sobraram abaixo do intervalo mínimo ou além do limite não serão calculados
+            progresso(len(tabela), len(tabela), [])
+        self.registros_perfil = registros
+        return tabela.reset_index(drop=True)[COLUNAS_RESULTADOS + [COLUNA_REFINAMENTO]]
+
+    def calcular_curvas_stream(self, lista_de_calados: list, progresso=None, incremental: bool = True):
+        """
+        Gera as linhas da tabela hidrostática (um dicionário por calado) em
+        ordem crescente de calado, assim que cada uma fica disponível.
+
+        Os lotes são despachados todos de uma vez e podem terminar fora de
+        ordem; o gerador espera apenas pelo lote do próximo calado, e os lotes
+        seguintes que já terminaram ficam guardados nos seus futuros até a vez deles.
+        Linhas reaproveitadas do armazém saem imediatamente, e cada lote novo é
+        gravado no armazém ao ficar pronto.
+
+        Args:
+            lista_de_calados (list): Calados a calcular (valores negativos são ignorados).
+            progresso (callable, optional): `progresso(concluidos, total, novas_linhas)`,
+                chamado a cada grupo de linhas entregue.
+            incremental (bool): Se False, o executor local calcula tudo num lote só
+                (mais rápido, porém a primeira linha só sai no final).
+
+        Yields:
+            dict: Resultados de um calado, com as colunas de `COLUNAS_RESULTADOS`.
+        """
+        calados = sorted(calado for calado in lista_de_calados if calado >= 0)
+
+        em_cache = {}
+        if self.armazem is not None:
+            em_cache = self.armazem.buscar(self.casco.assinatura, self.densidade, self.metodo_interp, calados)
+        faltantes = [calado for calado in calados if normalizar_calado(calado) not in em_cache]
+        print(f"\n{len(calados) - len(faltantes)} de {len(calados)} calados reaproveitados do armazém de resultados.")
+
+        concluidos = 0
+        pendentes = []
+        self.registros_perfil = []
+        lotes = self._iterar_lotes(faltantes, incremental)
+        try:
+            for calado in calados:
+                chave = normalizar_calado(calado)
+                if chave in em_cache:
+                    linhas = [em_cache[chave]]
+                else:
+                    if not pendentes:
+                        pendentes = next(lotes)
+                        if self.armazem is not None:
+                            self.armazem.gravar(self.casco.assinatura, self.densidade, self.metodo_interp, pendentes, self.vessel_id)
+                        pendentes = list(reversed(pendentes))
+                    linhas = [pendentes.pop()]
+
+                concluidos += 1
+                if progresso is not None:
+                    progresso(concluidos, len(calados), linhas)
+                yield from linhas
+        finally:
+            lotes.close()
+
+    def _separar_perfil(self, resultado) -> list:
+        """Guarda os registros de perfil de um lote (se houver) e retorna apenas as linhas."""
+        if not self.perfilar:
+            return resultado
+        linhas, registros = resultado
+        self.registros_perfil.extend(registros)
+        return linhas
+
+    def _iterar_lotes(self, calados: list, incremental: bool = True):
+        """
+        Calcula os calados (já ordenados) com o motor e o executor escolhidos e
+        gera as linhas de cada lote, na ordem dos calados.
+        """
         start_time = time.perf_counter() # Inicia o cronômetro
-        
-        print(f"\nIniciando cálculo PARALELO das curvas para {len(lista_de_calados)} calados...")
-        
-        tarefas = [(self.casco, calado, self.densidade, self.metodo_interp) for calado in sorted(lista_de_calados) if calado >= 0]
-        lista_de_resultados = []
 
-        with concurrent.futures.ProcessPoolExecutor() as executor:
-            lista_de_resultados = list(executor.map(calcular_propriedades_para_um_calado, tarefas))
-            
+        n_workers = self.max_workers or os.cpu_count() or 1
+        executor = self.executor
+        if executor == 'auto':
+            executor = escolher_executor(self.motor, len(calados), len(self.casco.posicoes_balizas), n_workers)
+        tamanho_lote = self.tamanho_lote or calcular_tamanho_lote(self.motor, len(calados), n_workers)
+        lotes = [calados[i:i + tamanho_lote] for i in range(0, len(calados), tamanho_lote)]
+
+        print(f"\nIniciando cálculo das curvas para {len(calados)} calados "
+              f"(motor '{self.motor}', executor '{executor}', {len(lotes)} lotes)...")
+
+        if executor == 'local':
+            # Sem entrega incremental, o lote único aproveita ao máximo a vetorização
+            for lote in (lotes if incremental else [calados]):
+                yield self._separar_perfil(calcular_lote_de_calados(
+                    self.casco, lote, self.densidade, self.metodo_interp, self.motor, self.perfilar))
+
+        else:
+            if executor == 'threads':
+                pool = concurrent.futures.ThreadPoolExecutor(max_workers=n_workers)
+                futuros = [
+                    pool.submit(calcular_lote_de_calados, self.casco, lote, self.densidade, self.metodo_interp,
+                                self.motor, self.perfilar)
+                    for lote in lotes
+                ]
+            else:
+                # O casco vai uma única vez para a memória compartilhada; cada tarefa
+                # leva apenas o descritor e um lote de calados para o pool persistente.
+                pool = None
+                descritor = publicar_casco(self.casco)
+                futuros = [
+                    obter_executor(self.max_workers).submit(
+                        calcular_lote, (descritor, lote, self.densidade, self.metodo_interp, self.motor, self.perfilar))
+                    for lote in lotes
+                ]
+
+            try:
+                for futuro in futuros:
+                    yield self._separar_perfil(futuro.result())
+            finally:
+                # Se o consumidor parar antes do fim, os lotes ainda não iniciados são cancelados
+                for futuro in futuros:
+                    futuro.cancel()
+                if pool is not None:
+                    pool.shutdown(wait=False)
+
         end_time = time.perf_counter() # Para o cronômetro
         duration = end_time - start_time
-        print(f"Cálculo paralelo finalizado em {duration:.2f} segundos.")
-        
-        lista_de_resultados.sort(key=lambda r: r['Calado (m)'])
-        return pd.DataFrame(lista_de_resultados)
\ No newline at end of file
+        print(f"Cálculo finalizado em {duration:.2f} segundos.")
@@ -0,0 +1,286 @@
+# src/core/calculos_vetorizados.py
+
+from typing import TYPE_CHECKING
+import numpy as np
+# A quadratura de Gauss-Legendre de 3 pontos é exata para polinômios de grau <= 5,
+# o que cobre x²·f(x) com f cúbica por trechos.
+from .casco_compacto import _GAUSS_NOS, _GAUSS_PESOS
+from .interpolacao import Casco
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+TOLERANCIA_EXTREMIDADE = 1e-3
+
+
+def _avaliar_balizas(casco: Casco, calados: np.ndarray) -> np.ndarray:
+    """
+    Avalia a meia-boca de todas as balizas em todos os calados.
+
+    Returns:
+        np.ndarray: Matriz (n_balizas × n_calados) com as meias-bocas (NaN -> 0).
+    """
+    return casco.compacto.meia_boca_malha(calados)
+
+
+def _montar_nos_linha_dagua(posicoes: np.ndarray, valores: np.ndarray, x_re: np.ndarray, x_vante: np.ndarray,
+                            valor_re: np.ndarray, valor_vante: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Monta, para cada calado, os pontos [x_re] + balizas internas + [x_vante]
+    usados pelo caminho por calado, em matrizes retangulares.
+
+    As linhas com menos balizas internas são completadas repetindo x_vante,
+    o que gera trechos de largura nula que não contribuem para as integrais.
+
+    Returns:
+        tuple: Matrizes X e V (n_calados × n_balizas + 2) e o número de pontos válidos por linha.
+    """
+    n_balizas = len(posicoes)
+    inicio = np.searchsorted(posicoes, x_re, side='right')
+    fim = np.searchsorted(posicoes, x_vante, side='left')
+    n_internas = np.maximum(fim - inicio, 0)
+
+    colunas = np.arange(n_balizas + 2)[None, :]
+    indice_baliza = np.clip(inicio[:, None] + colunas - 1, 0, n_balizas - 1)
+    interna = (colunas >= 1) & (colunas <= n_internas[:, None])
+
+    X = np.where(interna, posicoes[indice_baliza], x_vante[:, None])
+    X[:, 0] = x_re
+    V = np.where(interna, np.take_along_axis(valores.T, indice_baliza, axis=1), valor_vante[:, None])
+    V[:, 0] = valor_re
+    return X, V, n_internas + 2
+
+
+def _derivadas_pchip(h: np.ndarray, m: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """
+    Derivadas nodais do PCHIP (Fritsch-Carlson, como no scipy) para linhas
+    com número variável de pontos válidos.
+    """
+    linhas = np.arange(h.shape[0])
+    d = np.zeros((h.shape[0], h.shape[1] + 1))
+
+    # Nós internos: média harmônica ponderada das inclinações vizinhas
+    with np.errstate(divide='ignore', invalid='ignore'):
+        w1 = 2 * h[:, 1:] + h[:, :-1]
+        w2 = h[:, 1:] + 2 * h[:, :-1]
+        condicao = (np.sign(m[:, 1:]) != np.sign(m[:, :-1])) | (m[:, 1:] == 0) | (m[:, :-1] == 0)
+        media = (w1 + w2) / (w1 / m[:, :-1] + w2 / m[:, 1:])
+    d[:, 1:-1] = np.where(condicao, 0.0, media)
+
+    def _extremidade(h0, h1, m0, m1):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            d_ext = ((2 * h0 + h1) * m0 - h0 * m1) / (h0 + h1)
+        sinal_trocado = np.sign(d_ext) != np.sign(m0)
+        excesso = (np.sign(m0) != np.sign(m1)) & (np.abs(d_ext) > 3 * np.abs(m0))
+        return np.where(sinal_trocado, 0.0, np.where(excesso, 3 * m0, d_ext))
+
+    ultimo = n - 1
+    dois_pontos = n == 2
+    i1 = np.minimum(1, h.shape[1] - 1)
+    d[:, 0] = np.where(dois_pontos, m[:, 0], _extremidade(h[:, 0], h[:, i1], m[:, 0], m[:, i1]))
+    a, b = np.maximum(ultimo - 1, 0), np.maximum(ultimo - 2, 0)
+    d[linhas, ultimo] = np.where(dois_pontos, m[linhas, 0],
+                                 _extremidade(h[linhas, a], h[linhas, b], m[linhas, a], m[linhas, b]))
+    return d
+
+
+def _avaliar_em_gauss(X: np.ndarray, V: np.ndarray, n: np.ndarray, metodo_interp: str,
+                      a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Avalia o interpolante (linear ou PCHIP) de cada linha nos nós de Gauss de
+    cada trecho, restrito ao intervalo [a, b] de cada linha.
+
+    Returns:
+        tuple: Posições x, pesos de integração e valores do interpolante, todos
+               com forma (n_calados × n_trechos × 3).
+    """
+    h = np.diff(X, axis=1)
+    valido = np.arange(h.shape[1])[None, :] < (n - 1)[:, None]
+    valido &= h > 0
+    h_seguro = np.where(valido, h, 1.0)
+    m = np.where(valido, np.diff(V, axis=1) / h_seguro, 0.0)
+
+    if metodo_interp == 'pchip':
+        d = _derivadas_pchip(np.where(valido, h, 0.0), m, n)
+        d_esq, d_dir = d[:, :-1], d[:, 1:]
+    else:
+        # Um trecho de Hermite com derivadas iguais à secante é a reta entre os pontos
+        d_esq = d_dir = m
+    d_esq = np.nan_to_num(d_esq)
+    d_dir = np.nan_to_num(d_dir)
+
+    # Limites de cada trecho recortados ao intervalo de integração
+    x0, x1 = X[:, :-1], X[:, 1:]
+    lo = np.clip(x0, a[:, None], b[:, None])
+    hi = np.clip(x1, a[:, None], b[:, None])
+    meia_largura = np.where(valido, (hi - lo) / 2, 0.0)
+
+    xg = ((lo + hi) / 2)[..., None] + meia_largura[..., None] * _GAUSS_NOS
+    t = (xg - x0[..., None]) / h_seguro[..., None]
+    t2, t3 = t * t, t * t * t
+    valores = ((2 * t3 - 3 * t2 + 1) * V[:, :-1, None]
+               + (t3 - 2 * t2 + t) * (h_seguro * d_esq)[..., None]
+               + (-2 * t3 + 3 * t2) * V[:, 1:, None]
+               + (t3 - t2) * (h_seguro * d_dir)[..., None])
+    pesos = meia_largura[..., None] * _GAUSS_PESOS
+    return xg, pesos, valores
+
+
+def _valores_extremidades(posicoes: np.ndarray, valores: np.ndarray, x_re: np.ndarray, x_vante: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Valor na extremidade só é usado se ela coincide com a baliza extrema (popa de espelho)."""
+    valor_re = np.where(np.abs(x_re - posicoes[0]) < TOLERANCIA_EXTREMIDADE, valores[0], 0.0)
+    valor_vante = np.where(np.abs(x_vante - posicoes[-1]) < TOLERANCIA_EXTREMIDADE, valores[-1], 0.0)
+    return valor_re, valor_vante
+
+
+def calcular_colunas_vetorizado(casco: Casco, lista_de_calados: list, densidade: float, metodo_interp: str) -> dict:
+    """
+    Calcula as curvas hidrostáticas para todos os calados de uma só vez,
+    avaliando o casco numa malha (baliza × calado) com NumPy.
+
+    As áreas e momentos verticais das seções vêm da tabela de Bonjean do
+    casco (`casco.bonjean`), sem nova integração; as integrais longitudinais usam Gauss-Legendre por trecho, exata
+    para o interpolante linear ou PCHIP construído sobre as mesmas balizas
+    do caminho por calado (motor 'quad').
+
+    Args:
+        casco (Casco): O casco já interpolado.
+        lista_de_calados (list): Calados a calcular (valores negativos são ignorados).
+        densidade (float): Densidade da água (t/m³).
+        metodo_interp (str): 'linear' ou 'pchip'.
+
+    Returns:
+        dict: Coluna -> array, com as colunas de `calcular_propriedades_para_um_calado`.
+    """
+    calados = np.array(sorted(c for c in lista_de_calados if c >= 0), dtype=float)
+    posicoes = np.asarray(casco.posicoes_balizas, dtype=float)
+
+    # --- 1. Grandezas por baliza e por calado ---
+    meias_bocas = _avaliar_balizas(casco, calados)
+    areas, momentos_verticais = casco.bonjean.areas_nas_balizas(calados)
+    x_re, x_vante = casco.intersecoes_perfil(calados)
+
+    lwl = x_vante - x_re
+    bwl = 2 * meias_bocas.max(axis=0, initial=0.0)
+    area_secao_mestra = areas.max(axis=0, initial=0.0)
+
+    # --- 2. Plano de flutuação (AWP, LCF, I_T, I_L) ---
+    y_re, y_vante = _valores_extremidades(posicoes, meias_bocas, x_re, x_vante)
+    X, V, n = _montar_nos_linha_dagua(posicoes, meias_bocas, x_re, x_vante, y_re, y_vante)
+    xg, pesos, y = _avaliar_em_gauss(X, V, n, metodo_interp, x_re, x_vante)
+
+    meia_area = (pesos * y).sum(axis=(1, 2))
+    area_plano_flutuacao = 2 * meia_area
+    lcf = np.divide((pesos * xg * y).sum(axis=(1, 2)), meia_area, out=np.zeros_like(meia_area), where=meia_area > 1e-6)
+    inercia_longitudinal = 2 * (pesos * (xg - lcf[:, None, None]) ** 2 * y).sum(axis=(1, 2))
+    inercia_longitudinal = np.where(area_plano_flutuacao == 0.0, 0.0, inercia_longitudinal)
+
+    cubos = meias_bocas ** 3
+    y3_re, y3_vante = _valores_extremidades(posicoes, cubos, x_re, x_vante)
+    X, V, n = _montar_nos_linha_dagua(posicoes, cubos, x_re, x_vante, y3_re, y3_vante)
+    xg, pesos, y3 = _avaliar_em_gauss(X, V, n, metodo_interp, x_re, x_vante)
+    inercia_transversal = (2 / 3) * (pesos * y3).sum(axis=(1, 2))
+
+    # --- 3. Volume, LCB e VCB ---
+    a_re, a_vante = _valores_extremidades(posicoes, areas, x_re, x_vante)
+    X, V, n = _montar_nos_linha_dagua(posicoes, areas, x_re, x_vante, a_re, a_vante)
+    xg, pesos, a = _avaliar_em_gauss(X, V, n, metodo_interp, x_re, x_vante)
+
+    volume = (pesos * a).sum(axis=(1, 2))
+    deslocamento = volume * densidade
+    lcb = np.divide((pesos * xg * a).sum(axis=(1, 2)), volume, out=np.zeros_like(volume), where=np.abs(volume) > 1e-6)
+
+    # Curva de momentos verticais sobre as mesmas balizas (dentro da linha d'água) do volume
+    mz_re, mz_vante = _valores_extremidades(posicoes, momentos_verticais, x_re, x_vante)
+    X, V, n = _montar_nos_linha_dagua(posicoes, momentos_verticais, x_re, x_vante, mz_re, mz_vante)
+    xg, pesos, mz = _avaliar_em_gauss(X, V, n, metodo_interp, x_re, x_vante)
+    vcb = np.divide((pesos * mz).sum(axis=(1, 2)), volume, out=np.zeros_like(volume), where=np.abs(volume) > 1e-6)
+
+    # --- 4. Propriedades derivadas ---
+    possui_volume = volume > 1e-6
+    bmt = np.divide(inercia_transversal, volume, out=np.zeros_like(volume), where=possui_volume)
+    bml = np.divide(inercia_longitudinal, volume, out=np.zeros_like(volume), where=possui_volume)
+    kmt = np.where(possui_volume, vcb + bmt, 0.0)
+    kml = np.where(possui_volume, vcb + bml, 0.0)
+    tpc = area_plano_flutuacao * densidade / 100.0
+    mtc = np.divide(inercia_longitudinal * densidade, 100 * lwl, out=np.zeros_like(lwl), where=lwl > 1e-6)
+
+    denominador_bloco = lwl * bwl * calados
+    cb = np.divide(volume, denominador_bloco, out=np.zeros_like(volume), where=denominador_bloco > 1e-6)
+    denominador_prismatico = area_secao_mestra * lwl
+    cp = np.divide(volume, denominador_prismatico, out=np.zeros_like(volume), where=denominador_prismatico > 1e-6)
+    denominador_plano_flutuacao = lwl * bwl
+    cwp = np.divide(area_plano_flutuacao, denominador_plano_flutuacao, out=np.zeros_like(volume), where=denominador_plano_flutuacao > 1e-6)
+    cm = np.divide(cb, cp, out=np.zeros_like(cb), where=cp > 1e-6)
+
+    return {
+        'Calado (m)': calados,
+        'Volume (m³)': volume, 'Desloc. (t)': deslocamento,
+        'AWP (m²)': area_plano_flutuacao, 'LWL (m)': lwl, 'BWL (m)': bwl,
+        'LCB (m)': lcb, 'VCB (m)': vcb, 'LCF (m)': lcf,
+        'BMt (m)': bmt, 'KMt (m)': kmt, 'BMl (m)': bml, 'KMl (m)': kml,
+        'TPC (t/cm)': tpc, 'MTc (t·m/cm)': mtc, 'Cb': cb, 'Cp': cp,
+        'Cwp': cwp, 'Cm': cm,
+    }
+
+
+def calcular_linhas_vetorizado(casco: Casco, lista_de_calados: list, densidade: float, metodo_interp: str) -> list:
+    """
+    Mesmo cálculo de `calcular_colunas_vetorizado`, como uma lista de
+    dicionários (um por calado), sem passar pelo pandas (usado pelos workers).
+    """
+    colunas = calcular_colunas_vetorizado(casco, lista_de_calados, densidade, metodo_interp)
+    nomes = list(colunas)
+    return [dict(zip(nomes, valores)) for valores in zip(*(colunas[nome].tolist() for nome in nomes))]
+
+
+def calcular_curvas_vetorizado(casco: Casco, lista_de_calados: list, densidade: float, metodo_interp: str) -> 'pd.DataFrame':
+    """
+    Tabela (DataFrame) de `calcular_colunas_vetorizado`, com o mesmo esquema
+    de `calcular_propriedades_para_um_calado`.
+    """
+    import pandas as pd
+
+    return pd.DataFrame(calcular_colunas_vetorizado(casco, lista_de_calados, densidade, metodo_interp))
+
+
+def comparar_com_quad(casco: Casco, lista_de_calados: list, densidade: float, metodo_interp: str,
+                      rtol: float = 1e-3, atol: float = 1e-6) -> 'pd.DataFrame':
+    """
+    Compara o motor vetorizado com o motor por calado ('quad'), que hoje
+    integra exatamente os interpoladores escalares de cada calado
+    (`PropriedadesHidrostaticas`) em vez de usar a Gauss-Legendre em lote.
+    Os dois leem as seções da tabela de Bonjean, então a comparação confere
+    as integrais ao longo do comprimento; a conferência com a quadratura
+    original fica nos valores de referência de tests/test_calculos_vetorizados.py.
+
+    Args:
+        rtol (float): Tolerância relativa aceita em cada propriedade.
+        atol (float): Tolerância absoluta (para propriedades próximas de zero).
+
+    Returns:
+        pd.DataFrame: Uma linha por propriedade com o maior desvio absoluto,
+                      o maior desvio relativo e se ficou dentro da tolerância.
+    """
+    import pandas as pd
+    from .calculos_hidrostaticos import calcular_propriedades_para_um_calado
+
+    vetorizado = calcular_curvas_vetorizado(casco, lista_de_calados, densidade, metodo_interp)
+    referencia = pd.DataFrame([
+        calcular_propriedades_para_um_calado((casco, calado, densidade, metodo_interp))
+        for calado in vetorizado['Calado (m)']
+    ])
+
+    linhas = []
+    for coluna in referencia.columns:
+        ref = referencia[coluna].to_numpy(dtype=float)
+        vet = vetorizado[coluna].to_numpy(dtype=float)
+        desvio = np.abs(vet - ref)
+        escala = np.maximum(np.abs(ref), atol)
+        linhas.append({
+            'Propriedade': coluna,
+            'Desvio Absoluto Máx.': desvio.max(initial=0.0),
+            'Desvio Relativo Máx.': (desvio / escala).max(initial=0.0),
+            'Dentro da Tolerância': bool(np.all(desvio <= atol + rtol * np.abs(ref))),
+        })
+    return pd.DataFrame(linhas)
@@ -0,0 +1,308 @@
+# src/core/casco_compacto.py
+
+import mmap
+import numpy as np
+
+# Nós e pesos da quadratura de Gauss-Legendre de 3 pontos no intervalo [-1, 1]
+_GAUSS_NOS = np.array([-np.sqrt(3 / 5), 0.0, np.sqrt(3 / 5)])
+_GAUSS_PESOS = np.array([5 / 9, 8 / 9, 5 / 9])
+
+
+def _nos_gauss(a, b) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Nós e pesos de Gauss-Legendre (3 pontos) para cada intervalo [a, b].
+
+    Returns:
+        tuple: Nós e pesos com forma (..., 3).
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    meia_largura = ((b - a) / 2)[..., None]
+    return ((a + b) / 2)[..., None] + meia_largura * _GAUSS_NOS, meia_largura * _GAUSS_PESOS
+
+
+def bytes_privados(array: np.ndarray) -> int:
+    """
+    Memória própria do processo ocupada por um array: zero se ele for uma
+    vista de um arquivo mapeado (as páginas vêm do cache do sistema
+    operacional e são compartilhadas entre os processos).
+    """
+    base = array
+    while base is not None:
+        if isinstance(base, (np.memmap, mmap.mmap)):
+            return 0
+        base = getattr(base, 'base', None)
+    return array.nbytes
+
+
+class CascoCompacto:
+    """
+    Representação compacta das balizas do casco em arrays NumPy contíguos.
+
+    As balizas ficam ordenadas por X e seus pontos (Z crescente) concatenados
+    num único array, no estilo CSR: os pontos da baliza i ocupam
+    `z[inicios[i]:inicios[i + 1]]`. As derivadas nodais do PCHIP e as curvas
+    cumulativas de área e momento vertical são pré-calculadas nos mesmos
+    pontos, de modo que qualquer avaliação é feita em lote, sem objetos
+    interpoladores por baliza.
+
+    Balizas com menos de dois pontos são mantidas (para que os índices
+    coincidam com `Casco.posicoes_balizas`), mas têm meia-boca nula.
+    """
+    def __init__(self, posicoes: np.ndarray, inicios: np.ndarray, z: np.ndarray, y: np.ndarray, metodo: str):
+        """
+        Args:
+            posicoes (np.ndarray): Posições X das balizas, em ordem crescente.
+            inicios (np.ndarray): Deslocamentos (n_balizas + 1) de cada baliza em `z`/`y`.
+            z (np.ndarray): Alturas de todas as balizas, crescentes dentro de cada uma.
+            y (np.ndarray): Meias-bocas correspondentes.
+            metodo (str): 'linear' ou 'pchip'.
+        """
+        self.posicoes = np.ascontiguousarray(posicoes, dtype=float)
+        self.inicios = np.ascontiguousarray(inicios, dtype=np.int64)
+        self.z = np.ascontiguousarray(z, dtype=float)
+        self.y = np.ascontiguousarray(y, dtype=float)
+        self.metodo = metodo
+
+        n_pontos = np.diff(self.inicios)
+        self.interpolavel = n_pontos > 1
+        self.baliza_do_ponto = np.repeat(np.arange(len(self.posicoes)), n_pontos)
+
+        # Chave globalmente crescente: Z deslocado pela ordem da baliza, o que
+        # permite localizar o trecho de qualquer (baliza, z) com um único searchsorted
+        amplitude = float(self.z.max() - self.z.min()) if len(self.z) else 0.0
+        self._passo = amplitude + 1.0
+        self._chaves = self.z + self.baliza_do_ponto * self._passo
+
+        # Trecho j vai do ponto j ao j+1; o último ponto de cada baliza não inicia trecho
+        ultimo_da_baliza = np.zeros(len(self.z), dtype=bool)
+        ultimo_da_baliza[self.inicios[1:][n_pontos > 0] - 1] = True
+        self._trecho_valido = ~ultimo_da_baliza
+        h = np.zeros(len(self.z))
+        h[:-1] = np.diff(self.z)
+        self._trecho_valido &= h > 0
+        self._h = np.where(self._trecho_valido, h, 1.0)
+        m = np.zeros(len(self.z))
+        m[:-1] = np.diff(self.y)
+        self._inclinacoes = np.where(self._trecho_valido, m / self._h, 0.0)
+
+        self.derivadas = self._calcular_derivadas_pchip() if metodo == 'pchip' else None
+        self._coeficientes = self._calcular_coeficientes()
+        self.areas, self.momentos = self._calcular_curvas_cumulativas()
+
+    @classmethod
+    def de_cotas(cls, cotas: np.ndarray, metodo: str) -> 'CascoCompacto':
+        """
+        Monta a representação compacta a partir de uma matriz (n_pontos × 3) de cotas.
+
+        Se as cotas já estiverem ordenadas por X e Z (como as gravadas na
+        ingestão) e as colunas forem contíguas (ordem Fortran), Z e Y são
+        usados sem cópia, inclusive quando a matriz é um arquivo mapeado.
+
+        Returns:
+            CascoCompacto: O casco compacto com as balizas ordenadas por X.
+        """
+        x, y, z = cotas[:, 0], cotas[:, 1], cotas[:, 2]
+        mesma_baliza = x[1:] == x[:-1]
+        ordenado = bool(np.all(x[1:] >= x[:-1]) and np.all(z[1:][mesma_baliza] > z[:-1][mesma_baliza]))
+        if not ordenado:
+            ordem = np.lexsort((z, x))
+            x, y, z = x[ordem], y[ordem], z[ordem]
+
+        posicoes, primeiros = np.unique(x, return_index=True)
+        inicios = np.append(primeiros, len(x))
+        return cls(posicoes, inicios, z, y, metodo)
+
+    @property
+    def n_balizas(self) -> int:
+        return len(self.posicoes)
+
+    def _calcular_derivadas_pchip(self) -> np.ndarray:
+        """
+        Derivadas nodais do PCHIP (Fritsch-Carlson, como no scipy) de todas as
+        balizas de uma só vez, sobre os arrays concatenados.
+        """
+        n_total = len(self.z)
+        h, m = self._h, self._inclinacoes
+        baliza = self.baliza_do_ponto
+        primeiro = np.arange(n_total) == self.inicios[baliza]
+        ultimo = np.arange(n_total) == self.inicios[baliza + 1] - 1
+        dois_pontos = np.diff(self.inicios)[baliza] == 2
+
+        anterior = np.maximum(np.arange(n_total) - 1, 0)
+        seguinte = np.minimum(np.arange(n_total) + 1, n_total - 1)
+
+        # Nós internos: média harmônica ponderada das inclinações vizinhas
+        h0, h1, m0, m1 = h[anterior], h, m[anterior], m
+        with np.errstate(divide='ignore', invalid='ignore'):
+            w1 = 2 * h1 + h0
+            w2 = h1 + 2 * h0
+            media = (w1 + w2) / (w1 / m0 + w2 / m1)
+        condicao = (np.sign(m1) != np.sign(m0)) | (m1 == 0) | (m0 == 0)
+        d = np.where(condicao, 0.0, media)
+
+        def _extremidade(h0, h1, m0, m1):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                d_ext = ((2 * h0 + h1) * m0 - h0 * m1) / (h0 + h1)
+            sinal_trocado = np.sign(d_ext) != np.sign(m0)
+            excesso = (np.sign(m0) != np.sign(m1)) & (np.abs(d_ext) > 3 * np.abs(m0))
+            return np.where(sinal_trocado, 0.0, np.where(excesso, 3 * m0, d_ext))
+
+        d_primeiro = np.where(dois_pontos, m, _extremidade(h, h[seguinte], m, m[seguinte]))
+        antes_anterior = np.maximum(np.arange(n_total) - 2, 0)
+        d_ultimo = np.where(dois_pontos, m[anterior],
+                            _extremidade(h[anterior], h[antes_anterior], m[anterior], m[antes_anterior]))
+        d = np.where(primeiro, d_primeiro, np.where(ultimo, d_ultimo, d))
+        return np.nan_to_num(np.where(self.interpolavel[baliza], d, 0.0))
+
+    def _calcular_coeficientes(self) -> np.ndarray:
+        """
+        Coeficientes de cada trecho na base local, y = c0·s³ + c1·s² + c2·s + c3
+        com s = z - z_j, para avaliação por Horner (trechos lineares têm c0 = c1 = 0).
+
+        Returns:
+            np.ndarray: Matriz (4 × n_pontos); colunas de trechos inválidos são nulas.
+        """
+        coeficientes = np.zeros((4, len(self.z)))
+        coeficientes[3] = self.y
+        if self.derivadas is None:
+            coeficientes[2] = self._inclinacoes
+        else:
+            # Forma de Hermite convertida para a base de potências, como no scipy
+            seguinte = np.minimum(np.arange(len(self.z)) + 1, max(len(self.z) - 1, 0))
+            d0, d1, m, h = self.derivadas, self.derivadas[seguinte], self._inclinacoes, self._h
+            coeficientes[0] = np.where(self._trecho_valido, (d0 + d1 - 2 * m) / h ** 2, 0.0)
+            coeficientes[1] = np.where(self._trecho_valido, (3 * m - 2 * d0 - d1) / h, 0.0)
+            coeficientes[2] = np.where(self._trecho_valido, d0, 0.0)
+        return coeficientes
+
+    def _avaliar_trechos(self, trechos: np.ndarray, z: np.ndarray) -> np.ndarray:
+        """
+        Avalia o polinômio do trecho indicado (índice do ponto inicial) em z,
+        sem verificar se z pertence ao trecho.
+        """
+        c0, c1, c2, c3 = self._coeficientes[:, trechos]
+        s = z - self.z[trechos]
+        return ((c0 * s + c1) * s + c2) * s + c3
+
+    def _localizar(self, indices: np.ndarray, z: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Localiza o trecho de cada par (baliza, z).
+
+        Returns:
+            tuple: Índice do trecho, z recortado à faixa da baliza, máscara de
+                   balizas existentes e interpoláveis e máscara de z dentro da faixa.
+        """
+        # Grandezas por baliza são obtidas antes do broadcasting com z
+        indices = np.asarray(indices, dtype=np.int64)
+        z = np.asarray(z, dtype=float)
+        existe = (indices >= 0) & (indices < self.n_balizas)
+        baliza = np.where(existe, indices, 0)
+        ini, fim = self.inicios[baliza], self.inicios[baliza + 1] - 1
+        existe &= self.interpolavel[baliza]
+        fim = np.where(existe, fim, ini + 1)
+        z_ini, z_fim = self.z[ini], self.z[np.minimum(fim, len(self.z) - 1)]
+
+        dentro = existe & (z >= z_ini) & (z <= z_fim)
+        z_limite = np.clip(z, z_ini, z_fim)
+        trecho = np.searchsorted(self._chaves, z_limite + baliza * self._passo, side='right') - 1
+        trecho = np.minimum(trecho, fim - 1)
+        existe = np.broadcast_to(existe, trecho.shape)
+        return np.clip(trecho, 0, len(self.z) - 2), z_limite, existe, dentro
+
+    def meia_boca(self, indices, z) -> np.ndarray:
+        """
+        Meia-boca (Y) das balizas `indices` nas alturas `z`, em lote.
+
+        Os dois argumentos são combinados por broadcasting. Alturas fora da
+        faixa da baliza, índices inexistentes (-1) e balizas com menos de dois
+        pontos resultam em 0, como no interpolador original.
+
+        Args:
+            indices (int | array): Índice(s) das balizas em `posicoes`.
+            z (float | array): Altura(s) de consulta.
+
+        Returns:
+            np.ndarray: As meias-bocas, com a forma resultante do broadcasting.
+        """
+        if len(self.z) < 2:
+            return np.zeros(np.broadcast(np.asarray(indices), np.asarray(z)).shape)
+        trecho, z_limite, _, dentro = self._localizar(indices, z)
+        return np.where(dentro, self._avaliar_trechos(trecho, z_limite), 0.0)
+
+    def meia_boca_malha(self, z) -> np.ndarray:
+        """
+        Meia-boca de todas as balizas em cada altura.
+
+        Returns:
+            np.ndarray: Matriz (n_balizas × forma de z).
+        """
+        z = np.asarray(z, dtype=float)
+        indices = np.arange(self.n_balizas).reshape((-1,) + (1,) * z.ndim)
+        return self.meia_boca(indices, z[None, ...])
+
+    def indices_de(self, posicoes_x) -> np.ndarray:
+        """
+        Converte posições X em índices de baliza (-1 quando não há baliza na posição exata).
+        """
+        posicoes_x = np.asarray(posicoes_x, dtype=float)
+        indices = np.clip(np.searchsorted(self.posicoes, posicoes_x), 0, max(self.n_balizas - 1, 0))
+        if not self.n_balizas:
+            return np.full(posicoes_x.shape, -1)
+        return np.where(self.posicoes[indices] == posicoes_x, indices, -1)
+
+    def _calcular_curvas_cumulativas(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Área A(z) = ∫ 2y dz e momento vertical M_z(z) = ∫ 2yz dz acumulados
+        desde o primeiro ponto de cada baliza até cada um dos seus pontos.
+
+        Cada trecho é um único polinômio (grau 1 ou 3), então Gauss-Legendre de
+        3 pontos é exata; as somas por baliza saem de uma soma acumulada global.
+        """
+        n_total = len(self.z)
+        if n_total < 2:
+            return np.zeros(n_total), np.zeros(n_total)
+
+        trechos = np.arange(n_total - 1)
+        z_gauss, pesos = _nos_gauss(self.z[:-1], self.z[:-1] + np.where(self._trecho_valido[:-1], self._h[:-1], 0.0))
+        largura = 2 * self._avaliar_trechos(trechos[:, None], z_gauss)
+
+        contribuicoes_area = np.append((pesos * largura).sum(axis=-1), 0.0)
+        contribuicoes_momento = np.append((pesos * z_gauss * largura).sum(axis=-1), 0.0)
+
+        acumuladas = []
+        for contribuicoes in (contribuicoes_area, contribuicoes_momento):
+            soma = np.concatenate(([0.0], np.cumsum(contribuicoes)[:-1]))
+            acumuladas.append(soma - soma[self.inicios[self.baliza_do_ponto]])
+        return acumuladas[0], acumuladas[1]
+
+    def areas_e_momentos(self, indices, calados) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Área submersa e momento vertical (em relação a z=0) das seções
+        `indices` para os calados dados, combinados por broadcasting.
+
+        O valor tabelado no ponto imediatamente abaixo do calado é somado à
+        integral exata da faixa entre esse ponto e o calado.
+
+        Returns:
+            tuple: Áreas (m²) e momentos verticais (m³).
+        """
+        if len(self.z) < 2:
+            forma = np.broadcast(np.asarray(indices), np.asarray(calados)).shape
+            return np.zeros(forma), np.zeros(forma)
+
+        # Acima do último ponto a seção está completa; abaixo do primeiro, não há seção
+        trecho, limite, existe, _ = self._localizar(indices, calados)
+        z_gauss, pesos = _nos_gauss(self.z[trecho], limite)
+        largura = 2 * self._avaliar_trechos(trecho[..., None], z_gauss)
+        area = np.where(existe, self.areas[trecho] + (pesos * largura).sum(axis=-1), 0.0)
+        momento = np.where(existe, self.momentos[trecho] + (pesos * z_gauss * largura).sum(axis=-1), 0.0)
+        return area, momento
+
+    def tamanho_em_bytes(self) -> int:
+        """
+        Returns:
+            int: Memória ocupada pelos arrays da representação compacta
+                 (sem contar as vistas de arquivos mapeados).
+        """
+        return sum(bytes_privados(v) for v in vars(self).values() if isinstance(v, np.ndarray))
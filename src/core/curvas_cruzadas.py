@@ -0,0 +1,243 @@
+# src/core/curvas_cruzadas.py
+
+from typing import TYPE_CHECKING
+import concurrent.futures
+import os
+import time
+import numpy as np
+from .interpolacao import Casco
+from .pool_calculo import publicar_casco, obter_executor, obter_casco_worker
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Pontos por bordo usados para descrever cada seção como polígono
+PONTOS_POR_BORDO = 40
+# Níveis da malha inicial de planos de flutuação usada para cercar cada equilíbrio
+NIVEIS_MALHA_EQUILIBRIO = 48
+TOLERANCIA_VOLUME = 1e-9
+MAX_ITERACOES_EQUILIBRIO = 40
+
+
+def montar_poligonos_secoes(casco: Casco, pontos_por_bordo: int = PONTOS_POR_BORDO) -> np.ndarray:
+    """
+    Descreve cada baliza como um polígono fechado no plano (y, z): o bordo de
+    boreste da quilha ao topo da baliza, a linha do convés até bombordo e o
+    bordo de bombordo de volta à quilha (sentido anti-horário).
+
+    Returns:
+        np.ndarray: Vértices com forma (n_balizas × 2·pontos_por_bordo × 2).
+                    Balizas sem interpolação viram polígonos degenerados (área nula).
+    """
+    compacto = casco.compacto
+    z_ini = compacto.z[compacto.inicios[:-1].clip(max=len(compacto.z) - 1)]
+    z_fim = compacto.z[(compacto.inicios[1:] - 1).clip(min=0)]
+    fracoes = np.linspace(0.0, 1.0, pontos_por_bordo)
+    z = z_ini[:, None] + (z_fim - z_ini)[:, None] * fracoes[None, :]
+    y = compacto.meia_boca(np.arange(compacto.n_balizas)[:, None], z)
+    y = np.where(compacto.interpolavel[:, None], y, 0.0)
+
+    boreste = np.stack([y, z], axis=-1)
+    bombordo = np.stack([-y, z], axis=-1)[:, ::-1]
+    return np.concatenate([boreste, bombordo], axis=1)
+
+
+def propriedades_secoes_inclinadas(poligonos: np.ndarray, angulo_rad: float, niveis: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Área e momentos (em y e em z) da parte de cada seção abaixo de cada plano
+    de flutuação inclinado, por recorte vetorizado dos polígonos.
+
+    Com banda `angulo_rad` para boreste, a altura de um ponto p = (y, z) da seção
+    medida na vertical da Terra é n·p, com n = (-sen φ, cos φ); a parte imersa é
+    a que fica abaixo do nível `d`. O polígono recortado é formado pelos trechos
+    imersos das arestas e por cordas sobre a linha d'água, cada uma indo de um
+    ponto de saída ao ponto de entrada seguinte. As integrais de Green das
+    arestas são somadas trecho a trecho; as das cordas dependem só da posição
+    s dos pontos ao longo da linha d'água (p = d·n + s·t), então somam-se sobre
+    entradas menos saídas, sem precisar parear os pontos.
+
+    Args:
+        poligonos (np.ndarray): Vértices (n_balizas × n_vertices × 2).
+        angulo_rad (float | np.ndarray): Ângulo de banda em radianos, único ou
+            um por nível (n_niveis,).
+        niveis (np.ndarray): Níveis `d` dos planos de flutuação, (n_niveis,) ou,
+            para planos com trim, um nível por baliza (n_balizas × n_niveis).
+
+    Returns:
+        tuple: Área, momento em y e momento em z, cada um (n_balizas × n_niveis).
+    """
+    angulo_rad = np.asarray(angulo_rad, dtype=float).reshape(1, -1, 1)
+    normal = (-np.sin(angulo_rad), np.cos(angulo_rad))
+    tangente = (normal[1], -normal[0])
+    niveis = np.asarray(niveis, dtype=float)
+    niveis = niveis[None, :, None] if niveis.ndim == 1 else niveis[:, :, None]
+
+    y0, z0 = poligonos[:, None, :, 0], poligonos[:, None, :, 1]          # (S, 1, P)
+    y1, z1 = np.roll(y0, -1, axis=-1), np.roll(z0, -1, axis=-1)
+    d0 = y0 * normal[0] + z0 * normal[1]
+    s0 = d0 - niveis                                                      # (S, N, P)
+    s1 = np.roll(d0, -1, axis=-1) - niveis
+
+    imerso0, imerso1 = s0 <= 0, s1 <= 0
+    cruza = imerso0 != imerso1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(cruza, s0 / (s0 - s1), 0.0)
+    yx, zx = y0 + t * (y1 - y0), z0 + t * (z1 - z0)
+
+    # --- Trechos imersos das arestas ---
+    ya, za = np.where(imerso0, y0, yx), np.where(imerso0, z0, zx)
+    yb, zb = np.where(imerso1, y1, yx), np.where(imerso1, z1, zx)
+    cruzado = np.where(imerso0 | imerso1, ya * zb - yb * za, 0.0)
+    area = cruzado.sum(axis=-1) / 2
+    momento_y = ((ya + yb) * cruzado).sum(axis=-1) / 6
+    momento_z = ((za + zb) * cruzado).sum(axis=-1) / 6
+
+    # --- Cordas sobre a linha d'água (de cada saída à entrada seguinte) ---
+    # Para a, b sobre a linha: a × b = (s_b - s_a)·(d·n × t) = -(s_b - s_a)·d
+    posicao = yx * tangente[0] + zx * tangente[1]
+    sinal = np.where(cruza, np.where(imerso1, 1.0, -1.0), 0.0)   # +1 entrada, -1 saída
+    soma_s = (sinal * posicao).sum(axis=-1)
+    soma_s2 = (sinal * posicao ** 2).sum(axis=-1)
+    nivel = niveis[..., 0]
+    fator = -nivel
+    area += fator * soma_s / 2
+    momento_y += fator * (2 * nivel * normal[0][..., 0] * soma_s + tangente[0][..., 0] * soma_s2) / 6
+    momento_z += fator * (2 * nivel * normal[1][..., 0] * soma_s + tangente[1][..., 0] * soma_s2) / 6
+    return area, momento_y, momento_z
+
+
+def _integrar_ao_longo(posicoes: np.ndarray, valores: np.ndarray) -> np.ndarray:
+    """Integra, pela regra dos trapézios, grandezas por baliza ao longo do comprimento."""
+    return np.trapezoid(valores, posicoes, axis=0)
+
+
+def calcular_kn_para_angulo(poligonos: np.ndarray, posicoes: np.ndarray, angulo_graus: float,
+                            volumes_alvo: np.ndarray) -> np.ndarray:
+    """
+    Resolve o equilíbrio (volume imerso = volume alvo) para todos os
+    deslocamentos de um ângulo de banda ao mesmo tempo e retorna KN.
+
+    Uma malha de planos de flutuação cerca cada volume alvo; o nível exato sai
+    de iterações de falsa posição (variante de Illinois) feitas em conjunto
+    para todos os alvos. Volumes acima do volume total do casco resultam em NaN.
+
+    Returns:
+        np.ndarray: KN (m) para cada volume alvo.
+    """
+    angulo_rad = np.radians(angulo_graus)
+    normal = np.array([-np.sin(angulo_rad), np.cos(angulo_rad)])
+    volumes_alvo = np.asarray(volumes_alvo, dtype=float)
+
+    def volume_e_momentos(niveis):
+        area, momento_y, momento_z = propriedades_secoes_inclinadas(poligonos, angulo_rad, niveis)
+        return (_integrar_ao_longo(posicoes, area), _integrar_ao_longo(posicoes, momento_y),
+                _integrar_ao_longo(posicoes, momento_z))
+
+    # --- 1. Malha inicial de níveis e volumes correspondentes ---
+    alturas = poligonos @ normal
+    malha = np.linspace(alturas.min(), alturas.max(), NIVEIS_MALHA_EQUILIBRIO)
+    volumes_malha = np.maximum.accumulate(volume_e_momentos(malha)[0])
+    atingivel = (volumes_alvo >= 0) & (volumes_alvo <= volumes_malha[-1])
+
+    k = np.clip(np.searchsorted(volumes_malha, volumes_alvo), 1, len(malha) - 1)
+    a, b = malha[k - 1], malha[k]
+    fa, fb = volumes_malha[k - 1] - volumes_alvo, volumes_malha[k] - volumes_alvo
+
+    # --- 2. Falsa posição (Illinois) para todos os alvos ao mesmo tempo ---
+    nivel = b.copy()
+    escala = np.maximum(volumes_alvo, 1e-12)
+    for _ in range(MAX_ITERACOES_EQUILIBRIO):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            nivel = np.where(fb != fa, b - fb * (b - a) / (fb - fa), (a + b) / 2)
+        nivel = np.clip(nivel, np.minimum(a, b), np.maximum(a, b))
+        volume, momento_y, momento_z = volume_e_momentos(nivel)
+        fn = volume - volumes_alvo
+        if np.all(np.abs(fn[atingivel]) <= TOLERANCIA_VOLUME * escala[atingivel]):
+            break
+
+        mesmo_lado = np.sign(fn) == np.sign(fb)
+        # Illinois: quando a mesma extremidade permanece, seu valor é reduzido à metade
+        fa = np.where(mesmo_lado, fa / 2, fb)
+        a = np.where(mesmo_lado, a, b)
+        b, fb = nivel, fn
+
+    # --- 3. Centro de carena no equilíbrio (última avaliação) e braço KN ---
+    with np.errstate(divide='ignore', invalid='ignore'):
+        y_b, z_b = momento_y / volume, momento_z / volume
+    kn = y_b * np.cos(angulo_rad) + z_b * np.sin(angulo_rad)
+    return np.where(atingivel & (volume > 1e-9), kn, np.nan)
+
+
+def calcular_kn_lote_worker(args) -> list:
+    """
+    Função "worker" para o pool de processos: recebe o descritor do casco
+    publicado em memória compartilhada e calcula KN para alguns ângulos.
+    """
+    descritor, angulos, volumes_alvo, pontos_por_bordo = args
+    casco = obter_casco_worker(descritor)
+    poligonos = montar_poligonos_secoes(casco, pontos_por_bordo)
+    posicoes = casco.compacto.posicoes
+    return [calcular_kn_para_angulo(poligonos, posicoes, angulo, volumes_alvo) for angulo in angulos]
+
+
+class CalculadoraCurvasCruzadas:
+    """
+    Calcula as curvas cruzadas de estabilidade KN(ângulo de banda, deslocamento)
+    com trim fixo (quilha paralela), para banda a boreste de 0° a 90°.
+
+    Cada ângulo é independente, então os ângulos são distribuídos entre threads
+    (NumPy libera o GIL nas operações pesadas) ou entre os processos do pool
+    persistente, conforme `executor` ('auto', 'local', 'threads' ou 'processos').
+    """
+    def __init__(self, casco: Casco, densidade: float, executor: str = 'auto',
+                 max_workers: int | None = None, pontos_por_bordo: int = PONTOS_POR_BORDO):
+        self.casco = casco
+        self.densidade = densidade
+        self.executor = executor
+        self.max_workers = max_workers
+        self.pontos_por_bordo = pontos_por_bordo
+
+    def calcular(self, deslocamentos: list, angulos: list) -> 'pd.DataFrame':
+        """
+        Args:
+            deslocamentos (list): Deslocamentos (t).
+            angulos (list): Ângulos de banda (graus).
+
+        Returns:
+            pd.DataFrame: Uma linha por deslocamento, com 'Desloc. (t)',
+                          'Volume (m³)' e uma coluna 'KN φ° (m)' por ângulo.
+        """
+        start_time = time.perf_counter()
+        deslocamentos = np.array(sorted(deslocamentos), dtype=float)
+        angulos = sorted(float(a) for a in angulos)
+        volumes_alvo = deslocamentos / self.densidade
+
+        n_workers = self.max_workers or os.cpu_count() or 1
+        executor = self.executor
+        if executor == 'auto':
+            executor = 'threads' if n_workers > 1 and len(angulos) > 1 else 'local'
+        print(f"\nIniciando cálculo das curvas cruzadas: {len(angulos)} ângulos × "
+              f"{len(deslocamentos)} deslocamentos (executor '{executor}')...")
+
+        if executor == 'processos':
+            descritor = publicar_casco(self.casco)
+            tarefas = [(descritor, [angulo], volumes_alvo, self.pontos_por_bordo) for angulo in angulos]
+            resultados = [kn for lote in obter_executor(self.max_workers).map(calcular_kn_lote_worker, tarefas) for kn in lote]
+        else:
+            poligonos = montar_poligonos_secoes(self.casco, self.pontos_por_bordo)
+            posicoes = self.casco.compacto.posicoes
+            calcular = lambda angulo: calcular_kn_para_angulo(poligonos, posicoes, angulo, volumes_alvo)
+            if executor == 'threads':
+                with concurrent.futures.ThreadPoolExecutor(max_workers=n_workers) as pool:
+                    resultados = list(pool.map(calcular, angulos))
+            else:
+                resultados = [calcular(angulo) for angulo in angulos]
+
+        import pandas as pd
+
+        tabela = pd.DataFrame({'Desloc. (t)': deslocamentos, 'Volume (m³)': volumes_alvo})
+        for angulo, kn in zip(angulos, resultados):
+            tabela[f'KN {angulo:g}° (m)'] = kn
+
+        print(f"Curvas cruzadas calculadas em {time.perf_counter() - start_time:.2f} segundos.")
+        return tabela
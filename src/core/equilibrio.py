@@ -0,0 +1,287 @@
+# src/core/equilibrio.py
+
+from typing import TYPE_CHECKING
+import time
+import numpy as np
+from .interpolacao import Casco
+from .calculos_vetorizados import calcular_curvas_vetorizado
+from .curvas_cruzadas import PONTOS_POR_BORDO, montar_poligonos_secoes, propriedades_secoes_inclinadas
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Calados da tabela hidrostática usada na estimativa inicial e na escala dos resíduos
+CALADOS_TABELA_EQUILIBRIO = 60
+# Passos máximos por iteração (estabilizam o Newton longe da solução)
+PASSO_MAX_BANDA = np.radians(10.0)
+PASSO_MAX_INCLINACAO_TRIM = 0.05
+# Limite inferior da altura metacêntrica usada na estimativa inicial (evita divisão por zero)
+GM_MINIMO_ESTIMATIVA = 1e-3
+# Incrementos de (d, τ, φ) nas diferenças finitas do jacobiano
+PASSOS_DIFERENCA = np.array([1e-5, 1e-6, 1e-5])
+# Reduções do passo (pela metade) na busca linear antes de considerar o caso estagnado
+MAX_REDUCOES_PASSO = 8
+# Banda máxima admitida (rad): além dela o estado não é físico para um casco que flutua
+BANDA_MAXIMA = np.pi / 2 - 1e-3
+# Iterações de Newton da estimativa de calado e trim na flutuação direita (tabela de Bonjean)
+ITERACOES_ESTIMATIVA_TRIM = 4
+
+COLUNAS_CASO = ['Desloc. (t)', 'LCG (m)', 'TCG (m)', 'KG (m)']
+
+
+class SolucionadorEquilibrio:
+    """
+    Encontra o calado, o trim e a banda em que o casco flutua livremente com
+    um dado deslocamento e centro de gravidade (condição de carregamento).
+
+    No referencial do casco, a água cobre os pontos com
+    -y·sen(φ) + z·cos(φ) - (x - x_ref)·τ <= d, em que d é o calado de referência
+    (medido na vertical inclinada, em x_ref), τ a inclinação do trim (positiva
+    de proa) e φ a banda (positiva para boreste). O equilíbrio exige volume
+    imerso igual ao deslocamento e o centro de carena B na mesma vertical de G:
+
+        V - Δ/ρ = 0
+        (B_x - G_x) + (B_z - G_z)·τ/cos φ = 0
+        (B_y - G_y) + (B_z - G_z)·tan φ = 0
+
+    Os resíduos usam a geometria exata (seções recortadas, como nas curvas
+    cruzadas), e o jacobiano também: diferenças finitas dos resíduos em d, τ
+    e φ, avaliadas junto com o estado numa única chamada vetorizada. Assim a
+    linha da banda segue a inclinação real da curva de braços de
+    endireitamento (que se anula no braço máximo, perto da imersão do
+    convés) e inclui o acoplamento da banda com o calado e o trim, que as
+    propriedades da flutuação direita (AWP, LCF, BM) não trazem. A tabela
+    hidrostática direita fornece a estimativa inicial (estabilidade
+    inicial) e a escala do resíduo de volume. Cada passo
+    de Newton passa por uma busca linear e fica dentro dos limites físicos
+    (calado dentro da altura do casco, trim menor que o pontal ao longo do
+    comprimento, banda abaixo de 90°); um caso sem passo que reduza os
+    resíduos (por exemplo, sem equilíbrio porque o braço de banda supera o
+    braço de endireitamento máximo) para no melhor estado encontrado, com
+    'Convergiu' falso. Todos os casos de um lote iteram juntos. Os casos de
+    chamadas seguintes partem da solução do caso anterior mais parecido
+    (partida a quente).
+    """
+    def __init__(self, casco: Casco, densidade: float, metodo_interp: str, x_ref: float | None = None,
+                 tolerancia_volume: float = 1e-7, tolerancia_braco: float = 1e-6, max_iteracoes: int = 30,
+                 pontos_por_bordo: int = PONTOS_POR_BORDO):
+        self.casco = casco
+        self.densidade = densidade
+        self.metodo_interp = metodo_interp
+        self.tolerancia_volume = tolerancia_volume
+        self.tolerancia_braco = tolerancia_braco
+        self.max_iteracoes = max_iteracoes
+
+        self.posicoes = casco.compacto.posicoes
+        self.x_re, self.x_vante = float(self.posicoes.min()), float(self.posicoes.max())
+        self.x_ref = (self.x_re + self.x_vante) / 2 if x_ref is None else x_ref
+        self.poligonos = montar_poligonos_secoes(casco, pontos_por_bordo)
+
+        # Tabela hidrostática (flutuação direita) da estimativa inicial e da escala dos resíduos
+        z = casco.compacto.z
+        calados = np.linspace(max(z.min(), 0.0) + 1e-3, z.max(), CALADOS_TABELA_EQUILIBRIO)
+        self.tabela = calcular_curvas_vetorizado(casco, calados.tolist(), densidade, metodo_interp)
+
+        # Limites físicos do estado: trim até o pontal ao longo do comprimento e
+        # calado até onde o plano de flutuação ainda corta o casco
+        self.inclinacao_max = (z.max() - z.min()) / max(self.x_vante - self.x_re, 1e-9)
+        raio = float(np.hypot(self.poligonos[..., 0], self.poligonos[..., 1]).max())
+        folga_trim = self.inclinacao_max * max(self.x_ref - self.x_re, self.x_vante - self.x_ref)
+        self.calado_min, self.calado_max = -raio - folga_trim, raio + folga_trim
+
+        # Casos e soluções da última chamada, para a partida a quente
+        self._casos_anteriores = None
+        self._solucoes_anteriores = None
+
+    def _hidrostatica(self, calados: np.ndarray, coluna: str) -> np.ndarray:
+        """Interpola uma coluna da tabela hidrostática nos calados dados."""
+        return np.interp(calados, self.tabela['Calado (m)'], self.tabela[coluna])
+
+    def _propriedades_carena(self, d: np.ndarray, tau: np.ndarray, phi: np.ndarray) -> tuple:
+        """
+        Volume imerso e centro de carena (B_x, B_y, B_z) para cada estado (d, τ, φ).
+        """
+        niveis = d[None, :] + (self.posicoes[:, None] - self.x_ref) * tau[None, :]
+        area, momento_y, momento_z = propriedades_secoes_inclinadas(self.poligonos, phi, niveis)
+        volume = np.trapezoid(area, self.posicoes, axis=0)
+        momento_x = np.trapezoid(area * self.posicoes[:, None], self.posicoes, axis=0)
+        momento_y = np.trapezoid(momento_y, self.posicoes, axis=0)
+        momento_z = np.trapezoid(momento_z, self.posicoes, axis=0)
+        volume_seguro = np.where(volume > 1e-12, volume, 1.0)
+        return volume, momento_x / volume_seguro, momento_y / volume_seguro, momento_z / volume_seguro
+
+    def _residuos(self, d: np.ndarray, tau: np.ndarray, phi: np.ndarray, volume_alvo: np.ndarray, lcg: np.ndarray,
+                  tcg: np.ndarray, kg: np.ndarray) -> tuple:
+        """
+        Resíduos das três equações de equilíbrio para cada estado.
+
+        Returns:
+            tuple: (resíduos n × 3, volume, B_x, B_y, B_z).
+        """
+        volume, bx, by, bz = self._propriedades_carena(d, tau, phi)
+        residuos = np.stack([
+            volume - volume_alvo,
+            (bx - lcg) + (bz - kg) * tau / np.cos(phi),
+            (by - tcg) + (bz - kg) * np.tan(phi),
+        ], axis=1)
+        return residuos, volume, bx, by, bz
+
+    def _limitar(self, d: np.ndarray, tau: np.ndarray, phi: np.ndarray) -> tuple:
+        """Mantém o estado dentro dos limites físicos."""
+        return (np.clip(d, self.calado_min, self.calado_max),
+                np.clip(tau, -self.inclinacao_max, self.inclinacao_max),
+                np.clip(phi, -BANDA_MAXIMA, BANDA_MAXIMA))
+
+    def _estimativa_hidrostatica(self, deslocamento, lcg, tcg, kg) -> np.ndarray:
+        """
+        Estimativa inicial (d, τ, φ). O calado e o trim resolvem o equilíbrio
+        na flutuação direita com volume e centro de carena da tabela de
+        Bonjean (linhas d'água com trim, sem integrar as seções de novo) e
+        jacobiano analítico da tabela hidrostática (AWP/TPC, LCF, GMl/MTC); a
+        banda vem da estabilidade inicial.
+        """
+        d = np.interp(deslocamento, self.tabela['Desloc. (t)'], self.tabela['Calado (m)'])
+        lcb = self._hidrostatica(d, 'LCB (m)')
+        gml = np.maximum(self._hidrostatica(d, 'KMl (m)') - kg, GM_MINIMO_ESTIMATIVA)
+        tau = np.clip((lcg - lcb) / gml, -self.inclinacao_max, self.inclinacao_max)
+
+        bonjean = self.casco.bonjean
+        volume_alvo = deslocamento / self.densidade
+        for _ in range(ITERACOES_ESTIMATIVA_TRIM):
+            carena = bonjean.volume_e_centros(d + (bonjean.posicoes[0] - self.x_ref) * tau,
+                                              d + (bonjean.posicoes[-1] - self.x_ref) * tau)
+            residuos = np.stack([carena['volume'] - volume_alvo,
+                                 (carena['lcb'] - lcg) + (carena['vcb'] - kg) * tau], axis=1)
+            awp = np.maximum(self._hidrostatica(d, 'AWP (m²)'), 1e-9)
+            lcf = self._hidrostatica(d, 'LCF (m)')
+            gml = np.maximum(self._hidrostatica(d, 'KMl (m)') - kg, GM_MINIMO_ESTIMATIVA)
+            jacobiano = np.zeros((len(d), 2, 2))
+            jacobiano[:, 0, 0] = awp
+            jacobiano[:, 0, 1] = awp * (lcf - self.x_ref)
+            jacobiano[:, 1, 0] = awp * (lcf - carena['lcb']) / np.maximum(carena['volume'], 1e-9)
+            jacobiano[:, 1, 1] = gml
+            passo = -np.linalg.solve(jacobiano, residuos[..., None])[..., 0]
+            d = np.clip(d + passo[:, 0], self.calado_min, self.calado_max)
+            tau = np.clip(tau + np.clip(passo[:, 1], -PASSO_MAX_INCLINACAO_TRIM, PASSO_MAX_INCLINACAO_TRIM),
+                          -self.inclinacao_max, self.inclinacao_max)
+
+        gmt = np.maximum(self._hidrostatica(d, 'KMt (m)') - kg, GM_MINIMO_ESTIMATIVA)
+        phi = np.arctan(tcg / gmt)
+        return np.stack([d, tau, phi], axis=1)
+
+    def _estimativa_a_quente(self, casos: np.ndarray) -> np.ndarray | None:
+        """Solução do caso anterior mais próximo (distâncias normalizadas), se houver."""
+        if self._casos_anteriores is None:
+            return None
+        escala = np.maximum(np.abs(self._casos_anteriores).max(axis=0), 1e-9)
+        diferencas = (casos[:, None, :] - self._casos_anteriores[None, :, :]) / escala
+        mais_proximo = np.argmin((diferencas ** 2).sum(axis=-1), axis=1)
+        return self._solucoes_anteriores[mais_proximo]
+
+    def resolver(self, casos, estimativa: np.ndarray | None = None) -> 'pd.DataFrame':
+        """
+        Resolve o equilíbrio de um lote de condições de carregamento.
+
+        Args:
+            casos (pd.DataFrame | list): Condições com as colunas 'Desloc. (t)',
+                'LCG (m)', 'TCG (m)' e 'KG (m)'.
+            estimativa (np.ndarray, optional): Partida (n_casos × 3) com (d, τ, φ em rad).
+                Se omitida, usa a solução mais próxima da chamada anterior ou,
+                na primeira chamada, a estabilidade inicial.
+
+        Returns:
+            pd.DataFrame: Os casos com calado de referência, calados a ré e a
+                          vante, trim, banda, centro de carena, resíduos e convergência.
+        """
+        import pandas as pd
+
+        start_time = time.perf_counter()
+        casos_df = pd.DataFrame(casos, columns=COLUNAS_CASO)
+        valores = casos_df.to_numpy(dtype=float)
+        deslocamento, lcg, tcg, kg = valores.T
+        volume_alvo = deslocamento / self.densidade
+
+        if estimativa is None:
+            estimativa = self._estimativa_a_quente(valores)
+        if estimativa is None:
+            estimativa = self._estimativa_hidrostatica(deslocamento, lcg, tcg, kg)
+        d, tau, phi = self._limitar(*(np.array(coluna, dtype=float) for coluna in np.asarray(estimativa).T))
+
+        # Escala do resíduo de volume: erro de volume convertido em erro de calado (m),
+        # comparável aos braços na função de mérito da busca linear
+        calado_alvo = np.interp(deslocamento, self.tabela['Desloc. (t)'], self.tabela['Calado (m)'])
+        escala = np.ones((len(valores), 3))
+        escala[:, 0] = 1.0 / np.maximum(self._hidrostatica(calado_alvo, 'AWP (m²)'), 1e-9)
+
+        residuos, volume, bx, by, bz = self._residuos(d, tau, phi, volume_alvo, lcg, tcg, kg)
+        iteracoes = np.zeros(len(valores), dtype=int)
+        estagnado = np.zeros(len(valores), dtype=bool)
+        for iteracao in range(self.max_iteracoes + 1):
+            convergido = ((np.abs(residuos[:, 0]) <= self.tolerancia_volume * np.maximum(volume_alvo, 1e-9))
+                          & (np.abs(residuos[:, 1:]) <= self.tolerancia_braco).all(axis=1))
+            ativos = np.flatnonzero(~convergido & ~estagnado)
+            if len(ativos) == 0 or iteracao == self.max_iteracoes:
+                break
+            iteracoes[ativos] += 1
+            alvo = (volume_alvo[ativos], lcg[ativos], tcg[ativos], kg[ativos])
+            da, taua, phia, ra = d[ativos], tau[ativos], phi[ativos], residuos[ativos]
+
+            # --- Jacobiano por diferenças finitas da geometria recortada (uma chamada para os 3 incrementos) ---
+            n_ativos = len(ativos)
+            incrementos = np.repeat(PASSOS_DIFERENCA[None, :], n_ativos, axis=0)
+            # Perto do limite da banda, a diferença é feita para dentro
+            incrementos[:, 2] = np.where(phia + PASSOS_DIFERENCA[2] > BANDA_MAXIMA, -PASSOS_DIFERENCA[2],
+                                         PASSOS_DIFERENCA[2])
+            estados = np.stack([da, taua, phia], axis=1)[None, :, :].repeat(3, axis=0)
+            estados[np.arange(3), :, np.arange(3)] += incrementos.T
+            estados = estados.reshape(-1, 3)
+            ra_perturbados = self._residuos(estados[:, 0], estados[:, 1], estados[:, 2],
+                                            *(np.tile(a, 3) for a in alvo))[0].reshape(3, n_ativos, 3)
+            # jacobiano[k, i, j] = ∂resíduo_i / ∂estado_j
+            jacobiano = ((ra_perturbados - ra[None, :, :]) / incrementos.T[:, :, None]).transpose(1, 2, 0)
+
+            # Jacobiano singular (no máximo do braço de endireitamento): pseudo-inversa
+            passo = -(np.linalg.pinv(jacobiano) @ ra[..., None])[..., 0]
+            passo[:, 1] = np.clip(passo[:, 1], -PASSO_MAX_INCLINACAO_TRIM, PASSO_MAX_INCLINACAO_TRIM)
+            passo[:, 2] = np.clip(passo[:, 2], -PASSO_MAX_BANDA, PASSO_MAX_BANDA)
+
+            # --- Busca linear: aceita o primeiro passo (inteiro, metade, ...) que reduz os resíduos ---
+            merito = ((ra * escala[ativos]) ** 2).sum(axis=1)
+            alfa = np.ones(len(ativos))
+            pendentes = np.arange(len(ativos))
+            for _ in range(MAX_REDUCOES_PASSO + 1):
+                i = pendentes
+                dc, tauc, phic = self._limitar(da[i] + alfa[i] * passo[i, 0], taua[i] + alfa[i] * passo[i, 1],
+                                               phia[i] + alfa[i] * passo[i, 2])
+                rc, vc, bxc, byc, bzc = self._residuos(dc, tauc, phic, *(a[i] for a in alvo))
+                melhora = ((rc * escala[ativos[i]]) ** 2).sum(axis=1) < merito[i]
+                aceitos = ativos[i[melhora]]
+                d[aceitos], tau[aceitos], phi[aceitos] = dc[melhora], tauc[melhora], phic[melhora]
+                residuos[aceitos], volume[aceitos] = rc[melhora], vc[melhora]
+                bx[aceitos], by[aceitos], bz[aceitos] = bxc[melhora], byc[melhora], bzc[melhora]
+                pendentes = i[~melhora]
+                if len(pendentes) == 0:
+                    break
+                alfa[pendentes] /= 2
+            # Sem redução possível: o caso fica no melhor estado encontrado
+            estagnado[ativos[pendentes]] = True
+
+        self._casos_anteriores = valores
+        self._solucoes_anteriores = np.stack([d, tau, phi], axis=1)
+
+        resultado = casos_df.copy()
+        resultado['Calado Ref. (m)'] = d
+        resultado['Calado AR (m)'] = d + (self.x_re - self.x_ref) * tau
+        resultado['Calado AV (m)'] = d + (self.x_vante - self.x_ref) * tau
+        resultado['Trim (m)'] = (self.x_vante - self.x_re) * tau
+        resultado['Banda (°)'] = np.degrees(phi)
+        resultado['LCB (m)'] = bx
+        resultado['TCB (m)'] = by
+        resultado['VCB (m)'] = bz
+        resultado['Erro Volume (m³)'] = volume - volume_alvo
+        resultado['Iterações'] = iteracoes
+        resultado['Convergiu'] = convergido
+
+        print(f"Equilíbrio de {len(valores)} condições resolvido em {time.perf_counter() - start_time:.2f} segundos "
+              f"({int(convergido.sum())} convergiram, até {int(iteracoes.max(initial=0))} iterações).")
+        return resultado
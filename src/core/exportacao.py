@@ -0,0 +1,133 @@
+# src/core/exportacao.py
+
+import csv
+import io
+
+# Formato -> (tipo MIME, extensão do arquivo)
+FORMATOS_EXPORTACAO = {
+    'csv': ('text/csv', 'csv'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+    'arrow': ('application/vnd.apache.arrow.stream', 'arrows'),
+}
+# Linhas acumuladas antes de cada envio parcial (bloco CSV, lote Arrow ou grupo de linhas Parquet)
+LINHAS_POR_BLOCO_EXPORTACAO = 50
+# Colunas que não são float64 nos formatos colunares
+TIPOS_COLUNAS_EXPORTACAO = {
+    'vessel_id': 'int64',
+    'Embarcação': 'string',
+    'Refinamento': 'int64',
+}
+
+
+class FormatoIndisponivel(Exception):
+    """O formato pedido depende de um pacote opcional que não está instalado."""
+
+
+def _importar_pyarrow():
+    """Importa o pyarrow (opcional) apenas quando um formato colunar é pedido."""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise FormatoIndisponivel(
+            "Os formatos Parquet e Arrow precisam do pacote 'pyarrow' (pip install pyarrow).") from e
+    return pyarrow
+
+
+def verificar_formato(formato: str):
+    """
+    Confirma que o formato existe e pode ser gerado neste servidor.
+
+    Raises:
+        ValueError: Formato desconhecido.
+        FormatoIndisponivel: Formato colunar sem o pyarrow instalado.
+    """
+    if formato not in FORMATOS_EXPORTACAO:
+        raise ValueError(f"Formato de exportação desconhecido: '{formato}'.")
+    if formato != 'csv':
+        _importar_pyarrow()
+
+
+def _em_blocos(linhas, tamanho: int):
+    """Agrupa um iterável de linhas em listas de até `tamanho` linhas."""
+    bloco = []
+    for linha in linhas:
+        bloco.append(linha)
+        if len(bloco) == tamanho:
+            yield bloco
+            bloco = []
+    if bloco:
+        yield bloco
+
+
+def _gerar_csv(linhas, colunas: list, linhas_por_bloco: int):
+    """Converte as linhas em blocos de texto CSV, à medida que chegam."""
+    buffer = io.StringIO()
+    escritor = csv.DictWriter(buffer, fieldnames=colunas, extrasaction='ignore')
+    escritor.writeheader()
+    for bloco in _em_blocos(linhas, linhas_por_bloco):
+        escritor.writerows(bloco)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _esquema_arrow(pa, colunas: list):
+    return pa.schema([(coluna, TIPOS_COLUNAS_EXPORTACAO.get(coluna, 'float64')) for coluna in colunas])
+
+
+def _gerar_colunar(linhas, colunas: list, formato: str, linhas_por_bloco: int):
+    """
+    Escreve as linhas em Arrow IPC (stream) ou Parquet num buffer em memória,
+    um lote (ou grupo de linhas) por vez, e entrega o que já foi escrito
+    depois de cada lote: só o lote corrente fica na memória.
+    """
+    pa = _importar_pyarrow()
+    esquema = _esquema_arrow(pa, colunas)
+    buffer = io.BytesIO()
+    saida = pa.PythonFile(buffer, mode='w')
+    if formato == 'parquet':
+        escritor = pa.parquet.ParquetWriter(saida, esquema)
+    else:
+        escritor = pa.ipc.new_stream(saida, esquema)
+
+    def _drenar():
+        dados = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return dados
+
+    try:
+        for bloco in _em_blocos(linhas, linhas_por_bloco):
+            lote = pa.RecordBatch.from_pylist(
+                [{coluna: linha.get(coluna) for coluna in colunas} for linha in bloco], schema=esquema)
+            escritor.write_batch(lote)
+            dados = _drenar()
+            if dados:
+                yield dados
+    finally:
+        # Fecha o arquivo (rodapé do Parquet / marcador de fim do stream Arrow)
+        escritor.close()
+    yield _drenar()
+
+
+def gerar_exportacao(linhas, colunas: list, formato: str, linhas_por_bloco: int = LINHAS_POR_BLOCO_EXPORTACAO):
+    """
+    Gera o conteúdo do arquivo exportado em partes, à medida que as linhas
+    (dicionários de resultados) chegam, sem montar a tabela inteira na memória.
+
+    Args:
+        linhas (iterable): Linhas de resultado, por exemplo de `calcular_curvas_stream`.
+        colunas (list): Colunas exportadas, na ordem.
+        formato (str): 'csv', 'parquet' ou 'arrow' (Arrow IPC em formato stream).
+        linhas_por_bloco (int, optional): Linhas por parte enviada.
+
+    Yields:
+        str | bytes: Partes do arquivo (texto no CSV, bytes nos formatos colunares).
+    """
+    verificar_formato(formato)
+    if formato == 'csv':
+        return _gerar_csv(linhas, colunas, linhas_por_bloco)
+    return _gerar_colunar(linhas, colunas, formato, linhas_por_bloco)
@@ -0,0 +1,219 @@
+# src/core/frota.py
+
+import concurrent.futures
+import json
+import os
+import time
+from .armazem_resultados import VERSAO_RESULTADOS
+from .bonjean import caminho_tabela_bonjean
+from .calculos_hidrostaticos import calcular_lote_de_calados, COLUNAS_RESULTADOS
+from .exportacao import gerar_exportacao, FORMATOS_EXPORTACAO
+from .ingestao import carregar_cotas, caminho_cotas_binarias
+from .interpolacao import Casco
+from .pool_calculo import obter_executor
+
+# Embarcações despachadas por worker antes de esperar a primeira terminar
+TAREFAS_POR_WORKER_FROTA = 2
+
+
+def calcular_embarcacao(tarefa: dict) -> dict:
+    """
+    Função "worker" do cálculo da frota: monta o casco de uma embarcação
+    (mapeando o .npy da ingestão) e calcula todos os calados dela no próprio
+    processo, de modo que cada worker trabalha com um único casco por vez.
+
+    Returns:
+        dict: ID da embarcação, assinatura do casco, linhas de resultado e tempo de cálculo.
+    """
+    inicio = time.perf_counter()
+    casco = Casco(carregar_cotas(tarefa['caminho_cotas']), metodo=tarefa['metodo_interp'],
+                  arquivo_cotas=caminho_cotas_binarias(tarefa['caminho_cotas']))
+    casco.arquivo_bonjean = caminho_tabela_bonjean(tarefa['caminho_cotas'], tarefa['metodo_interp'])
+    linhas = calcular_lote_de_calados(casco, tarefa['calados'], tarefa['densidade'], tarefa['metodo_interp'],
+                                      tarefa['motor'])
+    return {
+        'vessel_id': tarefa['vessel_id'],
+        'assinatura': casco.assinatura,
+        'linhas': linhas,
+        'tempo_s': time.perf_counter() - inicio,
+    }
+
+
+class ProgressoFrota:
+    """
+    Registro em disco (JSON) das embarcações já concluídas num cálculo da
+    frota, para retomar o cálculo depois de uma interrupção.
+
+    Uma embarcação só é pulada se os parâmetros do cálculo forem os mesmos e
+    o arquivo de cotas não tiver mudado (nome e data de modificação); com
+    outros parâmetros, o progresso anterior é descartado. As embarcações que
+    falharam ficam registradas à parte, com o erro, e são calculadas de novo
+    na próxima execução.
+    """
+    def __init__(self, caminho: str, parametros: dict):
+        self.caminho = caminho
+        self.parametros = parametros
+        self.concluidas = {}
+        self.falhas = {}
+        if os.path.exists(caminho):
+            with open(caminho, encoding='utf-8') as arquivo:
+                dados = json.load(arquivo)
+            if dados.get('parametros') == parametros:
+                self.concluidas = dados.get('concluidas', {})
+                self.falhas = dados.get('falhas', {})
+            else:
+                print(f"-> Progresso em '{caminho}' é de outros parâmetros; o cálculo recomeça do início.")
+
+    @staticmethod
+    def _estado_arquivo(caminho_cotas: str) -> dict:
+        return {'arquivo': os.path.basename(caminho_cotas), 'mtime_ns': os.stat(caminho_cotas).st_mtime_ns}
+
+    def concluida(self, vessel_id: int, caminho_cotas: str) -> bool:
+        registro = self.concluidas.get(str(vessel_id))
+        return registro is not None and {k: registro.get(k) for k in ('arquivo', 'mtime_ns')} == \
+            self._estado_arquivo(caminho_cotas)
+
+    def marcar(self, vessel_id: int, caminho_cotas: str, assinatura: str, n_calados: int):
+        """Registra a embarcação como concluída e grava o arquivo (de forma atômica)."""
+        self.falhas.pop(str(vessel_id), None)
+        self.concluidas[str(vessel_id)] = {
+            **self._estado_arquivo(caminho_cotas), 'assinatura': assinatura, 'n_calados': n_calados,
+        }
+        self._gravar()
+
+    def marcar_falha(self, vessel_id: int, caminho_cotas: str, erro: str):
+        """Registra a embarcação como falha (não concluída) e grava o arquivo."""
+        self.concluidas.pop(str(vessel_id), None)
+        self.falhas[str(vessel_id)] = {**self._estado_arquivo(caminho_cotas), 'erro': erro}
+        self._gravar()
+
+    def _gravar(self):
+        temporario = f"{self.caminho}.{os.getpid()}.tmp"
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump({'parametros': self.parametros, 'concluidas': self.concluidas, 'falhas': self.falhas},
+                      arquivo, indent=1)
+        os.replace(temporario, self.caminho)
+
+
+def _gravar_arquivo(linhas: list, caminho: str, formato: str):
+    """Grava a tabela de uma embarcação no formato pedido (arquivo temporário + renomeação)."""
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    modo = 'w' if formato == 'csv' else 'wb'
+    with open(temporario, modo, **({'newline': '', 'encoding': 'utf-8'} if formato == 'csv' else {})) as arquivo:
+        for parte in gerar_exportacao(linhas, COLUNAS_RESULTADOS, formato):
+            arquivo.write(parte)
+    os.replace(temporario, caminho)
+
+
+def calcular_frota(embarcacoes: list, densidade: float, metodo_interp: str, motor: str, caminho_progresso: str,
+                   armazem=None, diretorio_saida: str | None = None, formato: str = 'csv',
+                   max_workers: int | None = None, parametros_calados: dict | None = None,
+                   ao_falhar=None) -> dict:
+    """
+    Calcula a tabela hidrostática de várias embarcações, distribuindo uma
+    embarcação (um casco) por tarefa no pool de processos.
+
+    Os resultados de cada embarcação são gravados assim que ela termina, no
+    armazém de resultados e/ou em um arquivo por embarcação, e o progresso é
+    registrado em `caminho_progresso`: rodar de novo com os mesmos parâmetros
+    pula as embarcações já concluídas. O erro de uma embarcação não interrompe
+    as demais: ela é registrada como falha e o cálculo continua.
+
+    Args:
+        embarcacoes (list): Dicionários com 'vessel_id', 'nome', 'caminho_cotas' e 'calados'.
+        densidade (float): Densidade da água (t/m³).
+        metodo_interp (str): Método de interpolação ('linear' ou 'pchip').
+        motor (str): Motor de cálculo ('vetorizado' ou 'quad').
+        caminho_progresso (str): Arquivo JSON do progresso (para retomar o cálculo).
+        armazem (ArmazemResultados, optional): Armazém onde gravar as linhas.
+        diretorio_saida (str, optional): Pasta dos arquivos por embarcação.
+        formato (str, optional): Formato dos arquivos ('csv', 'parquet' ou 'arrow').
+        max_workers (int, optional): Processos do pool (1 calcula no próprio processo).
+        parametros_calados (dict, optional): Definição dos calados, registrada no progresso.
+        ao_falhar (callable, optional): Chamada com (embarcação, mensagem) a cada falha;
+            por padrão, a mensagem é impressa.
+
+    Returns:
+        dict: Resumo com as embarcações calculadas, puladas, com falha, calados, tempo e vazão.
+    """
+    parametros = {
+        'densidade': densidade, 'metodo_interp': metodo_interp, 'motor': motor,
+        'calados': parametros_calados, 'versao': VERSAO_RESULTADOS,
+        'saida': os.path.abspath(diretorio_saida) if diretorio_saida else None, 'formato': formato,
+    }
+    progresso = ProgressoFrota(caminho_progresso, parametros)
+    pendentes = [e for e in embarcacoes if not progresso.concluida(e['vessel_id'], e['caminho_cotas'])]
+    puladas = len(embarcacoes) - len(pendentes)
+    if puladas:
+        print(f"-> {puladas} embarcações já concluídas em execução anterior foram puladas.")
+    if diretorio_saida:
+        os.makedirs(diretorio_saida, exist_ok=True)
+
+    por_id = {e['vessel_id']: e for e in pendentes}
+    tarefas = ({'vessel_id': e['vessel_id'], 'caminho_cotas': e['caminho_cotas'], 'calados': e['calados'],
+                'densidade': densidade, 'metodo_interp': metodo_interp, 'motor': motor} for e in pendentes)
+    n_workers = max_workers or os.cpu_count() or 1
+
+    resumo = {'embarcacoes': len(embarcacoes), 'calculadas': 0, 'puladas': puladas, 'falhas': 0, 'calados': 0}
+    inicio = time.perf_counter()
+
+    def _concluir(resultado: dict):
+        embarcacao = por_id[resultado['vessel_id']]
+        linhas = resultado['linhas']
+        if armazem is not None:
+            armazem.gravar(resultado['assinatura'], densidade, metodo_interp, linhas, resultado['vessel_id'])
+        if diretorio_saida:
+            nome = f"hidrostatica_{resultado['vessel_id']}_{metodo_interp}.{FORMATOS_EXPORTACAO[formato][1]}"
+            _gravar_arquivo(linhas, os.path.join(diretorio_saida, nome), formato)
+        progresso.marcar(resultado['vessel_id'], embarcacao['caminho_cotas'], resultado['assinatura'], len(linhas))
+
+        resumo['calculadas'] += 1
+        resumo['calados'] += len(linhas)
+        print(f"[{resumo['calculadas']}/{len(pendentes)}] {embarcacao['nome']} (id {resultado['vessel_id']}): "
+              f"{len(linhas)} calados em {resultado['tempo_s']:.2f} s")
+
+    def _processar(vessel_id: int, obter_resultado):
+        """Conclui uma embarcação; um erro no cálculo ou na gravação vira falha dela."""
+        try:
+            _concluir(obter_resultado())
+        except Exception as e:
+            embarcacao = por_id[vessel_id]
+            erro = f"{type(e).__name__}: {e}"
+            progresso.marcar_falha(vessel_id, embarcacao['caminho_cotas'], erro)
+            resumo['falhas'] += 1
+            mensagem = f"Falha em {embarcacao['nome']} (id {vessel_id}): {erro}"
+            if ao_falhar is not None:
+                ao_falhar(embarcacao, mensagem)
+            else:
+                print(f"!!! {mensagem} !!!")
+
+    if n_workers == 1:
+        for tarefa in tarefas:
+            _processar(tarefa['vessel_id'], lambda: calcular_embarcacao(tarefa))
+    else:
+        executor = obter_executor(max_workers)
+        em_andamento = set()
+        ids_futuros = {}
+        try:
+            for tarefa in tarefas:
+                futuro = executor.submit(calcular_embarcacao, tarefa)
+                ids_futuros[futuro] = tarefa['vessel_id']
+                em_andamento.add(futuro)
+                # Limita as embarcações em voo: os resultados são gravados à medida que chegam
+                if len(em_andamento) >= n_workers * TAREFAS_POR_WORKER_FROTA:
+                    prontos, em_andamento = concurrent.futures.wait(
+                        em_andamento, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for futuro in prontos:
+                        _processar(ids_futuros.pop(futuro), futuro.result)
+            for futuro in concurrent.futures.as_completed(em_andamento):
+                _processar(ids_futuros.pop(futuro), futuro.result)
+        finally:
+            # Numa interrupção, as embarcações ainda não iniciadas são canceladas
+            for futuro in em_andamento:
+                futuro.cancel()
+
+    duracao = time.perf_counter() - inicio
+    resumo['tempo_s'] = duracao
+    resumo['cascos_por_s'] = resumo['calculadas'] / duracao if duracao > 0 else 0.0
+    resumo['calados_por_s'] = resumo['calados'] / duracao if duracao > 0 else 0.0
+    return resumo
@@ -0,0 +1,167 @@
+# src/core/ingestao.py
+
+import glob
+import os
+import numpy as np
+
+# Versão do formato binário das cotas (faz parte do nome do arquivo; outra versão é regerada)
+VERSAO_COTAS_BINARIAS = 2
+# Linhas lidas por bloco do CSV
+LINHAS_POR_BLOCO_LEITURA = 200_000
+# Extensões aceitas no envio da tabela de cotas
+EXTENSOES_TABELA_COTAS = ('csv', 'txt', 'npy')
+
+
+class ErroIngestao(ValueError):
+    """A tabela de cotas enviada não pode ser usada (formato ou geometria inválidos)."""
+
+
+def caminho_cotas_binarias(caminho_cotas: str) -> str:
+    """Arquivo .npy das cotas validadas, gravado ao lado do arquivo de cotas enviado."""
+    return f"{caminho_cotas}.cotas-v{VERSAO_COTAS_BINARIAS}.npy"
+
+
+def remover_cotas_binarias(caminho_cotas: str):
+    """Apaga as cotas binárias (de todas as versões) gravadas para um arquivo de cotas."""
+    for caminho in glob.glob(glob.escape(caminho_cotas) + '.cotas-v*.npy'):
+        try:
+            os.remove(caminho)
+        except OSError:
+            pass
+
+
+def _ler_csv(caminho: str) -> np.ndarray:
+    """
+    Lê um CSV X, Y, Z (sem cabeçalho) em blocos, já como float64, sem montar
+    um DataFrame intermediário do arquivo inteiro.
+    """
+    import pandas as pd
+
+    blocos = []
+    try:
+        leitor = pd.read_csv(caminho, header=None, names=['X', 'Y', 'Z'], usecols=[0, 1, 2],
+                             dtype='float64', engine='c', chunksize=LINHAS_POR_BLOCO_LEITURA)
+        for bloco in leitor:
+            blocos.append(bloco.to_numpy(dtype=float))
+    except (ValueError, pd.errors.ParserError) as e:
+        raise ErroIngestao(f"O arquivo deve ter três colunas numéricas (X, Y, Z) sem cabeçalho: {e}") from e
+    if not blocos:
+        return np.empty((0, 3))
+    return np.concatenate(blocos)
+
+
+def _ler_npy(caminho: str) -> np.ndarray:
+    """Lê uma matriz (n_pontos × 3) de cotas gravada com `np.save`."""
+    try:
+        cotas = np.load(caminho, allow_pickle=False)
+    except (OSError, ValueError) as e:
+        raise ErroIngestao(f"Arquivo .npy ilegível: {e}") from e
+    if cotas.ndim != 2 or cotas.shape[1] != 3:
+        raise ErroIngestao(f"O arquivo .npy deve conter uma matriz com três colunas (X, Y, Z); recebido {cotas.shape}.")
+    return np.asarray(cotas, dtype=float)
+
+
+def validar_cotas(cotas: np.ndarray) -> tuple[np.ndarray, dict]:
+    """
+    Valida as cotas e as normaliza: ordena por baliza (X) e altura (Z),
+    remove pontos repetidos e verifica que Z é estritamente crescente em
+    cada baliza (duas meias-bocas diferentes na mesma altura tornam a baliza ambígua).
+
+    Args:
+        cotas (np.ndarray): Matriz (n_pontos × 3) com X, Y e Z.
+
+    Returns:
+        tuple: As cotas normalizadas (em ordem Fortran, com cada coluna
+               contígua) e um resumo da ingestão.
+
+    Raises:
+        ErroIngestao: Se os valores não forem finitos, houver meias-bocas
+            negativas, pontos conflitantes ou menos de duas balizas.
+    """
+    if len(cotas) == 0:
+        raise ErroIngestao("A tabela de cotas está vazia.")
+    if not np.isfinite(cotas).all():
+        linha = int(np.argmax(~np.isfinite(cotas).all(axis=1))) + 1
+        raise ErroIngestao(f"Valor ausente ou não numérico na linha {linha} da tabela de cotas.")
+    if (cotas[:, 1] < 0).any():
+        linha = int(np.argmax(cotas[:, 1] < 0)) + 1
+        raise ErroIngestao(f"Meia-boca (Y) negativa na linha {linha}; informe apenas um bordo, com Y ≥ 0.")
+
+    ordem = np.lexsort((cotas[:, 1], cotas[:, 2], cotas[:, 0]))
+    fora_de_ordem = int((np.diff(ordem) != 1).sum())
+    cotas = cotas[ordem]
+
+    # Pontos idênticos são descartados; mesma altura com meias-bocas diferentes é erro
+    repetido = np.zeros(len(cotas), dtype=bool)
+    repetido[1:] = (cotas[1:] == cotas[:-1]).all(axis=1)
+    cotas = cotas[~repetido]
+    mesma_altura = (cotas[1:, 0] == cotas[:-1, 0]) & (cotas[1:, 2] == cotas[:-1, 2])
+    if mesma_altura.any():
+        x, _, z = cotas[int(np.argmax(mesma_altura))]
+        raise ErroIngestao(f"A baliza X={x:g} tem mais de uma meia-boca na altura Z={z:g}.")
+
+    posicoes, pontos_por_baliza = np.unique(cotas[:, 0], return_counts=True)
+    if len(posicoes) < 2:
+        raise ErroIngestao("A tabela de cotas precisa de pelo menos duas balizas.")
+
+    resumo = {
+        'n_pontos': len(cotas),
+        'n_balizas': len(posicoes),
+        'pontos_repetidos': int(repetido.sum()),
+        'pontos_reordenados': fora_de_ordem,
+        'balizas_com_um_ponto': int((pontos_por_baliza < 2).sum()),
+    }
+    return np.asfortranarray(cotas), resumo
+
+
+def ingerir_tabela_cotas(caminho: str) -> dict:
+    """
+    Lê, valida e converte a tabela de cotas enviada para o formato binário
+    (.npy), lido diretamente pelo cache de cascos nas requisições seguintes.
+
+    Args:
+        caminho (str): Arquivo enviado (.csv/.txt com X, Y, Z ou .npy).
+
+    Returns:
+        dict: Resumo da ingestão (pontos, balizas, repetidos removidos...).
+
+    Raises:
+        ErroIngestao: Se o arquivo não puder ser lido ou as cotas forem inválidas.
+    """
+    if caminho.lower().endswith('.npy'):
+        cotas = _ler_npy(caminho)
+    else:
+        cotas = _ler_csv(caminho)
+    cotas, resumo = validar_cotas(cotas)
+
+    # Arquivos de versões anteriores do formato não serão mais lidos
+    remover_cotas_binarias(caminho)
+    destino = caminho_cotas_binarias(caminho)
+    temporario = f"{destino}.{os.getpid()}.tmp"
+    with open(temporario, 'wb') as arquivo:
+        np.save(arquivo, cotas)
+    os.replace(temporario, destino)
+    print(f"-> Tabela de cotas ingerida: {resumo['n_pontos']} pontos em {resumo['n_balizas']} balizas "
+          f"({resumo['pontos_repetidos']} repetidos removidos).")
+    return resumo
+
+
+def carregar_cotas(caminho: str, mapear: bool = True) -> np.ndarray:
+    """
+    Cotas validadas (n_pontos × 3, ordenadas por X e Z) de um arquivo enviado.
+
+    Usa o .npy gerado na ingestão se ele for mais novo que o arquivo enviado;
+    caso contrário (arquivos anteriores à ingestão ou substituídos), ingere de novo.
+
+    Args:
+        caminho (str): Arquivo de cotas enviado.
+        mapear (bool, optional): Mapeia o .npy somente leitura em vez de lê-lo;
+            os processos que mapeiam o mesmo arquivo compartilham as páginas.
+
+    Returns:
+        np.ndarray: Matriz com as colunas X, Y e Z (`np.memmap` se `mapear`).
+    """
+    binario = caminho_cotas_binarias(caminho)
+    if not (os.path.exists(binario) and os.path.getmtime(binario) >= os.path.getmtime(caminho)):
+        ingerir_tabela_cotas(caminho)
+    return np.load(binario, mmap_mode='r' if mapear else None, allow_pickle=False)
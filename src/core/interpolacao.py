@@ -1,47 +1,136 @@
+import hashlib
+from typing import TYPE_CHECKING
 import numpy as np
-import pandas as pd
-from scipy.interpolate import PchipInterpolator, interp1d
+from .casco_compacto import CascoCompacto, bytes_privados
+from .bonjean import TabelaBonjean
+from ..utils.integrador import coeficientes_por_partes
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _escolher_raiz(candidatas: np.ndarray, estimativa: np.ndarray) -> np.ndarray:
+    """
+    Entre as raízes candidatas (uma por linha), escolhe a que está em [0, 1];
+    se houver mais de uma, a mais próxima da estimativa pela secante.
+    """
+    candidatas = np.where((candidatas >= -1e-9) & (candidatas <= 1 + 1e-9), candidatas, np.nan)
+    distancia = np.where(np.isnan(candidatas), np.inf, np.abs(candidatas - estimativa))
+    melhor = np.take_along_axis(candidatas, np.argmin(distancia, axis=0)[None, :], axis=0)[0]
+    return np.where(np.isnan(melhor), estimativa, melhor)
+
 
 class Casco:
     """
     Representa a geometria do casco de uma embarcação, 
     permitindo a interpolação das suas formas.
     """
-    def __init__(self, tabela_de_cotas_df: pd.DataFrame, metodo: str):
+    def __init__(self, cotas, metodo: str, arquivo_cotas: str | None = None):
         """
         Inicializa o objeto Casco a partir de uma tabela de cotas.
 
         Args:
-            tabela_de_cotas_df (pd.DataFrame): DataFrame com colunas 'X', 'Y', 'Z'.
+            cotas (pd.DataFrame | np.ndarray): DataFrame com colunas 'X', 'Y', 'Z'
+                ou matriz (n_pontos × 3) com as mesmas colunas, possivelmente um
+                arquivo mapeado somente leitura (`np.load(..., mmap_mode='r')`).
+            metodo (str): Método de interpolação ('linear' ou 'pchip').
+            arquivo_cotas (str, optional): Arquivo .npy de onde `cotas` foi
+                mapeada; permite que os workers mapeiem o mesmo arquivo.
         """
         print(f"-> Inicializando objeto Casco com método '{metodo}'...")
-        self.df = tabela_de_cotas_df
+        if not isinstance(cotas, np.ndarray):
+            # DataFrame (o pandas não é importado aqui: os workers só precisam do NumPy)
+            cotas = cotas[['X', 'Y', 'Z']].to_numpy(dtype=float)
+        self.cotas = cotas
+        self.arquivo_cotas = arquivo_cotas
         self.metodo = metodo
-        
-        # Identifica as posições únicas das balizas na direção X e as ordena
-        self.posicoes_balizas = sorted(self.df['X'].unique())
-        
-        # Dicionário para armazenar as funções de interpolação de cada baliza
-        self.funcoes_baliza = {}
-
-        # Chama o método privado para criar as funções
-        self._criar_interpoladores_balizas()
+
+        # Identifica o casco preparado (cotas + método) em caches e armazéns de resultados
+        self.assinatura = hashlib.sha256(np.ascontiguousarray(self.cotas, dtype=float).tobytes() + metodo.encode()).hexdigest()
+
+        # Balizas em arrays contíguos (pontos, derivadas PCHIP e curvas cumulativas
+        # de área e momento), usados em todas as avaliações do casco
+        self.compacto = CascoCompacto.de_cotas(self.cotas, metodo)
+
+        # Posições únicas das balizas na direção X, em ordem crescente
+        self.posicoes_balizas = self.compacto.posicoes.tolist()
+
+        # Interpoladores scipy por baliza e do perfil, criados apenas se forem pedidos
+        self._funcoes_baliza = None
+        self._funcao_perfil = None
+
+        # Tabela de Bonjean, criada na primeira consulta; se `arquivo_bonjean`
+        # for definido (cache de cascos, workers, frota), é lida/gravada nesse arquivo
+        self._bonjean = None
+        self.arquivo_bonjean = None
+
         self._criar_interpolador_perfil()
 
-        print(f"-> Objeto Casco inicializado. {len(self.funcoes_baliza)} balizas interpoladas.")
+        print(f"-> Objeto Casco inicializado. {int(self.compacto.interpolavel.sum())} balizas interpoladas.")
+
+    @property
+    def df(self) -> 'pd.DataFrame':
+        """
+        Tabela de cotas como DataFrame (X, Y, Z), montada sob demanda sobre
+        `self.cotas`. Mantida por compatibilidade; os cálculos não a usam.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.cotas, columns=['X', 'Y', 'Z'], copy=False)
 
-    def _criar_interpoladores_balizas(self):
+    @property
+    def funcoes_baliza(self) -> dict:
+        """
+        Dicionário X -> interpolador scipy de cada baliza. Mantido por
+        compatibilidade; os cálculos usam `self.compacto`.
+        """
+        if self._funcoes_baliza is None:
+            self._funcoes_baliza = self._criar_interpoladores_balizas()
+        return self._funcoes_baliza
+
+    @property
+    def funcao_perfil(self):
+        """
+        Interpolador scipy do perfil da quilha (X -> Z), usado nos gráficos.
+        None se o casco tiver uma única baliza; os cálculos usam `self._perfil_nos`.
+        """
+        if self._funcao_perfil is None and self._perfil_nos is not None:
+            from scipy.interpolate import PchipInterpolator, interp1d
+
+            x_nos, z_nos, _ = self._perfil_nos
+            if self.metodo == 'linear':
+                self._funcao_perfil = interp1d(x_nos, z_nos, kind='linear', bounds_error=False, fill_value=0)
+            else:
+                self._funcao_perfil = PchipInterpolator(x_nos, z_nos, extrapolate=False)
+        return self._funcao_perfil
+
+    @property
+    def bonjean(self) -> TabelaBonjean:
+        """
+        Curvas de Bonjean (área e momento de cada baliza por calado) do casco,
+        de onde os motores de cálculo tiram as áreas e os momentos das seções.
+        """
+        if self._bonjean is None:
+            if self.arquivo_bonjean:
+                self._bonjean = TabelaBonjean.carregar_ou_gerar(self, self.arquivo_bonjean)
+            else:
+                self._bonjean = TabelaBonjean.de_casco(self)
+        return self._bonjean
+
+    def _criar_interpoladores_balizas(self) -> dict:
         """
         Método privado que itera sobre cada baliza e cria uma função 
         de interpolação para sua forma.
         """
-        for x_val in self.posicoes_balizas:
-            # Filtra o DataFrame para obter os pontos de uma única baliza
-            df_baliza = self.df[self.df['X'] == x_val].sort_values('Z')
-            
-            # Pega os valores de Z (altura) e Y (meia-boca)
-            z_coords = df_baliza['Z'].values
-            y_coords = df_baliza['Y'].values
+        from scipy.interpolate import PchipInterpolator, interp1d
+
+        funcoes_baliza = {}
+        compacto = self.compacto
+        for indice, x_val in enumerate(self.posicoes_balizas):
+            # Pontos de uma única baliza (já ordenados por Z na representação compacta)
+            inicio, fim = compacto.inicios[indice], compacto.inicios[indice + 1]
+            z_coords = np.array(compacto.z[inicio:fim])
+            y_coords = np.array(compacto.y[inicio:fim])
 
             # Evita erros se houver poucos pontos para interpolar
             if len(z_coords) > 1:
@@ -54,23 +143,124 @@ class Casco:
                     interpolador = PchipInterpolator(z_coords, y_coords, extrapolate=False)
 
                 # Armazena a função no dicionário, usando a posição X como chave
-                self.funcoes_baliza[x_val] = interpolador
+                funcoes_baliza[x_val] = interpolador
+        return funcoes_baliza
 
     def _criar_interpolador_perfil(self):
         """
         Cria um interpolador para o perfil longitudinal da quilha (X -> Z).
         """
         print("-> Criando interpolador para o perfil do casco (linha da quilha)...")
-        # Agrupa por X, pega a posição X e a altura mínima Z (quilha)
-        dados_perfil = self.df.groupby('X').agg(Z_min=('Z', 'min')).reset_index()
-        dados_perfil = dados_perfil.sort_values('X')
-        
-        if len(dados_perfil['X']) > 1:
-            if self.metodo == 'linear':
-                self.funcao_perfil = interp1d(dados_perfil['X'], dados_perfil['Z_min'], kind='linear', bounds_error=False, fill_value=0)
-            else:
-                self.funcao_perfil = PchipInterpolator(dados_perfil['X'], dados_perfil['Z_min'], extrapolate=False)
+        # Posição X e altura mínima Z (quilha) de cada baliza: o primeiro ponto, com Z crescente
+        compacto = self.compacto
+        x_nos = np.asarray(compacto.posicoes, dtype=float)
+        z_nos = np.asarray(compacto.z[compacto.inicios[:-1]], dtype=float)
 
+        self._perfil_nos = None
+        if len(x_nos) > 1:
+            # Coeficientes de cada trecho do perfil na base local:
+            # z(x) = c0·s³ + c1·s² + c2·s + c3, com s = x - x_k
+            # (os mesmos do interpolador scipy, calculados com NumPy)
+            coeficientes = np.zeros((4, len(x_nos) - 1))
+            por_partes = coeficientes_por_partes(x_nos, z_nos, self.metodo)
+            coeficientes[4 - len(por_partes):] = por_partes
+            self._perfil_nos = (x_nos, z_nos, coeficientes)
+
+
+    def intersecoes_perfil(self, calados) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Encontra as extremidades de ré e de vante da linha d'água (interseções
+        do perfil da quilha com cada calado) para um vetor de calados.
+
+        Cada trecho do perfil (linear ou PCHIP) é monótono entre seus pontos,
+        então as interseções ficam delimitadas pelas trocas de sinal de
+        z(x_k) - T nos pontos do interpolador, e a raiz em cada trecho é obtida
+        analiticamente. x_re é a interseção mais a ré e x_vante a mais a vante;
+        se o perfil já está abaixo do calado numa extremidade, ela própria é usada.
+        Calados abaixo da quilha resultam em linha d'água de comprimento nulo.
+
+        Args:
+            calados (float | array): Calado(s) de consulta.
+
+        Returns:
+            tuple: Arrays x_re e x_vante com a forma de `calados`.
+        """
+        calados = np.asarray(calados, dtype=float)
+        if self._perfil_nos is None:
+            return np.zeros_like(calados), np.zeros_like(calados)
+
+        x_nos, z_nos, coeficientes = self._perfil_nos
+        T = np.atleast_1d(calados).ravel()
+        molhado = z_nos[None, :] <= T[:, None]
+        algum_molhado = molhado.any(axis=1)
+        ultimo = len(x_nos) - 1
+
+        # Ré: primeiro ponto molhado; a interseção está no trecho anterior a ele
+        k_re = np.argmax(molhado, axis=1)
+        x_re = np.where(k_re > 0, self._raiz_trecho_perfil(np.maximum(k_re - 1, 0), T), x_nos[k_re])
+
+        # Vante: último ponto molhado; a interseção está no trecho seguinte a ele
+        k_vante = ultimo - np.argmax(molhado[:, ::-1], axis=1)
+        x_vante = np.where(k_vante < ultimo, self._raiz_trecho_perfil(np.minimum(k_vante, ultimo - 1), T), x_nos[k_vante])
+
+        x_fundo = x_nos[np.argmin(z_nos)]
+        x_re = np.where(algum_molhado, x_re, x_fundo)
+        x_vante = np.where(algum_molhado, x_vante, x_fundo)
+        return x_re.reshape(calados.shape), x_vante.reshape(calados.shape)
+
+    def _raiz_trecho_perfil(self, trechos: np.ndarray, calados: np.ndarray) -> np.ndarray:
+        """
+        Resolve z(x) = T no trecho indicado para cada calado, sabendo que há
+        troca de sinal entre os extremos do trecho.
+
+        Na variável normalizada u = (x - x_k)/h ∈ [0, 1], o trecho é o polinômio
+        a·u³ + b·u² + c·u + d, resolvido pela fórmula da reta, da parábola ou
+        pelos autovalores da matriz companheira da cúbica, conforme o grau efetivo.
+        """
+        x_nos, z_nos, coeficientes = self._perfil_nos
+        h = x_nos[trechos + 1] - x_nos[trechos]
+        a = coeficientes[0, trechos] * h ** 3
+        b = coeficientes[1, trechos] * h ** 2
+        c = coeficientes[2, trechos] * h
+        d = coeficientes[3, trechos] - calados
+        escala = np.abs(a) + np.abs(b) + np.abs(c) + np.abs(d) + 1e-300
+
+        # Estimativa pela secante, usada como solução no caso linear
+        z0, z1 = z_nos[trechos], z_nos[trechos + 1]
+        u = np.divide(calados - z0, z1 - z0, out=np.zeros_like(calados), where=z1 != z0)
+
+        quadratico = (np.abs(a) <= 1e-12 * escala) & (np.abs(b) > 1e-12 * escala)
+        if quadratico.any():
+            bq, cq, dq = b[quadratico], c[quadratico], d[quadratico]
+            raiz_delta = np.sqrt(np.maximum(cq ** 2 - 4 * bq * dq, 0.0))
+            # Forma numericamente estável das raízes da equação do 2º grau
+            q = -0.5 * (cq + np.copysign(raiz_delta, cq))
+            candidatas = np.stack([np.divide(q, bq), np.divide(dq, q, out=np.full_like(q, np.nan), where=q != 0)])
+            u[quadratico] = _escolher_raiz(candidatas, u[quadratico])
+
+        cubico = np.abs(a) > 1e-12 * escala
+        if cubico.any():
+            ac, bc, cc, dc = a[cubico], b[cubico], c[cubico], d[cubico]
+            companheiras = np.zeros((len(ac), 3, 3))
+            companheiras[:, 0, :] = -np.stack([bc / ac, cc / ac, dc / ac], axis=1)
+            companheiras[:, 1, 0] = 1.0
+            companheiras[:, 2, 1] = 1.0
+            raizes = np.linalg.eigvals(companheiras)
+            reais = np.where(np.abs(raizes.imag) <= 1e-7, raizes.real, np.nan).T
+            u[cubico] = _escolher_raiz(reais, u[cubico])
+
+        return x_nos[trechos] + np.clip(u, 0.0, 1.0) * h
+
+    def obter_areas_e_momentos(self, calados) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Áreas e momentos verticais de todas as balizas para todos os calados.
+
+        Returns:
+            tuple: Matrizes (n_balizas × n_calados) de áreas e de momentos verticais.
+        """
+        calados = np.atleast_1d(np.asarray(calados, dtype=float))
+        indices = np.arange(self.compacto.n_balizas)[:, None]
+        return self.compacto.areas_e_momentos(indices, calados[None, :])
 
     def obter_meia_boca(self, x_baliza: float, z: float) -> float:
         """
@@ -84,13 +274,22 @@ class Casco:
             float: O valor da meia-boca (Y). Retorna 0 se a baliza não existir 
                    ou se a altura Z estiver fora do range definido.
         """
-        funcao_interpoladora = self.funcoes_baliza.get(x_baliza)
-        
-        if funcao_interpoladora:
-            # Usa a função de interpolação para encontrar Y no ponto Z
-            meia_boca = funcao_interpoladora(z)
-            # Retorna 0 se o resultado for NaN (ocorre com extrapolate=False)
-            return np.nan_to_num(meia_boca)
-        else:
-            # Se a baliza exata não existir no dicionário, retorna 0
-            return 0.0
\ No newline at end of file
+        return float(self.compacto.meia_boca(self.compacto.indices_de(x_baliza), z))
+
+    def tamanho_em_bytes(self) -> int:
+        """
+        Estima a memória ocupada pelo casco (tabela de cotas, representação
+        compacta e interpoladores), usada para limitar o cache de cascos.
+        Cotas mapeadas de arquivo não contam: são compartilhadas pelo sistema.
+
+        Returns:
+            int: Tamanho aproximado em bytes.
+        """
+        total = bytes_privados(self.cotas) + self.compacto.tamanho_em_bytes()
+        if self._bonjean is not None:
+            total += self._bonjean.tamanho_em_bytes()
+        interpoladores = list((self._funcoes_baliza or {}).values()) + [self._funcao_perfil]
+        for interpolador in interpoladores:
+            if interpolador is not None:
+                total += sum(v.nbytes for v in vars(interpolador).values() if isinstance(v, np.ndarray))
+        return total
@@ -0,0 +1,80 @@
+# src/core/perfil_calculo.py
+
+from typing import TYPE_CHECKING
+import contextlib
+import time
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+COLUNAS_PERFIL = [
+    'Fase', 'Calados', 'Tempo total (ms)', 'Tempo médio (ms)', '% do tempo',
+    'Avaliações', 'Avaliações por calado',
+]
+
+
+class PerfilCalculo:
+    """
+    Instrumentação opcional das fases de cálculo de um calado: tempo de
+    relógio e número de avaliações de cada fase (trechos de polinômio
+    integrados, somados com `somar_chamadas`).
+
+    Os registros são dicionários simples (calado, fase, tempo_s, chamadas),
+    que atravessam o pool de processos sem custo e são agregados por
+    `resumir_perfil`.
+    """
+    def __init__(self, calado: float):
+        self.calado = calado
+        self.registros = []
+        self._atual = None
+
+    @contextlib.contextmanager
+    def fase(self, nome: str):
+        """Mede o bloco como a fase `nome`; as chamadas contadas dentro dele são atribuídas a ela."""
+        registro = {'calado': self.calado, 'fase': nome, 'tempo_s': 0.0, 'chamadas': 0}
+        anterior, self._atual = self._atual, registro
+        inicio = time.perf_counter()
+        try:
+            yield registro
+        finally:
+            registro['tempo_s'] = time.perf_counter() - inicio
+            self._atual = anterior
+            self.registros.append(registro)
+
+    def somar_chamadas(self, quantidade: int):
+        """Soma `quantidade` avaliações à fase corrente."""
+        if self._atual is not None:
+            self._atual['chamadas'] += quantidade
+
+
+def resumir_perfil(registros: list) -> 'pd.DataFrame':
+    """
+    Agrega os registros de todos os calados (e de todos os workers) por fase,
+    na ordem em que as fases aparecem.
+
+    Args:
+        registros (list): Dicionários com 'calado', 'fase', 'tempo_s' e 'chamadas'.
+
+    Returns:
+        pd.DataFrame: Uma linha por fase, com as colunas de `COLUNAS_PERFIL`.
+    """
+    import pandas as pd
+
+    if not registros:
+        return pd.DataFrame(columns=COLUNAS_PERFIL)
+
+    df = pd.DataFrame(registros)
+    agrupado = df.groupby('fase', sort=False).agg(
+        calados=('calado', 'nunique'), tempo_s=('tempo_s', 'sum'), chamadas=('chamadas', 'sum'))
+    tempo_total = agrupado['tempo_s'].sum()
+
+    resumo = pd.DataFrame({
+        'Fase': agrupado.index,
+        'Calados': agrupado['calados'].to_numpy(),
+        'Tempo total (ms)': agrupado['tempo_s'].to_numpy() * 1000,
+        'Tempo médio (ms)': (agrupado['tempo_s'] / agrupado['calados']).to_numpy() * 1000,
+        '% do tempo': (agrupado['tempo_s'] / tempo_total * 100 if tempo_total > 0 else agrupado['tempo_s'] * 0).to_numpy(),
+        'Avaliações': agrupado['chamadas'].to_numpy(),
+        'Avaliações por calado': (agrupado['chamadas'] / agrupado['calados']).to_numpy(),
+    })
+    return resumo[COLUNAS_PERFIL]
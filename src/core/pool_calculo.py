@@ -0,0 +1,152 @@
+# src/core/pool_calculo.py
+
+import atexit
+import concurrent.futures
+import threading
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory
+import numpy as np
+from .interpolacao import Casco
+
+# Quantos cascos cada lado mantém publicados/reconstruídos ao mesmo tempo
+MAX_CASCOS_PUBLICADOS = 8
+MAX_CASCOS_POR_WORKER = 4
+
+_executor = None
+_executor_max_workers = None
+_memorias = OrderedDict()   # assinatura -> (SharedMemory, descritor)
+_trava = threading.Lock()
+
+
+# ==============================================================================
+# LADO DO PROCESSO PRINCIPAL
+# ==============================================================================
+
+def obter_executor(max_workers: int | None = None) -> concurrent.futures.ProcessPoolExecutor:
+    """
+    Retorna o pool de processos persistente, criando-o na primeira chamada
+    (ou de novo, se o número de workers mudar ou o pool tiver quebrado).
+    """
+    global _executor, _executor_max_workers
+    with _trava:
+        quebrado = _executor is not None and getattr(_executor, '_broken', False)
+        if _executor is None or quebrado or max_workers != _executor_max_workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False, cancel_futures=True)
+            # Os workers precisam herdar o resource_tracker do processo principal, mesmo
+            # que o pool seja criado antes do primeiro bloco de memória compartilhada
+            # (cascos mapeados de arquivo não criam blocos)
+            resource_tracker.ensure_running()
+            _executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+            _executor_max_workers = max_workers
+        return _executor
+
+
+def publicar_casco(casco: Casco) -> dict:
+    """
+    Torna as cotas do casco (X, Y, Z) acessíveis aos workers, uma única vez
+    por assinatura, e devolve o descritor leve enviado às tarefas.
+
+    Se o casco foi mapeado de um arquivo .npy (`casco.arquivo_cotas`), os
+    workers mapeiam o mesmo arquivo e nada é copiado; caso contrário, as
+    cotas são copiadas para um bloco de memória compartilhada.
+
+    Returns:
+        dict: Assinatura, arquivo ou nome do bloco, número de pontos, método do
+              casco e, se houver, o arquivo da tabela de Bonjean.
+    """
+    with _trava:
+        if casco.assinatura in _memorias:
+            _memorias.move_to_end(casco.assinatura)
+            return _memorias[casco.assinatura][1]
+
+        descritor = {
+            'assinatura': casco.assinatura,
+            'n_pontos': len(casco.cotas),
+            'metodo': casco.metodo,
+        }
+        if casco.arquivo_bonjean:
+            # Os workers leem a tabela gravada em vez de recalculá-la
+            descritor['arquivo_bonjean'] = casco.arquivo_bonjean
+        if casco.arquivo_cotas:
+            memoria = None
+            descritor['arquivo_cotas'] = casco.arquivo_cotas
+        else:
+            cotas = np.ascontiguousarray(casco.cotas, dtype=float)
+            memoria = shared_memory.SharedMemory(create=True, size=max(cotas.nbytes, 1))
+            np.ndarray(cotas.shape, dtype=float, buffer=memoria.buf)[:] = cotas
+            descritor['nome_memoria'] = memoria.name
+        _memorias[casco.assinatura] = (memoria, descritor)
+
+        while len(_memorias) > MAX_CASCOS_PUBLICADOS:
+            _, (antiga, _) = _memorias.popitem(last=False)
+            if antiga is not None:
+                antiga.close()
+                antiga.unlink()
+        return descritor
+
+
+@atexit.register
+def encerrar_pool():
+    """Encerra o pool e libera todos os blocos de memória compartilhada."""
+    global _executor
+    with _trava:
+        if _executor is not None:
+            _executor.shutdown(wait=True, cancel_futures=True)
+            _executor = None
+        while _memorias:
+            _, (memoria, _) = _memorias.popitem()
+            if memoria is not None:
+                memoria.close()
+                memoria.unlink()
+
+
+# ==============================================================================
+# LADO DOS WORKERS
+# ==============================================================================
+
+_cascos_worker = OrderedDict()  # assinatura -> Casco, reconstruído uma vez por processo
+
+
+def obter_casco_worker(descritor: dict) -> Casco:
+    """
+    Reconstrói (na primeira vez) e devolve o casco descrito, lendo as cotas
+    da memória compartilhada.
+    """
+    casco = _cascos_worker.get(descritor['assinatura'])
+    if casco is not None:
+        _cascos_worker.move_to_end(descritor['assinatura'])
+        return casco
+
+    if 'arquivo_cotas' in descritor:
+        # O mesmo arquivo mapeado pelo processo principal: as páginas vêm do cache do sistema
+        cotas = np.load(descritor['arquivo_cotas'], mmap_mode='r', allow_pickle=False)
+        casco = Casco(cotas, metodo=descritor['metodo'], arquivo_cotas=descritor['arquivo_cotas'])
+    else:
+        # Os workers são filhos do processo principal e compartilham o mesmo
+        # resource_tracker, então o bloco só é removido pelo dono (publicar_casco/encerrar_pool)
+        memoria = shared_memory.SharedMemory(name=descritor['nome_memoria'])
+        try:
+            cotas = np.ndarray((descritor['n_pontos'], 3), dtype=float, buffer=memoria.buf).copy()
+        finally:
+            memoria.close()
+        casco = Casco(cotas, metodo=descritor['metodo'])
+    casco.arquivo_bonjean = descritor.get('arquivo_bonjean')
+    _cascos_worker[descritor['assinatura']] = casco
+    while len(_cascos_worker) > MAX_CASCOS_POR_WORKER:
+        _cascos_worker.popitem(last=False)
+    return casco
+
+
+def calcular_lote(args) -> list:
+    """
+    Função "worker" para um lote de calados: recebe apenas o descritor do
+    casco, os calados e o motor, e retorna um dicionário de resultados por calado
+    (com os registros de perfil das fases, se pedidos no sexto argumento).
+    """
+    from .calculos_hidrostaticos import calcular_lote_de_calados
+
+    descritor, calados, densidade, metodo_interp, motor = args[:5]
+    perfilar = len(args) > 5 and args[5]
+    casco = obter_casco_worker(descritor)
+    return calcular_lote_de_calados(casco, calados, densidade, metodo_interp, motor, perfilar)
@@ -0,0 +1,183 @@
+# src/core/tarefas_calculo.py
+
+import concurrent.futures
+import threading
+import time
+import traceback
+import uuid
+
+
+class LimiteDeTarefasExcedido(Exception):
+    """O usuário já tem o número máximo de tarefas na fila ou em execução."""
+
+
+class TarefaCalculo:
+    """
+    Uma tarefa de cálculo em segundo plano: estado, progresso (calados
+    concluídos / total), as linhas de resultado já disponíveis, na ordem
+    em que ficaram prontas, e o valor retornado pela função ao terminar.
+    """
+    ESTADOS_ATIVOS = ('na_fila', 'executando')
+
+    def __init__(self, user_id: int, descricao: str = ''):
+        self.id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.descricao = descricao
+        self.estado = 'na_fila'
+        self.concluidos = 0
+        self.total = 0
+        self.linhas = []
+        self.resultado = None
+        self.erro = None
+        self.criada_em = time.time()
+        self.finalizada_em = None
+        self._trava = threading.Lock()
+
+    @property
+    def ativa(self) -> bool:
+        with self._trava:
+            return self.estado in self.ESTADOS_ATIVOS
+
+    def registrar_progresso(self, concluidos: int, total: int, novas_linhas: list):
+        """Callback de progresso passado para a calculadora."""
+        with self._trava:
+            self.concluidos = concluidos
+            self.total = total
+            self.linhas.extend(novas_linhas)
+
+    def para_dict(self) -> dict:
+        """
+        Returns:
+            dict: Estado e progresso da tarefa (sem as linhas de resultado).
+        """
+        with self._trava:
+            return {
+                'id': self.id,
+                'descricao': self.descricao,
+                'estado': self.estado,
+                'concluidos': self.concluidos,
+                'total': self.total,
+                'linhas_disponiveis': len(self.linhas),
+                'erro': self.erro,
+                'criada_em': self.criada_em,
+                'finalizada_em': self.finalizada_em,
+            }
+
+    def linhas_desde(self, inicio: int = 0) -> list:
+        """Retorna as linhas de resultado a partir da posição `inicio` (leitura incremental)."""
+        with self._trava:
+            return list(self.linhas[max(inicio, 0):])
+
+    def obter_resultado(self):
+        """Valor retornado pela função da tarefa (None enquanto ela não for concluída)."""
+        with self._trava:
+            return self.resultado if self.estado == 'concluida' else None
+
+    def _finalizar(self, estado: str, resultado=None, erro: str | None = None):
+        with self._trava:
+            self.estado = estado
+            self.resultado = resultado
+            self.erro = erro
+            self.finalizada_em = time.time()
+
+
+class GerenciadorTarefas:
+    """
+    Fila de tarefas de cálculo em processo, executada por um pool de threads.
+
+    Não depende de serviços externos: as tarefas vivem na memória do processo
+    e são descartadas `retencao_s` segundos depois de finalizadas. Cada usuário
+    pode ter no máximo `max_por_usuario` tarefas na fila ou em execução.
+    """
+    def __init__(self, max_simultaneas: int = 2, max_por_usuario: int = 2, retencao_s: float = 3600):
+        self.max_simultaneas = max_simultaneas
+        self.max_por_usuario = max_por_usuario
+        self.retencao_s = retencao_s
+
+        self._tarefas = {}  # id -> TarefaCalculo
+        self._executor = None
+        self._trava = threading.Lock()
+
+    def configurar(self, max_simultaneas: int | None = None, max_por_usuario: int | None = None,
+                   retencao_s: float | None = None):
+        """Ajusta os limites; o pool é recriado na próxima submissão se o tamanho mudar."""
+        with self._trava:
+            if max_simultaneas is not None and max_simultaneas != self.max_simultaneas:
+                self.max_simultaneas = max_simultaneas
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                    self._executor = None
+            if max_por_usuario is not None:
+                self.max_por_usuario = max_por_usuario
+            if retencao_s is not None:
+                self.retencao_s = retencao_s
+
+    def submeter(self, user_id: int, funcao, descricao: str = '') -> TarefaCalculo:
+        """
+        Enfileira `funcao(progresso)` para execução em segundo plano.
+
+        Args:
+            user_id (int): Dono da tarefa (para o limite por usuário e o acesso).
+            funcao (callable): Recebe o callback de progresso; o valor retornado fica em `tarefa.resultado`.
+            descricao (str, optional): Texto exibido no estado da tarefa.
+
+        Returns:
+            TarefaCalculo: A tarefa criada.
+
+        Raises:
+            LimiteDeTarefasExcedido: Se o usuário já atingiu o limite de tarefas ativas.
+        """
+        with self._trava:
+            self._descartar_antigas()
+            ativas = sum(1 for t in self._tarefas.values() if t.user_id == user_id and t.ativa)
+            if ativas >= self.max_por_usuario:
+                raise LimiteDeTarefasExcedido(
+                    f"Limite de {self.max_por_usuario} cálculo(s) simultâneo(s) por usuário atingido."
+                )
+
+            tarefa = TarefaCalculo(user_id, descricao)
+            self._tarefas[tarefa.id] = tarefa
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_simultaneas, thread_name_prefix='tarefa-calculo'
+                )
+            self._executor.submit(self._executar, tarefa, funcao)
+            return tarefa
+
+    @staticmethod
+    def _executar(tarefa: TarefaCalculo, funcao):
+        """Executa a tarefa e registra o estado final (concluída, com o resultado, ou erro)."""
+        with tarefa._trava:
+            tarefa.estado = 'executando'
+        try:
+            resultado = funcao(tarefa.registrar_progresso)
+        except Exception as e:
+            traceback.print_exc()
+            tarefa._finalizar('erro', erro=str(e))
+        else:
+            tarefa._finalizar('concluida', resultado=resultado)
+
+    def obter(self, tarefa_id: str, user_id: int) -> TarefaCalculo | None:
+        """Retorna a tarefa se ela existir e pertencer ao usuário."""
+        with self._trava:
+            tarefa = self._tarefas.get(tarefa_id)
+        if tarefa is None or tarefa.user_id != user_id:
+            return None
+        return tarefa
+
+    def listar(self, user_id: int) -> list:
+        """Tarefas do usuário, das mais recentes para as mais antigas."""
+        with self._trava:
+            self._descartar_antigas()
+            tarefas = [t for t in self._tarefas.values() if t.user_id == user_id]
+        return sorted(tarefas, key=lambda t: t.criada_em, reverse=True)
+
+    def _descartar_antigas(self):
+        """Remove as tarefas finalizadas há mais de `retencao_s` segundos (chamado com a trava)."""
+        limite = time.time() - self.retencao_s
+        for tarefa_id in [i for i, t in self._tarefas.items() if t.finalizada_em and t.finalizada_em < limite]:
+            del self._tarefas[tarefa_id]
+
+
+# Instância única usada por toda a aplicação (configurada no registro do blueprint)
+gerenciador_tarefas = GerenciadorTarefas()
@@ -1,32 +1,48 @@
-import pandas as pd
-import plotly.graph_objects as go
 import numpy as np
-from .interpolacao import Casco 
+from typing import TYPE_CHECKING
+from .interpolacao import Casco
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# O plotly (e o pandas das tabelas recebidas) só é importado ao montar um gráfico,
+# para não pesar na inicialização da aplicação e dos workers
+
+# Limites do modo compacto do gráfico (nível de detalhe): acima deles as
+# cotas e as balizas são amostradas em intervalos regulares
+MAX_PONTOS_GRAFICO = 5_000
+MAX_BALIZAS_GRAFICO = 100
+PONTOS_POR_BALIZA_GRAFICO = 50
+# A geometria 3D vai em precisão simples (metade dos bytes; sobra precisão para a tela)
+TIPO_GEOMETRIA_GRAFICO = np.float32
+
+
+def _indices_amostrados(n: int, maximo: int) -> np.ndarray:
+    """Até `maximo` índices igualmente espaçados em range(n), sempre com o primeiro e o último."""
+    if n <= maximo:
+        return np.arange(n)
+    return np.unique(np.linspace(0, n - 1, maximo).round().astype(int))
+
+
+def _tracos_casco_completos(casco: Casco) -> list:
+    """Traços 3D do casco com dois traços por baliza (um por bordo) e todas as cotas."""
+    import plotly.graph_objects as go
 
-def gerar_grafico_hidrostatico(df_resultados: pd.DataFrame, casco: Casco) -> str:
-    """
-    Gera um gráfico interativo com um DropDown para alternar entre a visualização
-    3D do casco e as curvas hidrostáticas 2D.
-    """
-    fig = go.Figure()
-    
-    # --- Passo 1: Criar TODOS os traços ---
-    
-    # Traços para o CASCO 3D (com legendgroup)
     traces_3d = []
     # Pontos
-    df_sem_centro = casco.df[casco.df['Y'] > 0]
-    pontos_x = list(pd.concat([casco.df['X'], df_sem_centro['X']]))
-    pontos_y = list(pd.concat([casco.df['Y'], -df_sem_centro['Y']]))
-    pontos_z = list(pd.concat([casco.df['Z'], df_sem_centro['Z']]))
+    x_cotas, y_cotas, z_cotas = casco.cotas[:, 0], casco.cotas[:, 1], casco.cotas[:, 2]
+    fora_do_centro = y_cotas > 0
+    pontos_x = np.concatenate([x_cotas, x_cotas[fora_do_centro]]).tolist()
+    pontos_y = np.concatenate([y_cotas, -y_cotas[fora_do_centro]]).tolist()
+    pontos_z = np.concatenate([z_cotas, z_cotas[fora_do_centro]]).tolist()
     traces_3d.append(go.Scatter3d(x=pontos_x, y=pontos_y, z=pontos_z, mode='markers', marker=dict(size=2, color='green'), name='Pontos CSV', visible=False))
     # Linhas Balizas 3D
-    for x_val in casco.posicoes_balizas:
-        interpolador = casco.funcoes_baliza.get(x_val)
-        if interpolador:
-            z_coords_orig = casco.df[casco.df['X'] == x_val]['Z']
+    compacto = casco.compacto
+    for indice, x_val in enumerate(compacto.posicoes):
+        if compacto.interpolavel[indice]:
+            z_coords_orig = compacto.z[compacto.inicios[indice]:compacto.inicios[indice + 1]]
             z_interp = np.linspace(z_coords_orig.min(), z_coords_orig.max(), 50)
-            y_interp = interpolador(z_interp)
+            y_interp = compacto.meia_boca(indice, z_interp)
             
             nome_da_legenda = f'Baliza {x_val:.2f}'
             # Linha de estibordo (direita)
@@ -45,12 +61,100 @@ def gerar_grafico_hidrostatico(df_resultados: pd.DataFrame, casco: Casco) -> str
         z_interp = casco.funcao_perfil(x_interp)
         traces_3d.append(go.Scatter3d(x=list(x_interp), y=[0]*100, z=list(z_interp), mode='lines', line=dict(color='royalblue', width=3), name='Perfil 3D', visible=False))
 
+    return traces_3d
+
+
+def _tracos_casco_compactos(casco: Casco) -> list:
+    """
+    Traços 3D do casco em tamanho limitado: as cotas (amostradas) num traço
+    de marcadores e as balizas (também amostradas), dos dois bordos, num único traço de
+    linhas separadas por NaN. Os dados ficam em arrays NumPy (float32), que
+    o Plotly serializa como arrays tipados em base64.
+    """
+    import plotly.graph_objects as go
+
+    traces_3d = []
+    # Pontos (amostrados) e seus espelhos no outro bordo
+    cotas = casco.cotas[_indices_amostrados(len(casco.cotas), MAX_PONTOS_GRAFICO)].astype(TIPO_GEOMETRIA_GRAFICO)
+    fora_do_centro = cotas[:, 1] > 0
+    traces_3d.append(go.Scatter3d(
+        x=np.concatenate([cotas[:, 0], cotas[fora_do_centro, 0]]),
+        y=np.concatenate([cotas[:, 1], -cotas[fora_do_centro, 1]]),
+        z=np.concatenate([cotas[:, 2], cotas[fora_do_centro, 2]]),
+        mode='markers', marker=dict(size=2, color='green'), name='Pontos CSV', visible=False))
+
+    # Balizas: cada uma percorre o bordo de estibordo, sobe pelo de bombordo
+    # e termina em NaN, que interrompe a linha antes da baliza seguinte
+    compacto = casco.compacto
+    indices = np.flatnonzero(compacto.interpolavel)
+    indices = indices[_indices_amostrados(len(indices), MAX_BALIZAS_GRAFICO)]
+    if len(indices):
+        z_min = compacto.z[compacto.inicios[indices]]
+        z_max = compacto.z[compacto.inicios[indices + 1] - 1]
+        fracao = np.linspace(0.0, 1.0, PONTOS_POR_BALIZA_GRAFICO)
+        z_interp = z_min[:, None] + fracao[None, :] * (z_max - z_min)[:, None]
+        y_interp = compacto.meia_boca(indices[:, None], z_interp)
+        separador = np.full((len(indices), 1), np.nan)
+        x_balizas = np.repeat(compacto.posicoes[indices][:, None], 2 * PONTOS_POR_BALIZA_GRAFICO, axis=1)
+        traces_3d.append(go.Scatter3d(
+            x=np.hstack([x_balizas, separador]).ravel().astype(TIPO_GEOMETRIA_GRAFICO),
+            y=np.hstack([y_interp, -y_interp[:, ::-1], separador]).ravel().astype(TIPO_GEOMETRIA_GRAFICO),
+            z=np.hstack([z_interp, z_interp[:, ::-1], separador]).ravel().astype(TIPO_GEOMETRIA_GRAFICO),
+            mode='lines', line=dict(color='green'), name='Balizas', connectgaps=False, visible=False))
+
+    if casco.funcao_perfil:
+        x_interp = np.linspace(min(casco.posicoes_balizas), max(casco.posicoes_balizas), 100)
+        traces_3d.append(go.Scatter3d(x=x_interp.astype(TIPO_GEOMETRIA_GRAFICO), y=np.zeros(100, dtype=TIPO_GEOMETRIA_GRAFICO),
+                                      z=casco.funcao_perfil(x_interp).astype(TIPO_GEOMETRIA_GRAFICO), mode='lines',
+                                      line=dict(color='royalblue', width=3), name='Perfil 3D', visible=False))
+    return traces_3d
+
+
+def geometria_casco_json(casco: Casco) -> str:
+    """
+    Traços 3D compactos do casco (visíveis) em JSON, com os arrays tipados em
+    base64, para o endpoint de geometria: o navegador guarda a geometria em
+    cache e monta o gráfico junto com as curvas, buscadas à parte.
+    """
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    traces_3d = _tracos_casco_compactos(casco)
+    for trace in traces_3d:
+        trace.visible = True
+    # O to_dict da figura é que converte os arrays NumPy para base64
+    return pio.json.to_json_plotly({'data': go.Figure(data=traces_3d).to_dict()['data']})
+
+
+def gerar_grafico_hidrostatico(df_resultados: 'pd.DataFrame', casco: Casco, compacto: bool = True) -> str:
+    """
+    Gera um gráfico interativo com um DropDown para alternar entre a visualização
+    3D do casco e as curvas hidrostáticas 2D.
+
+    Com `compacto=True`, o casco ocupa no máximo três traços (cotas
+    amostradas, balizas e perfil) e todas as séries vão como arrays tipados,
+    de modo que o HTML não cresce com o número de balizas; `compacto=False`
+    mantém um traço por baliza e bordo, com todas as cotas.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    
+    # --- Passo 1: Criar TODOS os traços ---
+    
+    # Traços para o CASCO 3D
+    traces_3d = _tracos_casco_compactos(casco) if compacto else _tracos_casco_completos(casco)
+
     # Traços para as CURVAS HIDROSTÁTICAS 2D
     traces_2d_curvas = []
     eixo_y_coluna = 'Calado (m)'
     colunas_hidro = [col for col in df_resultados.columns if col != eixo_y_coluna]
     for coluna in colunas_hidro:
-        traces_2d_curvas.append(go.Scatter(x=list(df_resultados[coluna]), y=list(df_resultados[eixo_y_coluna]), name=coluna, visible=False))
+        if compacto:
+            x_curva, y_curva = df_resultados[coluna].to_numpy(dtype=float), df_resultados[eixo_y_coluna].to_numpy(dtype=float)
+        else:
+            x_curva, y_curva = list(df_resultados[coluna]), list(df_resultados[eixo_y_coluna])
+        traces_2d_curvas.append(go.Scatter(x=x_curva, y=y_curva, name=coluna, visible=False))
 
     fig.add_traces(traces_3d + traces_2d_curvas)
 
@@ -114,4 +218,30 @@ def gerar_grafico_hidrostatico(df_resultados: pd.DataFrame, casco: Casco) -> str
     for trace in traces_3d:
         trace.visible = True
 
-    return fig.to_html(full_html=False, include_plotlyjs=False)
\ No newline at end of file
+    return fig.to_html(full_html=False, include_plotlyjs=False)
+
+def gerar_grafico_curvas_cruzadas(df_kn: 'pd.DataFrame') -> str:
+    """
+    Gera o gráfico das curvas cruzadas de estabilidade: uma curva KN × deslocamento
+    para cada ângulo de banda.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    colunas_kn = [col for col in df_kn.columns if col.startswith('KN ')]
+    for coluna in colunas_kn:
+        fig.add_trace(go.Scatter(
+            x=list(df_kn['Desloc. (t)']), y=list(df_kn[coluna]), mode='lines+markers',
+            name=coluna.replace('KN ', '').replace(' (m)', ''),
+        ))
+
+    fig.update_layout(
+        title="Curvas Cruzadas de Estabilidade (KN)",
+        xaxis_title='Deslocamento (t)',
+        yaxis_title='KN (m)',
+        legend_title='Banda',
+        paper_bgcolor="#f0f1e6",
+        template='plotly_white',
+        height=560,
+    )
+    return fig.to_html(full_html=False, include_plotlyjs=False)
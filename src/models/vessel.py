@@ -1,5 +1,8 @@
 # src/models/vessel.py
 
+import os
+from flask import current_app, has_app_context
+from sqlalchemy import event
 from src.extensions import db
 
 class Vessel(db.Model):
@@ -33,4 +36,26 @@ class Vessel(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
 
     # Relação de volta para o usuário
-    owner = db.relationship('User', back_populates='vessels')
\ No newline at end of file
+    owner = db.relationship('User', back_populates='vessels')
+
+
+@event.listens_for(Vessel.tabela_cotas_filename, 'set')
+def invalidar_casco_substituido(vessel, novo_nome, nome_anterior, iniciador):
+    """
+    Quando a tabela de cotas de uma embarcação é substituída, descarta do
+    cache os cascos construídos a partir do arquivo anterior e os resultados
+    hidrostáticos armazenados para a embarcação, além das tabelas de Bonjean
+    e das cotas binárias gravadas ao lado do arquivo anterior.
+    """
+    if not isinstance(nome_anterior, str) or nome_anterior == novo_nome or not has_app_context():
+        return
+    from src.core.cache_casco import cache_cascos
+    from src.core.armazem_resultados import armazem_resultados
+    from src.core.bonjean import remover_tabelas_bonjean
+    from src.core.ingestao import remover_cotas_binarias
+    caminho_anterior = os.path.join(current_app.root_path, '..', 'uploads', nome_anterior)
+    cache_cascos.invalidar_arquivo(caminho_anterior)
+    remover_tabelas_bonjean(caminho_anterior)
+    remover_cotas_binarias(caminho_anterior)
+    if vessel.id is not None:
+        armazem_resultados.invalidar_embarcacao(vessel.id)
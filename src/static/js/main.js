@@ -59,8 +59,7 @@ document.addEventListener('DOMContentLoaded', function() {
     // === LÓGICA DA TABELA DE RESULTADOS (DATATABLES)
     // ===============================================
     
-    // Procura por uma tabela com o ID que definimos
-    if ($('#tabela-resultados').length) {
+    function ativarDataTable() {
         console.log("Tabela de resultados encontrada. Inicializando DataTables.");
         
         // Ativa o DataTables na nossa tabela
@@ -73,6 +72,132 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
 
+    // Procura por uma tabela com o ID que definimos
+    if ($('#tabela-resultados').length) {
+        ativarDataTable();
+    }
+
+    // ==========================================================
+    // === RESULTADOS E GEOMETRIA BUSCADOS EM JSON ============
+    // ==========================================================
+
+    // A página hidrostática traz apenas as URLs; a tabela e o gráfico são
+    // montados aqui. A geometria fica no cache do navegador entre as visitas.
+    const tabelaContainer = document.getElementById('tabela-resultados-container');
+    const plotContainer = document.getElementById('plot-container');
+
+    if (tabelaContainer && tabelaContainer.dataset.resultadosUrl) {
+        const pedidos = [fetch(tabelaContainer.dataset.resultadosUrl).then(lerJson)];
+        if (plotContainer && plotContainer.dataset.geometriaUrl) {
+            pedidos.push(fetch(plotContainer.dataset.geometriaUrl).then(lerJson));
+        }
+
+        Promise.all(pedidos)
+            .then(([resultados, geometria]) => {
+                montarTabelaResultados(tabelaContainer, resultados);
+                if (geometria) {
+                    montarGraficoHidrostatico(plotContainer, geometria.data, resultados);
+                }
+            })
+            .catch(erro => {
+                tabelaContainer.innerHTML = `<div class="placeholder">Não foi possível carregar os resultados (${erro}).</div>`;
+            });
+    }
+
+    function lerJson(resposta) {
+        if (!resposta.ok) {
+            throw new Error(`HTTP ${resposta.status}`);
+        }
+        return resposta.json();
+    }
+
+    function formatarValor(valor) {
+        if (valor === null) {
+            return '';
+        }
+        // Inteiros (como o nível de refinamento) sem casas decimais; o resto com 4
+        return Number.isInteger(valor) ? String(valor) : Number(valor).toFixed(4);
+    }
+
+    function montarTabelaResultados(container, resultados) {
+        const cabecalho = resultados.colunas.map(coluna => `<th>${coluna}</th>`).join('');
+        const corpo = resultados.linhas
+            .map(linha => `<tr>${linha.map(valor => `<td>${formatarValor(valor)}</td>`).join('')}</tr>`)
+            .join('');
+        container.innerHTML =
+            `<table id="tabela-resultados" class="table table-striped table-hover">` +
+            `<thead><tr>${cabecalho}</tr></thead><tbody>${corpo}</tbody></table>`;
+        ativarDataTable();
+    }
+
+    function montarGraficoHidrostatico(container, tracos3d, resultados) {
+        // Mesmo layout de gerar_grafico_hidrostatico: um DropDown alterna entre
+        // o casco 3D e cada curva hidrostática (eixo vertical = calado)
+        const eixoY = 'Calado (m)';
+        const indiceY = resultados.colunas.indexOf(eixoY);
+        const tracos2d = resultados.colunas
+            .filter(coluna => coluna !== eixoY && coluna !== 'Refinamento')
+            .map(coluna => {
+                const indice = resultados.colunas.indexOf(coluna);
+                return {
+                    type: 'scatter', name: coluna, visible: false,
+                    x: resultados.linhas.map(linha => linha[indice]),
+                    y: resultados.linhas.map(linha => linha[indiceY]),
+                };
+            });
+
+        const total = tracos3d.length + tracos2d.length;
+        const layout3d = {
+            'title': 'Visualização 3D do Casco',
+            'scene': {
+                'visible': true,
+                'aspectmode': 'data',
+                'xaxis': {'title': 'Comprimento (X)'},
+                'yaxis': {'title': 'Boca (Y)'},
+                'zaxis': {'title': 'Altura (Z)'}
+            },
+            'xaxis': {'visible': false},
+            'yaxis': {'visible': false}
+        };
+        const visibilidade3d = Array.from({length: total}, (_, i) => i < tracos3d.length);
+        const botoes = [{method: 'update', label: 'Casco 3D', args: [{visible: visibilidade3d}, layout3d]}];
+        tracos2d.forEach((traco, i) => {
+            const visibilidade = Array.from({length: total}, (_, j) => j === tracos3d.length + i);
+            botoes.push({
+                method: 'update', label: traco.name,
+                args: [{visible: visibilidade}, {
+                    'title': `Curva de ${traco.name}`,
+                    'scene': {'visible': false},
+                    'xaxis': {'visible': true, 'title': traco.name},
+                    'yaxis': {'visible': true, 'title': eixoY}
+                }]
+            });
+        });
+
+        const layout = {
+            updatemenus: [{
+                active: 0, buttons: botoes, direction: 'down',
+                pad: {r: 10, t: 10}, showactive: true,
+                x: 1.007, xanchor: 'right', y: 1.01, yanchor: 'bottom'
+            }],
+            title: 'Visualizador de Curvas e Geometria',
+            paper_bgcolor: '#f0f1e6',
+            plot_bgcolor: 'white',
+            height: 560,
+            scene: {
+                aspectmode: 'data',
+                xaxis: {title: 'Comprimento (X)'},
+                yaxis: {title: 'Boca (Y)'},
+                zaxis: {title: 'Altura (Z)'}
+            },
+            xaxis: {visible: false},
+            yaxis: {visible: false},
+            margin: {t: 0, b: 0, l: 70, r: 0}
+        };
+        container.innerHTML = '';
+        Plotly.newPlot(container, tracos3d.concat(tracos2d), layout);
+    }
+
     // ==========================================================
     // === LÓGICA DE FEEDBACK DE CARREGAMENTO (LOADING) =======
     // ==========================================================
@@ -82,7 +207,20 @@ document.addEventListener('DOMContentLoaded', function() {
 
     if (hydroForm) {
         // Adiciona um "escutador" para o evento de SUBMISSÃO do formulário
-        hydroForm.addEventListener('submit', function() {
+        hydroForm.addEventListener('submit', function(event) {
+            // A exportação baixa um arquivo e não sai da página: sem pop-up de carregamento
+            if (event.submitter && (event.submitter.id === 'exportar' || event.submitter.id === 'exportar-lote')) {
+                return;
+            }
+
+            const segundoPlano = hydroForm.querySelector('input[name="segundo_plano"]');
+            if (segundoPlano && segundoPlano.checked && hydroForm.dataset.tarefasUrl) {
+                // O cálculo vira uma tarefa em segundo plano e o progresso é consultado periodicamente
+                event.preventDefault();
+                iniciarTarefa(hydroForm);
+                return;
+            }
+
             // Quando o formulário for enviado, exibe o pop-up de carregamento
             Swal.fire({
                 title: 'Calculando...',
@@ -97,4 +235,60 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
 
+
+    // ==========================================================
+    // === LÓGICA DAS TAREFAS EM SEGUNDO PLANO ================
+    // ==========================================================
+
+    function iniciarTarefa(form) {
+        Swal.fire({
+            title: 'Calculando...',
+            html: 'Enviando o cálculo para a fila...',
+            allowOutsideClick: false,
+            didOpen: () => { Swal.showLoading(); }
+        });
+
+        fetch(form.dataset.tarefasUrl, { method: 'POST', body: new FormData(form) })
+            .then(resposta => resposta.json().then(dados => ({ ok: resposta.ok, dados: dados })))
+            .then(({ ok, dados }) => {
+                if (!ok) {
+                    const mensagem = dados.erro || Object.values(dados.erros || {}).flat().join(' ');
+                    Swal.fire({ title: 'Erro!', text: mensagem, icon: 'error', confirmButtonColor: '#0F665C' });
+                    return;
+                }
+                acompanharTarefa(dados.resultados_url, []);
+            })
+            .catch(erro => {
+                Swal.fire({ title: 'Erro!', text: String(erro), icon: 'error', confirmButtonColor: '#0F665C' });
+            });
+    }
+
+    function acompanharTarefa(resultadosUrl, linhas) {
+        // Busca apenas as linhas novas desde a última consulta
+        fetch(`${resultadosUrl}?desde=${linhas.length}`)
+            .then(resposta => resposta.json())
+            .then(dados => {
+                linhas.push(...dados.linhas);
+                const ultima = linhas.length ? linhas[linhas.length - 1]['Calado (m)'] : null;
+                Swal.update({
+                    html: `${dados.concluidos} de ${dados.total || '?'} calados calculados` +
+                          (ultima !== null ? `<br>Último calado: ${Number(ultima).toFixed(3)} m` : '')
+                });
+                Swal.showLoading();
+
+                if (dados.estado === 'concluida') {
+                    // A página da tarefa carrega a tabela e a geometria do resultado dela, sem recalcular
+                    if (dados.pagina_url) {
+                        window.location.assign(dados.pagina_url);
+                    } else {
+                        Swal.fire({ title: 'Concluído', text: 'Nenhum calado foi calculado.', icon: 'info', confirmButtonColor: '#0F665C' });
+                    }
+                } else if (dados.estado === 'erro') {
+                    Swal.fire({ title: 'Erro!', text: dados.erro, icon: 'error', confirmButtonColor: '#0F665C' });
+                } else {
+                    setTimeout(() => acompanharTarefa(resultadosUrl, linhas), 1000);
+                }
+            });
+    }
+
 });
\ No newline at end of file
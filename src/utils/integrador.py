@@ -0,0 +1,148 @@
+# src/utils/integrador.py
+
+import numpy as np
+from math import comb
+
+
+def polinomio_por_partes(interpolador) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Extrai os pontos de quebra e os coeficientes de um interpolador por partes.
+
+    Aceita interpoladores no formato do scipy `PPoly` (`PchipInterpolator`,
+    `CubicSpline`, ...), com atributos `x` e `c`, e `interp1d` linear, com
+    atributos `x` e `y`.
+
+    Args:
+        interpolador: O interpolador.
+
+    Returns:
+        tuple: Pontos de quebra (n + 1) e coeficientes (grau + 1, n) de cada
+               trecho na variável local s = x - x_j, do maior para o menor grau
+               (a mesma convenção do `PPoly`).
+    """
+    x = np.asarray(interpolador.x, dtype=float)
+    if hasattr(interpolador, 'c'):
+        return x, np.asarray(interpolador.c, dtype=float)
+
+    if getattr(interpolador, '_kind', 'linear') != 'linear':
+        raise ValueError("Apenas interp1d linear é suportado; use um interpolador do tipo PPoly para outros graus.")
+    y = np.asarray(interpolador.y, dtype=float)
+    inclinacoes = np.diff(y) / np.diff(x)
+    return x, np.vstack([inclinacoes, y[:-1]])
+
+
+def _derivadas_pchip(h: np.ndarray, m: np.ndarray) -> np.ndarray:
+    """Derivadas nodais do PCHIP (Fritsch-Carlson, como no scipy) de uma curva."""
+    if len(h) == 1:
+        return np.array([m[0], m[0]])
+
+    d = np.zeros(len(h) + 1)
+    # Nós internos: média harmônica ponderada das inclinações vizinhas
+    with np.errstate(divide='ignore', invalid='ignore'):
+        w1 = 2 * h[1:] + h[:-1]
+        w2 = h[1:] + 2 * h[:-1]
+        media = (w1 + w2) / (w1 / m[:-1] + w2 / m[1:])
+    condicao = (np.sign(m[1:]) != np.sign(m[:-1])) | (m[1:] == 0) | (m[:-1] == 0)
+    d[1:-1] = np.where(condicao, 0.0, media)
+
+    def _extremidade(h0, h1, m0, m1):
+        d_ext = ((2 * h0 + h1) * m0 - h0 * m1) / (h0 + h1)
+        if np.sign(d_ext) != np.sign(m0):
+            return 0.0
+        if np.sign(m0) != np.sign(m1) and abs(d_ext) > 3 * abs(m0):
+            return 3 * m0
+        return d_ext
+
+    d[0] = _extremidade(h[0], h[1], m[0], m[1])
+    d[-1] = _extremidade(h[-1], h[-2], m[-1], m[-2])
+    return d
+
+
+def coeficientes_por_partes(x, y, metodo: str) -> np.ndarray:
+    """
+    Coeficientes (mesma convenção de `polinomio_por_partes`) da curva que
+    passa pelos pontos (x, y), linear ou PCHIP, calculados com NumPy (os
+    mesmos do `PchipInterpolator`, sem importar o scipy).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    h = np.diff(x)
+    m = np.diff(y) / h
+    if metodo != 'pchip':
+        return np.vstack([m, y[:-1]])
+
+    # Forma de Hermite convertida para a base de potências
+    d = _derivadas_pchip(h, m)
+    return np.vstack([
+        (d[:-1] + d[1:] - 2 * m) / h ** 2,
+        (3 * m - 2 * d[:-1] - d[1:]) / h,
+        d[:-1],
+        y[:-1],
+    ])
+
+
+def _multiplicar(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Produto, trecho a trecho, de polinômios com coeficientes em ordem crescente de grau."""
+    produto = np.zeros((a.shape[0] + b.shape[0] - 1, a.shape[1]))
+    for i in range(a.shape[0]):
+        produto[i:i + b.shape[0]] += a[i] * b
+    return produto
+
+
+def integrar_por_partes(x, coeficientes, a: float, b: float, potencia: int = 0, centro: float = 0.0,
+                        expoente: int = 1) -> float:
+    """
+    Integra exatamente (x - centro)^potencia · f(x)^expoente de `a` a `b`, em
+    que f é o polinômio por partes dado por seus pontos de quebra e coeficientes.
+
+    O integrando de cada trecho é expandido como polinômio na variável local
+    s = x - x_j e integrado analiticamente, sem amostragem. Fora do intervalo
+    dos pontos de quebra o integrando é considerado nulo.
+
+    Args:
+        x (array): Pontos de quebra, em ordem crescente.
+        coeficientes (array): (grau + 1, n_trechos), do maior para o menor grau.
+        a, b (float): Limites de integração.
+        potencia (int, optional): Potência de (x - centro): 0 (área), 1 (momento
+            estático) ou 2 (momento de inércia), por exemplo.
+        centro (float, optional): Referência dos momentos.
+        expoente (int, optional): Potência da própria curva (3 para ∫ y³ dx).
+
+    Returns:
+        float: O valor da integral.
+    """
+    x = np.asarray(x, dtype=float)
+    if len(x) < 2 or a == b:
+        return 0.0
+    if b < a:
+        return -integrar_por_partes(x, coeficientes, b, a, potencia, centro, expoente)
+
+    # Limites locais de cada trecho (trechos fora de [a, b] ficam com largura nula)
+    inicio = x[:-1]
+    s_inferior = np.clip(a, inicio, x[1:]) - inicio
+    s_superior = np.clip(b, inicio, x[1:]) - inicio
+    ativos = s_superior > s_inferior
+    if not ativos.any():
+        return 0.0
+
+    # Coeficientes em ordem crescente de grau, apenas dos trechos ativos
+    curva = np.asarray(coeficientes, dtype=float)[::-1, ativos]
+    integrando = curva
+    for _ in range(expoente - 1):
+        integrando = _multiplicar(integrando, curva)
+    if potencia:
+        # (s + d)^p = Σ C(p, m) d^(p-m) s^m, com d = x_j - centro
+        d = inicio[ativos] - centro
+        binomio = np.array([comb(potencia, m) * d ** (potencia - m) for m in range(potencia + 1)])
+        integrando = _multiplicar(integrando, binomio)
+
+    graus = np.arange(integrando.shape[0])[:, None] + 1
+    primitiva = (s_superior[ativos] ** graus - s_inferior[ativos] ** graus) / graus
+    return float((integrando * primitiva).sum())
+
+
+def n_trechos_integrados(x, a: float, b: float) -> int:
+    """Número de trechos que uma integral de `a` a `b` percorre (usado na instrumentação)."""
+    x = np.asarray(x, dtype=float)
+    a, b = min(a, b), max(a, b)
+    return int(((x[1:] > a) & (x[:-1] < b)).sum())
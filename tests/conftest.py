@@ -0,0 +1,23 @@
+# tests/conftest.py
+
+import os
+import shutil
+import pytest
+from src.core.ingestao import carregar_cotas, caminho_cotas_binarias
+from src.core.interpolacao import Casco
+
+ARQUIVO_COTAS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'uploads', 'TABELA_DE_COTAS.csv')
+
+
+@pytest.fixture(scope='module')
+def caminho_cotas(tmp_path_factory):
+    """Cópia da tabela de cotas do repositório: a ingestão grava o .npy ao lado do arquivo."""
+    caminho = str(tmp_path_factory.mktemp('cotas') / 'TABELA_DE_COTAS.csv')
+    shutil.copy(ARQUIVO_COTAS, caminho)
+    return caminho
+
+
+def montar_casco(caminho: str, metodo: str) -> Casco:
+    """Casco a partir da cópia da tabela de cotas, como o cache de cascos monta."""
+    return Casco(carregar_cotas(caminho), metodo, arquivo_cotas=caminho_cotas_binarias(caminho))
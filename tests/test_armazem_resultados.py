@@ -0,0 +1,79 @@
+# tests/test_armazem_resultados.py
+
+import pytest
+import src.core.armazem_resultados as modulo_armazem
+import src.core.calculos_hidrostaticos as modulo_calculos
+from src.core.armazem_resultados import ArmazemResultados
+from src.core.calculos_hidrostaticos import CalculadoraHidrostatica
+from conftest import montar_casco
+
+
+class Relogio:
+    """Substitui `time` no módulo do armazém: cada leitura avança um segundo."""
+    def __init__(self):
+        self.agora = 1000.0
+
+    def time(self) -> float:
+        self.agora += 1.0
+        return self.agora
+
+
+@pytest.fixture
+def armazem(tmp_path, monkeypatch):
+    monkeypatch.setattr(modulo_armazem, 'time', Relogio())
+    return ArmazemResultados(str(tmp_path / 'resultados.sqlite'))
+
+
+def _linhas(*calados):
+    return [{'Calado (m)': calado, 'Volume (m³)': 10.0 * calado} for calado in calados]
+
+
+def test_calcula_apenas_calados_faltantes(tmp_path, caminho_cotas, monkeypatch):
+    calculados = []
+    calcular_lote = modulo_calculos.calcular_lote_de_calados
+
+    def calcular_lote_registrado(casco, calados, *args, **kwargs):
+        calculados.append(list(calados))
+        return calcular_lote(casco, calados, *args, **kwargs)
+    monkeypatch.setattr(modulo_calculos, 'calcular_lote_de_calados', calcular_lote_registrado)
+
+    armazem = ArmazemResultados(str(tmp_path / 'resultados.sqlite'))
+    casco = montar_casco(caminho_cotas, 'linear')
+    calculadora = CalculadoraHidrostatica(casco, 1.025, 'linear', 'vetorizado', armazem=armazem,
+                                          vessel_id=7, executor='local')
+    primeira = calculadora.calcular_curvas([1.0, 2.0, 3.0])
+    calculados.clear()
+    segunda = calculadora.calcular_curvas([2.0, 3.0, 4.0, 0.1 + 0.2])
+
+    assert sorted(c for lote in calculados for c in lote) == [0.1 + 0.2, 4.0]
+    assert segunda['Calado (m)'].tolist() == [0.1 + 0.2, 2.0, 3.0, 4.0]
+    assert segunda.set_index('Calado (m)').loc[[2.0, 3.0]].equals(primeira.set_index('Calado (m)').loc[[2.0, 3.0]])
+
+
+def test_limite_descarta_os_menos_acessados(armazem):
+    armazem.max_linhas = 3
+    armazem.gravar('casco', 1.025, 'linear', _linhas(1.0, 2.0, 3.0))
+    # O calado 1 volta a ser consultado e passa a ser o mais recente
+    assert set(armazem.buscar('casco', 1.025, 'linear', [1.0])) == {1.0}
+
+    armazem.gravar('casco', 1.025, 'linear', _linhas(4.0))
+
+    assert set(armazem.buscar('casco', 1.025, 'linear', [1.0, 2.0, 3.0, 4.0])) == {1.0, 3.0, 4.0}
+
+
+def test_invalidar_embarcacao_remove_so_as_dela(armazem):
+    armazem.gravar('casco-a', 1.025, 'linear', _linhas(1.0, 2.0), vessel_id=1)
+    armazem.gravar('casco-b', 1.025, 'linear', _linhas(1.0, 2.0), vessel_id=2)
+
+    assert armazem.invalidar_embarcacao(1) == 2
+
+    assert armazem.buscar('casco-a', 1.025, 'linear', [1.0, 2.0]) == {}
+    assert set(armazem.buscar('casco-b', 1.025, 'linear', [1.0, 2.0])) == {1.0, 2.0}
+    assert armazem.invalidar_casco('casco-b') == 2
+
+
+def test_outra_versao_dos_resultados_nao_e_reaproveitada(armazem, monkeypatch):
+    armazem.gravar('casco', 1.025, 'linear', _linhas(1.0))
+    monkeypatch.setattr(modulo_armazem, 'VERSAO_RESULTADOS', modulo_armazem.VERSAO_RESULTADOS + 1)
+
+    assert armazem.buscar('casco', 1.025, 'linear', [1.0]) == {}
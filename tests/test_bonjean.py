@@ -0,0 +1,64 @@
+# tests/test_bonjean.py
+
+import os
+import numpy as np
+import pytest
+from src.core.bonjean import TabelaBonjean, caminho_tabela_bonjean
+from conftest import montar_casco
+
+
+@pytest.fixture(scope='module', params=['linear', 'pchip'])
+def casco(request, caminho_cotas):
+    casco = montar_casco(caminho_cotas, request.param)
+    casco.arquivo_bonjean = caminho_tabela_bonjean(caminho_cotas, request.param)
+    return casco
+
+
+def test_tabela_reproduz_curvas_exatas(casco):
+    calados = np.linspace(0.05, 4.5, 37)
+    areas, momentos = casco.bonjean.areas_nas_balizas(calados)
+    areas_exatas, momentos_exatos = casco.obter_areas_e_momentos(calados)
+    np.testing.assert_allclose(areas, areas_exatas, rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(momentos, momentos_exatos, rtol=1e-10, atol=1e-12)
+
+
+def test_tabela_gravada_e_relida(casco):
+    tabela = casco.bonjean
+    assert os.path.exists(casco.arquivo_bonjean)
+    relida = TabelaBonjean.carregar_ou_gerar(casco, casco.arquivo_bonjean)
+    np.testing.assert_array_equal(relida.coef_areas, tabela.coef_areas)
+    np.testing.assert_array_equal(relida.coef_momentos, tabela.coef_momentos)
+
+
+def test_consultar_entre_balizas(casco):
+    tabela = casco.bonjean
+    posicoes = tabela.posicoes
+    calados = np.array([0.7, 1.9, 3.2])
+    areas, momentos = tabela.areas_nas_balizas(calados)
+
+    # Nas balizas, a consulta coincide com a tabela
+    area_x, momento_x = tabela.consultar(posicoes[:, None], calados[None, :])
+    np.testing.assert_allclose(area_x, areas, rtol=1e-12)
+    np.testing.assert_allclose(momento_x, momentos, rtol=1e-12)
+
+    # Entre duas balizas, interpolação linear em X; fora do comprimento, seção nula
+    x = 0.25 * posicoes[3] + 0.75 * posicoes[4]
+    area_meio, _ = tabela.consultar(x, calados)
+    np.testing.assert_allclose(area_meio, 0.25 * areas[3] + 0.75 * areas[4], rtol=1e-12)
+    fora, _ = tabela.consultar([posicoes[0] - 1.0, posicoes[-1] + 1.0], 2.0)
+    np.testing.assert_array_equal(fora, 0.0)
+
+
+def test_distribuicao_empuxo_integra_o_deslocamento(casco):
+    tabela = casco.bonjean
+    densidade = 1.025
+    calado_re, calado_vante = np.array([2.0, 2.8]), np.array([2.4, 2.6])
+    empuxo = tabela.distribuicao_empuxo(calado_re, calado_vante, densidade)
+    carena = tabela.volume_e_centros(calado_re, calado_vante)
+    np.testing.assert_allclose(tabela._integrar_ao_longo(empuxo), carena['volume'] * densidade, rtol=1e-12)
+
+    # Numa malha mais fina que a das balizas, o empuxo nas próprias balizas não muda
+    malha = np.union1d(np.linspace(tabela.posicoes[0], tabela.posicoes[-1], 201), tabela.posicoes)
+    empuxo_fino = tabela.distribuicao_empuxo(calado_re, calado_vante, densidade, posicoes=malha)
+    assert empuxo_fino.shape == (len(malha), 2)
+    np.testing.assert_allclose(empuxo_fino[np.searchsorted(malha, tabela.posicoes)], empuxo, rtol=1e-12, atol=1e-12)
@@ -0,0 +1,76 @@
+# tests/test_calculadora.py
+
+import threading
+import time
+import numpy as np
+import pytest
+import src.core.calculos_hidrostaticos as modulo_calculos
+from src.core.armazem_resultados import ArmazemResultados
+from src.core.calculos_hidrostaticos import CalculadoraHidrostatica, COLUNA_REFINAMENTO, escolher_executor
+from conftest import montar_casco
+
+
+def test_executor_do_motor_por_calado():
+    # ~40 µs por par (baliza × calado): um cálculo de milissegundos não paga o pool de processos
+    assert escolher_executor('quad', 10, 11, 4) == 'local'
+    assert escolher_executor('quad', 200, 12, 4) == 'local'
+    assert escolher_executor('quad', 2000, 12, 4) == 'processos'
+    assert escolher_executor('quad', 2000, 12, 1) == 'local'
+
+
+def test_stream_em_ordem_de_calado_com_lotes_fora_de_ordem(tmp_path, caminho_cotas, monkeypatch):
+    # Os primeiros lotes demoram mais: terminam depois dos seguintes
+    terminados = []
+    trava = threading.Lock()
+    calcular_lote = modulo_calculos.calcular_lote_de_calados
+
+    def calcular_lote_atrasado(casco, calados, *args, **kwargs):
+        time.sleep(0.02 * (5 - calados[0]))
+        linhas = calcular_lote(casco, calados, *args, **kwargs)
+        with trava:
+            terminados.append(calados[0])
+        return linhas
+    monkeypatch.setattr(modulo_calculos, 'calcular_lote_de_calados', calcular_lote_atrasado)
+
+    armazem = ArmazemResultados(str(tmp_path / 'resultados.sqlite'))
+    casco = montar_casco(caminho_cotas, 'linear')
+    calculadora = CalculadoraHidrostatica(casco, 1.025, 'linear', 'vetorizado', armazem=armazem,
+                                          executor='threads', max_workers=4, tamanho_lote=1)
+    # Um calado já armazenado no meio da lista sai sem esperar pelo cálculo
+    armazem.gravar(casco.assinatura, 1.025, 'linear', calculadora.calcular_curvas([2.5]).to_dict('records'))
+    terminados.clear()
+    calados = [4.0, 1.0, 3.0, 2.5, 2.0, -1.0]
+    progresso = []
+
+    linhas = list(calculadora.calcular_curvas_stream(
+        calados, progresso=lambda concluidos, total, novas: progresso.append((concluidos, total, len(novas)))))
+
+    assert sorted(terminados) == [1.0, 2.0, 3.0, 4.0]
+    assert terminados != sorted(terminados)
+    assert [linha['Calado (m)'] for linha in linhas] == [1.0, 2.0, 2.5, 3.0, 4.0]
+    assert progresso == [(i, 5, 1) for i in range(1, 6)]
+
+
+def test_refinamento_adaptativo_divide_so_onde_precisa(caminho_cotas):
+    casco = montar_casco(caminho_cotas, 'linear')
+    calculadora = CalculadoraHidrostatica(casco, 1.025, 'linear', 'vetorizado', executor='local')
+
+    # Com tolerância folgada, os pontos médios da malha inicial são calculados uma vez e nenhum intervalo é dividido de novo
+    grossa = calculadora.calcular_curvas_adaptativas(0.5, 4.0, n_inicial=5, tolerancia=1.0)
+    assert grossa['Calado (m)'].tolist() == pytest.approx(np.linspace(0.5, 4.0, 9))
+    assert grossa[COLUNA_REFINAMENTO].tolist() == [0, 1] * 4 + [0]
+
+    tabela = calculadora.calcular_curvas_adaptativas(0.5, 4.0, n_inicial=5, tolerancia=1e-3, max_calados=40)
+    calados = tabela['Calado (m)'].to_numpy()
+    niveis = tabela[COLUNA_REFINAMENTO].to_numpy()
+    assert 5 < len(tabela) <= 40
+    assert (np.diff(calados) > 0).all()
+    assert niveis.max() > 1
+    # Cada calado acrescentado é o ponto médio dos vizinhos de níveis anteriores
+    for calado, nivel in zip(calados[niveis > 0], niveis[niveis > 0]):
+        anteriores = calados[niveis < nivel]
+        abaixo, acima = anteriores[anteriores < calado].max(), anteriores[anteriores > calado].min()
+        assert calado == pytest.approx((abaixo + acima) / 2)
+    # As linhas são as mesmas de um cálculo direto nos mesmos calados
+    direto = calculadora.calcular_curvas(calados.tolist())
+    np.testing.assert_allclose(tabela['Volume (m³)'], direto['Volume (m³)'], rtol=1e-12)
@@ -0,0 +1,34 @@
+# tests/test_calculos_vetorizados.py
+
+import numpy as np
+import pytest
+from src.core.calculos_vetorizados import calcular_curvas_vetorizado, comparar_com_quad
+from conftest import montar_casco
+
+DENSIDADE = 1.025
+
+# Valores do caminho original com quad (scipy, calado a calado) na tabela de
+# cotas do repositório, para os calados de 1, 2 e 3 m: volume (m³) e KMt (m)
+REFERENCIA_QUAD = {
+    'linear': {'Volume (m³)': [26.413292, 105.849482, 203.690212], 'KMt (m)': [4.506499, 3.344989, 3.155992]},
+    'pchip': {'Volume (m³)': [33.006587, 116.21436, 216.600848], 'KMt (m)': [4.5873, 3.262427, 3.105429]},
+}
+# O volume não depende da quadratura; o KMt muda um pouco porque o VCB passou a
+# ser integrado sobre as mesmas balizas da linha d'água que o volume
+TOLERANCIA_REFERENCIA = {'Volume (m³)': 1e-6, 'KMt (m)': 5e-3}
+
+
+@pytest.mark.parametrize('metodo', ['linear', 'pchip'])
+def test_vetorizado_dentro_da_tolerancia(caminho_cotas, metodo):
+    casco = montar_casco(caminho_cotas, metodo)
+    comparacao = comparar_com_quad(casco, np.linspace(0.2, 4.0, 20).tolist(), DENSIDADE, metodo)
+    fora = comparacao.loc[~comparacao['Dentro da Tolerância'], 'Propriedade'].tolist()
+    assert not fora
+
+
+@pytest.mark.parametrize('metodo', ['linear', 'pchip'])
+def test_vetorizado_confere_com_referencia_quad(caminho_cotas, metodo):
+    casco = montar_casco(caminho_cotas, metodo)
+    tabela = calcular_curvas_vetorizado(casco, [1.0, 2.0, 3.0], DENSIDADE, metodo)
+    for coluna, valores in REFERENCIA_QUAD[metodo].items():
+        np.testing.assert_allclose(tabela[coluna], valores, rtol=TOLERANCIA_REFERENCIA[coluna], err_msg=coluna)
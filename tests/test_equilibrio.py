@@ -0,0 +1,56 @@
+# tests/test_equilibrio.py
+
+import numpy as np
+import pytest
+from src.core.equilibrio import SolucionadorEquilibrio
+from conftest import montar_casco
+
+DENSIDADE = 1.025
+
+
+@pytest.fixture(scope='module')
+def solucionador(caminho_cotas):
+    return SolucionadorEquilibrio(montar_casco(caminho_cotas, 'linear'), DENSIDADE, 'linear')
+
+
+def _condicoes_de_equilibrio(solucionador, d, tau, phi, distancia_g):
+    """
+    Monta condições de carregamento cujo equilíbrio é conhecido: G fica na
+    vertical do centro de carena do estado (d, τ, φ), `distancia_g` abaixo dele.
+    """
+    volume, bx, by, bz = solucionador._propriedades_carena(d, tau, phi)
+    vertical = np.stack([-tau, -np.sin(phi), np.cos(phi)], axis=1)
+    vertical /= np.linalg.norm(vertical, axis=1)[:, None]
+    g = np.stack([bx, by, bz], axis=1) - distancia_g[:, None] * vertical
+    return np.stack([volume * DENSIDADE, g[:, 0], g[:, 1], g[:, 2]], axis=1)
+
+
+def test_equilibrio_com_banda_conhecido(solucionador):
+    # Bandas de 3° a 25°: as maiores já passam da imersão da borda do convés
+    d = np.array([3.0, 2.5, 3.1, 2.0, 3.3])
+    tau = np.array([0.005, -0.01, 0.0, 0.02, -0.004])
+    phi = np.radians([8.0, -12.0, 3.0, 25.0, 18.0])
+    casos = _condicoes_de_equilibrio(solucionador, d, tau, phi, np.array([0.4, 0.6, 0.3, 0.8, 0.5]))
+
+    resultado = solucionador.resolver(casos)
+
+    assert resultado['Convergiu'].all()
+    np.testing.assert_allclose(resultado['Calado Ref. (m)'], d, atol=1e-4)
+    np.testing.assert_allclose(resultado['Trim (m)'], tau * (solucionador.x_vante - solucionador.x_re), atol=1e-3)
+    np.testing.assert_allclose(resultado['Banda (°)'], np.degrees(phi), atol=1e-3)
+
+
+def test_sem_equilibrio_retorna_estado_fisico(solucionador):
+    # GMt ≈ 0,7 m mas o braço de endireitamento máximo (≈ 0,1 m, perto de 15°)
+    # é menor que o braço de banda: a embarcação emborca e não há equilíbrio
+    tabela = solucionador.tabela
+    linha = tabela.iloc[int(np.argmin(np.abs(tabela['Desloc. (t)'] - 222.0)))]
+    casos = [[222.0, linha['LCB (m)'], tcg, linha['VCB (m)'] + 0.5] for tcg in (0.2, 0.3)]
+
+    resultado = solucionador.resolver(casos)
+
+    assert not resultado['Convergiu'].any()
+    z = solucionador.casco.compacto.z
+    assert resultado['Calado Ref. (m)'].between(z.min(), z.max()).all()
+    assert (resultado['Banda (°)'].abs() < 90.0).all()
+    assert (resultado['Trim (m)'].abs() <= z.max() - z.min()).all()
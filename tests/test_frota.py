@@ -0,0 +1,64 @@
+# tests/test_frota.py
+
+import json
+import os
+import shutil
+from src.core.frota import ProgressoFrota, calcular_frota
+from conftest import ARQUIVO_COTAS
+
+
+def _embarcacoes(pasta) -> list:
+    embarcacoes = []
+    for vessel_id in (1, 2, 3):
+        caminho = str(pasta / f'cotas_{vessel_id}.csv')
+        shutil.copy(ARQUIVO_COTAS, caminho)
+        embarcacoes.append({'vessel_id': vessel_id, 'nome': f'V{vessel_id}', 'caminho_cotas': caminho,
+                            'calados': [0.5, 1.5, 2.5]})
+    return embarcacoes
+
+
+def _calcular(embarcacoes, caminho_progresso, falhas: list, densidade: float = 1.025) -> dict:
+    return calcular_frota(embarcacoes, densidade, 'linear', 'vetorizado', caminho_progresso, max_workers=1,
+                          ao_falhar=lambda embarcacao, mensagem: falhas.append(embarcacao['vessel_id']))
+
+
+def test_falha_de_uma_embarcacao_nao_interrompe_e_e_refeita(tmp_path):
+    embarcacoes = _embarcacoes(tmp_path)
+    caminho_progresso = str(tmp_path / 'progresso.json')
+    with open(embarcacoes[1]['caminho_cotas'], 'w') as arquivo:
+        arquivo.write('0,1,2\n')
+    falhas = []
+
+    resumo = _calcular(embarcacoes, caminho_progresso, falhas)
+
+    assert (resumo['calculadas'], resumo['falhas'], resumo['calados']) == (2, 1, 6)
+    assert falhas == [2]
+    with open(caminho_progresso, encoding='utf-8') as arquivo:
+        progresso = json.load(arquivo)
+    assert sorted(progresso['concluidas']) == ['1', '3']
+    assert list(progresso['falhas']) == ['2'] and 'ErroIngestao' in progresso['falhas']['2']['erro']
+
+    # Corrigido o arquivo, só a embarcação que falhou é calculada de novo
+    shutil.copy(ARQUIVO_COTAS, embarcacoes[1]['caminho_cotas'])
+    resumo = _calcular(embarcacoes, caminho_progresso, falhas)
+    assert (resumo['calculadas'], resumo['puladas'], resumo['falhas']) == (1, 2, 0)
+    assert falhas == [2]
+    progresso = ProgressoFrota(caminho_progresso, progresso['parametros'])
+    assert progresso.falhas == {} and sorted(progresso.concluidas) == ['1', '2', '3']
+
+
+def test_progresso_depende_do_arquivo_e_dos_parametros(tmp_path):
+    embarcacoes = _embarcacoes(tmp_path)
+    caminho_progresso = str(tmp_path / 'progresso.json')
+    assert _calcular(embarcacoes, caminho_progresso, [])['calculadas'] == 3
+
+    # Um arquivo de cotas modificado é recalculado
+    caminho = embarcacoes[0]['caminho_cotas']
+    estado = os.stat(caminho)
+    os.utime(caminho, ns=(estado.st_atime_ns, estado.st_mtime_ns + 1_000_000_000))
+    resumo = _calcular(embarcacoes, caminho_progresso, [])
+    assert (resumo['calculadas'], resumo['puladas']) == (1, 2)
+
+    # Com outros parâmetros, o progresso anterior é descartado
+    resumo = _calcular(embarcacoes, caminho_progresso, [], densidade=1.0)
+    assert (resumo['calculadas'], resumo['puladas']) == (3, 0)
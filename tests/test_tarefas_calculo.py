@@ -0,0 +1,53 @@
+# tests/test_tarefas_calculo.py
+
+import threading
+import time
+import pytest
+from src.core.tarefas_calculo import GerenciadorTarefas, LimiteDeTarefasExcedido
+
+
+def _esperar(tarefa, limite_s: float = 5.0):
+    fim = time.time() + limite_s
+    while tarefa.ativa and time.time() < fim:
+        time.sleep(0.01)
+    assert not tarefa.ativa
+
+
+def test_limite_de_tarefas_por_usuario():
+    gerenciador = GerenciadorTarefas(max_simultaneas=1, max_por_usuario=2)
+    liberar = threading.Event()
+
+    def bloqueada(progresso):
+        liberar.wait(5)
+        progresso(1, 1, [{'Calado (m)': 1.0}])
+        return {'chave': 'abc'}
+
+    # Uma em execução e outra na fila: as duas contam para o limite
+    tarefas = [gerenciador.submeter(1, bloqueada) for _ in range(2)]
+    with pytest.raises(LimiteDeTarefasExcedido):
+        gerenciador.submeter(1, bloqueada)
+    # O limite é por usuário
+    outra = gerenciador.submeter(2, lambda progresso: None)
+
+    liberar.set()
+    for tarefa in tarefas + [outra]:
+        _esperar(tarefa)
+    assert [t.obter_resultado() for t in tarefas] == [{'chave': 'abc'}] * 2
+    assert tarefas[0].linhas_desde(0) == [{'Calado (m)': 1.0}]
+    assert gerenciador.obter(tarefas[0].id, 2) is None
+
+    # Finalizadas, deixam de contar
+    _esperar(gerenciador.submeter(1, lambda progresso: None))
+
+
+def test_tarefa_com_erro_nao_tem_resultado():
+    gerenciador = GerenciadorTarefas()
+
+    def falha(progresso):
+        raise ValueError('calado inválido')
+
+    tarefa = gerenciador.submeter(1, falha)
+    _esperar(tarefa)
+    assert tarefa.para_dict()['estado'] == 'erro'
+    assert tarefa.para_dict()['erro'] == 'calado inválido'
+    assert tarefa.obter_resultado() is None